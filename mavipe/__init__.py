@@ -0,0 +1 @@
+# mavipe — código compartilhado entre o app.py (Streamlit) e as ferramentas de linha de comando
@@ -0,0 +1,380 @@
+# mavipe/articles.py — ingestão dos artigos da newsroom (um arquivo-fonte por artigo)
+#
+# Cada artigo é articles/<slug>.md ou articles/<slug>.html com um cabeçalho simples:
+#   ---
+#   title: Título do artigo
+#   date: 2025-08-26
+#   image: news1.png        (opcional; senão a 1ª <img> do corpo)
+#   summary: ...            (opcional; senão o 1º parágrafo)
+#   link: https://...       (opcional)
+#   ---
+# A ingestão converte Markdown (pacote `markdown` se instalado, senão um subconjunto embutido),
+# sanitiza o HTML por lista de permissões, extrai resumo, tempo de leitura e imagem de capa e grava
+# um artefato compacto por slug em .cache/articles/<slug>.json. Só reprocessa fontes cujo hash
+# mudou; abrir um artigo é uma leitura desse único arquivo.
+# Uso: python -m mavipe.articles [--force]
+import html
+import json
+import math
+import os
+import re
+import sys
+import threading
+from html.parser import HTMLParser
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX, ARTICLES_DIR, asset_key
+from mavipe.static_assets import file_sha256
+
+try:
+    import markdown as markdown_lib
+except ImportError:  # sem o pacote: conversor embutido (títulos, listas, ênfase, links, imagens)
+    markdown_lib = None
+
+ARTIFACTS_DIR = Path(os.environ.get("MAVIPE_ARTICLE_ARTIFACTS", ".cache/articles"))
+MANIFEST_PATH = ARTIFACTS_DIR / "index.json"
+# muda quando a conversão/sanitização muda: força o reprocessamento de tudo
+PIPELINE_VERSION = 1
+SOURCE_EXTS = (".md", ".markdown", ".html", ".htm")
+WORDS_PER_MINUTE = 200
+SUMMARY_MAX_CHARS = 280
+META_FIELDS = ("title", "date", "summary", "link", "image")
+
+_lock = threading.Lock()
+
+# ================== FRONT MATTER ==================
+def split_front_matter(text: str) -> tuple[dict, str]:
+    text = text.lstrip("\ufeff")
+    if not text.startswith("---"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end < 0:
+        return {}, text
+    meta = {}
+    for line in text[3:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip():
+            meta[key.strip().lower()] = value.strip()
+    return meta, text[end + 4:].lstrip("\n")
+
+# ================== MARKDOWN ==================
+_INLINE = (
+    (re.compile(r"!\[([^\]]*)\]\(([^)\s]+)\)"), r'<img src="\2" alt="\1"/>'),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])"), r"<em>\1</em>"),
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+)
+
+def _inline(text: str) -> str:
+    for pattern, repl in _INLINE:
+        text = pattern.sub(repl, text)
+    return text
+
+def simple_markdown(text: str) -> str:
+    """Subconjunto de Markdown: #..####, parágrafos, listas -/*/1., citações e ênfase/links."""
+    out: list[str] = []
+    para: list[str] = []
+    list_tag: str | None = None
+
+    def flush_para():
+        if para:
+            out.append(f"<p>{_inline(' '.join(para))}</p>")
+            para.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        heading = re.match(r"(#{1,4})\s+(.*)", line)
+        item = re.match(r"(?:[-*]|(\d+)\.)\s+(.*)", line)
+        if not line:
+            flush_para()
+            close_list()
+        elif heading:
+            flush_para()
+            close_list()
+            level = max(2, len(heading.group(1)))  # o <h2> do título da página vem do template
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif item:
+            flush_para()
+            tag = "ol" if item.group(1) else "ul"
+            if list_tag != tag:
+                close_list()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(item.group(2))}</li>")
+        elif line.startswith(">"):
+            flush_para()
+            close_list()
+            out.append(f"<blockquote><p>{_inline(line.lstrip('> '))}</p></blockquote>")
+        else:
+            close_list()
+            para.append(line)
+    flush_para()
+    close_list()
+    return "\n".join(out)
+
+def markdown_to_html(text: str) -> str:
+    if markdown_lib is not None:
+        return markdown_lib.markdown(text, extensions=["extra"])
+    return simple_markdown(text)
+
+# ================== SANITIZAÇÃO ==================
+ALLOWED_TAGS = {
+    "p", "br", "hr", "h2", "h3", "h4", "strong", "b", "em", "i", "u", "s", "sub", "sup", "span",
+    "a", "ul", "ol", "li", "blockquote", "code", "pre", "img", "figure", "figcaption",
+    "table", "thead", "tbody", "tr", "th", "td",
+}
+ALLOWED_ATTRS = {
+    "a": {"href", "title"},
+    "img": {"src", "alt", "width", "height", "title"},
+    "th": {"colspan", "rowspan"},
+    "td": {"colspan", "rowspan"},
+}
+URL_ATTRS = {"href", "src"}
+RENAMED_TAGS = {"h1": "h2", "h5": "h4", "h6": "h4"}
+VOID_TAGS = {"br", "hr", "img"}
+# descartadas com todo o conteúdo
+DROP_TAGS = {"script", "style", "iframe", "object", "embed", "noscript", "template", "svg", "math", "form"}
+SAFE_SCHEMES = ("http:", "https:", "mailto:", "tel:")
+
+def safe_url(url: str) -> bool:
+    u = re.sub(r"[\x00-\x20]", "", url).lower()
+    return ":" not in u.split("/", 1)[0] or u.startswith(SAFE_SCHEMES)
+
+class Sanitizer(HTMLParser):
+    """Reescreve o HTML só com tags/atributos permitidos, fechando o que ficou aberto."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: list[str] = []
+        self.stack: list[str] = []
+        self.dropping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_TAGS:
+            self.dropping += 1
+            return
+        tag = RENAMED_TAGS.get(tag, tag)
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        kept = []
+        for name, value in attrs:
+            if name not in ALLOWED_ATTRS.get(tag, ()) or value is None:
+                continue
+            if name in URL_ATTRS and not safe_url(value):
+                continue
+            kept.append(f' {name}="{html.escape(value, quote=True)}"')
+        if tag == "a" and re.match(r"https?:", dict(attrs).get("href") or ""):
+            kept.append(' rel="noopener noreferrer" target="_blank"')
+        if tag == "img":
+            kept.append(' loading="lazy" decoding="async"')
+        self.out.append(f"<{tag}{''.join(kept)}>")
+        if tag not in VOID_TAGS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in DROP_TAGS:  # <script/>: nada a descartar depois
+            return
+        self.handle_starttag(tag, attrs)
+        tag = RENAMED_TAGS.get(tag, tag)
+        if tag not in VOID_TAGS and tag not in DROP_TAGS and self.stack and self.stack[-1] == tag:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_TAGS:
+            self.dropping = max(0, self.dropping - 1)
+            return
+        tag = RENAMED_TAGS.get(tag, tag)
+        if self.dropping or tag not in self.stack:
+            return
+        while self.stack:
+            open_tag = self.stack.pop()
+            self.out.append(f"</{open_tag}>")
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.dropping:
+            self.out.append(html.escape(data, quote=False))
+
+    def result(self) -> str:
+        self.close()
+        self.out.extend(f"</{t}>" for t in reversed(self.stack))
+        self.stack = []
+        return "".join(self.out).strip()
+
+def sanitize_html(fragment: str) -> str:
+    s = Sanitizer()
+    s.feed(fragment)
+    return s.result()
+
+# ================== EXTRAÇÃO ==================
+class TextExtractor(HTMLParser):
+    """Texto corrido, 1º parágrafo e 1ª imagem de um HTML já sanitizado."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks: list[str] = []
+        self.paragraphs: list[str] = []
+        self._para: list[str] | None = None
+        self.first_img: str | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "p":
+            self._para = []
+        elif tag == "img" and self.first_img is None:
+            self.first_img = dict(attrs).get("src")
+
+    def handle_endtag(self, tag):
+        if tag == "p" and self._para is not None:
+            text = " ".join("".join(self._para).split())
+            if text:
+                self.paragraphs.append(text)
+            self._para = None
+
+    def handle_data(self, data):
+        self.chunks.append(data)
+        if self._para is not None:
+            self._para.append(data)
+
+    @property
+    def text(self) -> str:
+        return " ".join(" ".join(self.chunks).split())
+
+def truncate(text: str, limit: int = SUMMARY_MAX_CHARS) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(",;:.") + "…"
+
+def reading_minutes(text: str) -> int:
+    return max(1, math.ceil(len(text.split()) / WORDS_PER_MINUTE))
+
+def pick_summary(ex: TextExtractor, title: str) -> str:
+    # o 1º parágrafo costuma ser só a data em negrito; pula parágrafos curtos demais
+    for p in ex.paragraphs:
+        if len(p.split()) >= 8 and p != title:
+            return truncate(p)
+    return truncate(ex.text)
+
+# ================== COMPILAÇÃO ==================
+def compile_article(path: Path) -> dict:
+    """Fonte -> artefato (metadados + HTML sanitizado)."""
+    meta, body = split_front_matter(path.read_text(encoding="utf-8"))
+    raw = markdown_to_html(body) if path.suffix.lower() in (".md", ".markdown") else body
+    clean = sanitize_html(raw)
+    ex = TextExtractor()
+    ex.feed(clean)
+    ex.close()
+    title = meta.get("title") or path.stem.replace("-", " ").capitalize()
+    image = meta.get("image") or ex.first_img
+    image = asset_key(image) if image and ":" not in image else None  # só assets locais viram capa
+    return {
+        "slug": path.stem,
+        "title": title,
+        "date": meta.get("date", ""),
+        "summary": meta.get("summary") or pick_summary(ex, title),
+        "link": meta.get("link", ""),
+        "image": image,
+        "reading_min": reading_minutes(ex.text),
+        "html": clean,
+    }
+
+def artifact_path(slug: str) -> Path:
+    return ARTIFACTS_DIR / f"{slug}.json"
+
+def _write_json(path: Path, data: dict, **dump_kw) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, **dump_kw), encoding="utf-8")
+    os.replace(tmp, path)
+
+def read_artifact(slug: str) -> dict | None:
+    try:
+        return json.loads(artifact_path(slug).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def read_manifest() -> dict:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        if data.get("version") == PIPELINE_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": PIPELINE_VERSION, "entries": {}}
+
+def source_files() -> dict[str, str]:
+    """slug -> caminho da fonte (do snapshot do ASSET_INDEX; .md ganha de .html no mesmo slug)."""
+    found: dict[str, str] = {}
+    for ext in SOURCE_EXTS:
+        for name in ASSET_INDEX.glob(f"{asset_key(ARTICLES_DIR)}/*{ext}"):
+            found.setdefault(Path(name).stem, name)
+    return found
+
+def sources_signature() -> str:
+    parts = [str(PIPELINE_VERSION)]
+    for slug, name in sorted(source_files().items()):
+        st = ASSET_INDEX.stat(name)
+        parts.append(f"{name}:{st.size}:{st.mtime_ns}" if st else name)
+    return "|".join(parts)
+
+def ingest(force: bool = False) -> tuple[dict, list[str]]:
+    """Reprocessa só as fontes novas/alteradas; devolve (manifesto, slugs reprocessados)."""
+    with _lock:
+        manifest = {"version": PIPELINE_VERSION, "entries": {}} if force else read_manifest()
+        entries = manifest["entries"]
+        sources = source_files()
+        changed: list[str] = []
+        dirty = False
+        for slug, name in sorted(sources.items()):
+            st = ASSET_INDEX.stat(name)
+            if st is None:
+                continue
+            entry = entries.get(slug)
+            if (
+                entry is not None and entry["source"] == name
+                and entry["size"] == st.size and entry["mtime_ns"] == st.mtime_ns
+                and artifact_path(slug).exists()
+            ):
+                continue
+            digest = file_sha256(Path(name))
+            if entry is not None and entry["source"] == name and entry["sha256"] == digest and artifact_path(slug).exists():
+                # só o mtime mudou (checkout, touch): atualiza a chave sem recompilar
+                entry.update({"size": st.size, "mtime_ns": st.mtime_ns})
+                dirty = True
+                continue
+            art = compile_article(Path(name))
+            _write_json(artifact_path(slug), art, separators=(",", ":"))
+            entries[slug] = {
+                "source": name, "sha256": digest, "size": st.size, "mtime_ns": st.mtime_ns,
+                **{k: art[k] for k in (*META_FIELDS, "reading_min")},
+            }
+            changed.append(slug)
+            dirty = True
+        for slug in [s for s in entries if s not in sources]:
+            del entries[slug]
+            artifact_path(slug).unlink(missing_ok=True)
+            dirty = True
+        if dirty or not MANIFEST_PATH.exists():
+            _write_json(MANIFEST_PATH, manifest, indent=2, sort_keys=True)
+        return manifest, changed
+
+# ================== CLI ==================
+def main(argv: list[str]) -> int:
+    force = "--force" in argv
+    ASSET_INDEX.refresh(force=True)
+    manifest, changed = ingest(force=force)
+    for slug, e in sorted(manifest["entries"].items(), key=lambda kv: kv[1]["date"], reverse=True):
+        mark = "compilado" if slug in changed else "em dia"
+        print(f"  {mark:10} {e['source']} ({e['date']}, {e['reading_min']} min, capa: {e['image'] or '-'})")
+    print(f"{len(changed)} de {len(manifest['entries'])} artigo(s) reprocessado(s) em {ARTIFACTS_DIR}/")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
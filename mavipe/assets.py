@@ -0,0 +1,337 @@
+# mavipe/assets.py — assets da landing (MIME, data URIs com cache por processo)
+import base64
+import fnmatch
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from mavipe.shared_cache import SHARED_CACHE
+
+# Limite do cache de data URIs (bytes da string codificada); 0 desliga o cache
+DATA_URI_CACHE_MAX_BYTES = int(os.environ.get("MAVIPE_DATA_URI_CACHE_BYTES", 64 * 1024 * 1024))
+
+# Diretórios varridos pelo índice de assets e intervalo mínimo entre checagens de mtime
+# (as fontes dos artigos entram no mesmo snapshot: a newsroom só sonda o disco quando algo muda)
+ARTICLES_DIR = os.environ.get("MAVIPE_ARTICLES_DIR", "articles")
+ASSET_DIRS = (".", "icons", ARTICLES_DIR)
+ASSET_INDEX_TTL_SEC = float(os.environ.get("MAVIPE_ASSET_INDEX_TTL", "2"))
+
+class IoCounters(threading.local):
+    """Contadores por thread (cada sessão roda o script na sua thread), lidos pelo profiler."""
+
+    def __init__(self):
+        self.data_uri_calls = 0
+        self.data_uri_bytes = 0
+        self.fs_probes = 0
+
+IO_COUNTERS = IoCounters()
+
+def guess_mime(path: Path) -> str:
+    ext = path.suffix.lower()
+    if ext == ".png": return "image/png"
+    if ext in (".jpg", ".jpeg"): return "image/jpeg"
+    if ext == ".svg": return "image/svg+xml"
+    if ext == ".webp": return "image/webp"
+    if ext == ".avif": return "image/avif"
+    return "application/octet-stream"
+
+def data_uri_from_bytes(data: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+def encode_data_uri(p: Path) -> str:
+    IO_COUNTERS.fs_probes += 1
+    return data_uri_from_bytes(p.read_bytes(), guess_mime(p))
+
+def asset_key(path_str: str | Path) -> str:
+    return Path(path_str).as_posix().removeprefix("./")
+
+class AssetStat(NamedTuple):
+    size: int
+    mtime_ns: int
+
+class AssetIndex:
+    """Snapshot (uma varredura por diretório) dos arquivos da landing.
+
+    Revarrido quando o mtime de algum diretório muda (arquivo criado, removido ou renomeado);
+    senão, os arquivos do snapshot são re-stat-ados (sobrescrever um arquivo no lugar não muda
+    o mtime do diretório). As checagens acontecem no máximo a cada `ttl` segundos, então as
+    consultas em tempo de render são apenas acessos a dicionário.
+    """
+
+    def __init__(self, dirs: tuple[str, ...] = ASSET_DIRS, ttl: float = ASSET_INDEX_TTL_SEC):
+        self.dirs = dirs
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._files: dict[str, AssetStat] = {}
+        self._names: list[str] = []
+        self._dir_mtimes: dict[str, int | None] = {}
+        self._resolved: dict = {}
+        self._checked_at = float("-inf")
+        self.generation = 0
+        self.scans = 0
+
+    def _read_dir_mtimes(self) -> dict[str, int | None]:
+        mtimes = {}
+        for d in self.dirs:
+            IO_COUNTERS.fs_probes += 1
+            try:
+                mtimes[d] = os.stat(d).st_mtime_ns
+            except OSError:
+                mtimes[d] = None
+        return mtimes
+
+    def _scan(self, mtimes: dict[str, int | None]) -> None:
+        files = {}
+        for d in self.dirs:
+            if mtimes[d] is None:
+                continue
+            IO_COUNTERS.fs_probes += 1
+            with os.scandir(d) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    IO_COUNTERS.fs_probes += 1
+                    st = entry.stat()
+                    files[asset_key(os.path.join(d, entry.name))] = AssetStat(st.st_size, st.st_mtime_ns)
+        self._dir_mtimes = mtimes
+        self._replace(files)
+        self.scans += 1
+
+    def _restat(self) -> None:
+        """Mesmos diretórios: só confere tamanho/mtime de cada arquivo já conhecido."""
+        files = {}
+        for key in self._files:
+            IO_COUNTERS.fs_probes += 1
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            files[key] = AssetStat(st.st_size, st.st_mtime_ns)
+        if files != self._files:
+            self._replace(files)
+
+    def _replace(self, files: dict[str, AssetStat]) -> None:
+        self._files = files
+        self._names = sorted(files)
+        self._resolved = {}
+        self.generation += 1
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.ttl:
+            return
+        with self._lock:
+            if not force and now - self._checked_at < self.ttl:
+                return  # outra thread varreu enquanto esperávamos a trava
+            mtimes = self._read_dir_mtimes()
+            if force or mtimes != self._dir_mtimes:
+                self._scan(mtimes)
+            else:
+                self._restat()
+            # só depois da varredura: quem chega durante ela espera a trava em vez de ler o
+            # snapshot antigo (ex.: o 1º rerun enquanto o aquecimento faz refresh(force=True))
+            self._checked_at = now
+
+    def stat(self, path_str: str | Path) -> AssetStat | None:
+        """Tamanho/mtime do snapshot; caminhos fora dos diretórios indexados vão ao disco."""
+        key = asset_key(path_str)
+        if os.path.dirname(key) in ("", *self.dirs):
+            self.refresh()
+            return self._files.get(key)
+        IO_COUNTERS.fs_probes += 1
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        return AssetStat(st.st_size, st.st_mtime_ns)
+
+    def snapshot(self) -> dict[str, AssetStat]:
+        self.refresh()
+        return dict(self._files)
+
+    def has(self, path_str: str | Path) -> bool:
+        st = self.stat(path_str)
+        return st is not None and st.size > 0
+
+    def find_first(self, candidates) -> str | None:
+        for name in candidates:
+            if self.has(name):
+                return asset_key(name)
+        return None
+
+    def glob(self, pattern: str) -> list[str]:
+        self.refresh()
+        parent = os.path.dirname(pattern)
+        return [
+            n for n in self._names
+            if os.path.dirname(n) == parent and fnmatch.fnmatchcase(n, pattern) and self._files[n].size > 0
+        ]
+
+    def resolve(self, key, fn: Callable):
+        """Memoiza `fn()` (um asset lógico: logo, quadros, ícones...) até o próximo rescan."""
+        self.refresh()
+        generation = self.generation
+        if key in self._resolved:
+            return self._resolved[key]
+        value = fn()
+        if self.generation == generation:
+            self._resolved[key] = value
+        return value
+
+ASSET_INDEX = AssetIndex()
+
+class DataUriCache:
+    """LRU de data URIs compartilhado pelo processo, chaveado em (caminho, mtime_ns, tamanho).
+
+    Com o cache em disco (mavipe/shared_cache.py) ligado, uma falta lê o blob que outra réplica
+    já codificou em vez de reler e recodificar a imagem; a string decodificada fica aqui,
+    indexada também pelo digest do blob (endereçado pelo conteúdo, nunca muda), e os acertos
+    não tocam mais o disco nem copiam nada. `bytes` conta cada string uma vez.
+    """
+
+    def __init__(self, max_bytes: int = DATA_URI_CACHE_MAX_BYTES, shared=SHARED_CACHE):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: OrderedDict[tuple, tuple[str | None, str]] = OrderedDict()  # -> (blob, uri)
+        self._key_by_path: dict[str, tuple] = {}
+        self._by_blob: dict[str, str] = {}  # digest do blob -> uri (mesmo objeto nas entradas)
+        self._blob_refs: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.encoded_bytes = 0
+        self.blob_reads = 0
+
+    def _decoded(self, digest: str) -> str | None:
+        """String do blob: a já decodificada neste processo ou uma leitura do disco."""
+        with self._lock:
+            text = self._by_blob.get(digest)
+        if text is not None:
+            return text
+        data = self.shared.read(digest)
+        if data is None:
+            return None
+        with self._lock:
+            self.blob_reads += 1
+        return data.decode("ascii")
+
+    def _load(self, p: Path, path_key: str, stat: "AssetStat") -> tuple[str | None, str]:
+        """Miss em memória: (digest do blob ou None, data URI) do cache em disco, ou lê +
+        codifica (e publica no disco)."""
+        if not self.shared.enabled:
+            uri = encode_data_uri(p)
+            with self._lock:
+                self.encoded_bytes += len(uri)
+            return None, uri
+        shared_key = f"{path_key}|{stat.size}|{stat.mtime_ns}|datauri"
+        digest = self.shared.lookup(shared_key)
+        text = self._decoded(digest) if digest else None
+        if text is not None:
+            return digest, text
+        IO_COUNTERS.fs_probes += 1
+        data = p.read_bytes()
+        mime = guess_mime(p)
+        encoded: list[str] = []
+
+        def produce() -> bytes:
+            encoded.append(data_uri_from_bytes(data, mime))
+            return encoded[0].encode("ascii")
+
+        digest = self.shared.store(shared_key, hashlib.sha256(data).hexdigest(), f"datauri:{mime}", produce)
+        if encoded:
+            with self._lock:
+                self.encoded_bytes += len(encoded[0])
+            return digest, encoded[0]
+        text = self._decoded(digest) if digest else None
+        if text is not None:
+            return digest, text
+        return None, data_uri_from_bytes(data, mime)
+
+    def get(self, path_str: str | Path) -> str:
+        p = Path(path_str)
+        stat = ASSET_INDEX.stat(p)
+        if stat is None:
+            raise FileNotFoundError(path_str)
+        path_key = asset_key(p)
+        key = (path_key, stat.mtime_ns, stat.size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        digest, text = self._load(p, path_key, stat)
+        with self._lock:
+            # arquivo alterado em disco: descarta a versão anterior
+            old_key = self._key_by_path.get(path_key)
+            if old_key is not None and old_key != key:
+                self._drop(old_key)
+            if key not in self._entries and len(text) <= self.max_bytes:
+                if digest is None:
+                    self.bytes += len(text)
+                else:
+                    if digest not in self._by_blob:
+                        self._by_blob[digest] = text
+                        self.bytes += len(text)
+                    text = self._by_blob[digest]
+                    self._blob_refs[digest] = self._blob_refs.get(digest, 0) + 1
+                self._entries[key] = (digest, text)
+                self._key_by_path[path_key] = key
+                while self.bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        return text
+
+    def _drop(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        digest, text = entry
+        if digest is None:
+            self.bytes -= len(text)
+        else:
+            self._blob_refs[digest] -= 1
+            if not self._blob_refs[digest]:
+                del self._blob_refs[digest], self._by_blob[digest]
+                self.bytes -= len(text)
+        if self._key_by_path.get(key[0]) == key:
+            del self._key_by_path[key[0]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_by_path.clear()
+            self._by_blob.clear()
+            self._blob_refs.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "encoded_bytes": self.encoded_bytes,
+                "blob_reads": self.blob_reads,
+            }
+
+DATA_URI_CACHE = DataUriCache()
+
+def as_data_uri(path_str: str | Path) -> str:
+    uri = DATA_URI_CACHE.get(path_str)
+    IO_COUNTERS.data_uri_calls += 1
+    IO_COUNTERS.data_uri_bytes += len(uri)
+    return uri
@@ -0,0 +1,238 @@
+# mavipe/bench.py — benchmark headless do app.py com o AppTest do Streamlit
+#
+# Cenários: cold (processo novo a cada amostra), warm (rerun sem mudança), emp_nav (troca do
+# quadro do carrossel via ?thumb), thumb (?thumb=1), news (?news=<slug>) e contact (envio do
+# formulário; digitar num st.form não gera rerun). Mede tempo de script (percentis), pico de memória (tracemalloc, num rerun extra
+# para não distorcer os tempos) e payload (bytes dos protos enviados ao navegador; arquivos de
+# mídia servidos à parte não entram).
+# Uso: python -m mavipe.bench [--runs 15] [--save] [--baseline .cache/bench/baseline.json]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+BASELINE_PATH = Path(os.environ.get("MAVIPE_BENCH_BASELINE", ".cache/bench/baseline.json"))
+DEFAULT_THRESHOLD = 0.20
+# o cenário contact envia o formulário de verdade: fila própria do benchmark e nenhum SMTP
+os.environ.setdefault("MAVIPE_CONTACT_QUEUE", str(BASELINE_PATH.parent / "contact_queue.sqlite3"))
+os.environ["MAVIPE_SMTP_HOST"] = ""
+SCENARIOS = ("cold", "warm", "emp_nav", "thumb", "news", "contact")
+# métricas comparadas com o baseline (maior = pior)
+GATED_METRICS = ("p50_ms", "p95_ms", "peak_kib", "payload_bytes")
+
+# ================== APPTEST ==================
+def new_app(query: dict | None = None):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    for k, v in (query or {}).items():
+        at.query_params[k] = v
+    return at
+
+def _walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from _walk(child)
+
+def payload(at) -> dict:
+    """Bytes dos protos dos elementos renderizados e, à parte, HTML de st.markdown/iframes."""
+    total = markdown = iframe = 0
+    for node in _walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None or not hasattr(proto, "ByteSize"):
+            continue
+        total += proto.ByteSize()
+        kind = type(node).__name__
+        if kind == "Markdown":
+            markdown += len(node.value.encode("utf-8"))
+        elif kind == "UnknownElement" and getattr(proto, "srcdoc", ""):
+            iframe += len(proto.srcdoc.encode("utf-8"))
+    return {"payload_bytes": total, "markdown_bytes": markdown, "iframe_bytes": iframe}
+
+def timed_run(at, action=None) -> float:
+    """ms de um rerun; `action` prepara o rerun (ex.: input num widget)."""
+    t0 = time.perf_counter()
+    (action(at) if action else at).run()
+    ms = (time.perf_counter() - t0) * 1000
+    if at.exception:
+        raise RuntimeError(f"exceção no app: {[e.value for e in at.exception]}")
+    return ms
+
+def traced_run(at, action=None) -> int:
+    """Pico de memória (bytes) de um rerun sob tracemalloc."""
+    tracemalloc.start()
+    try:
+        timed_run(at, action)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def first_slug() -> str:
+    from mavipe.newsroom import NEWSROOM
+
+    items = NEWSROOM.listing()
+    return items[0]["slug"] if items else ""
+
+# ================== CENÁRIOS ==================
+def scenario_steps(name: str):
+    """(query inicial, i -> ação do i-ésimo rerun medido; ação None = rerun puro)."""
+    if name == "warm":
+        return {}, lambda i: None
+    if name == "emp_nav":
+        # ◀/▶ rodam no navegador; no servidor o equivalente é o deep link ?thumb=N
+        def nav(i):
+            def act(at):
+                at.query_params["thumb"] = str(i % 2)
+                return at
+            return act
+        return {}, nav
+    if name == "thumb":
+        return {"thumb": "1"}, lambda i: None
+    if name == "news":
+        return {"news": first_slug()}, lambda i: None
+    if name == "contact":
+        # os campos só chegam ao servidor no envio: cada rerun medido é um envio válido (enfileira)
+        lead = {
+            "contact_nome": "Ana", "contact_email": "ana@example.com", "contact_org": "MAVIPE",
+            "contact_msg": "Monitoramento de metano offshore",
+        }
+
+        def submit(i):
+            def act(at):
+                for key, value in lead.items():
+                    widget = at.text_area(key=key) if key == "contact_msg" else at.text_input(key=key)
+                    widget.set_value(value)
+                return at.button(key="contact_send").click()
+            return act
+        return {}, submit
+    raise ValueError(f"cenário desconhecido: {name}")
+
+def run_in_process(name: str, runs: int) -> dict:
+    query, step = scenario_steps(name)
+    at = new_app(query)
+    at.run()  # aquecimento
+    times = [timed_run(at, step(i)) for i in range(runs)]
+    peak = traced_run(at, step(runs))
+    return {"times_ms": times, "peak_bytes": peak, **payload(at)}
+
+def cold_sample(trace: bool = False) -> dict:
+    """Primeiro run num interpretador novo (python -m mavipe.bench --cold-sample [--trace])."""
+    at = new_app()
+    if trace:
+        return {"times_ms": [], "peak_bytes": traced_run(at), **payload(at)}
+    return {"times_ms": [timed_run(at)], "peak_bytes": 0, **payload(at)}
+
+def _cold_subprocess(*flags: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "mavipe.bench", "--cold-sample", *flags],
+        capture_output=True, text=True, check=True, cwd=APP_PATH.parent,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def run_cold(runs: int) -> dict:
+    times = []
+    for _ in range(runs):
+        times += _cold_subprocess()["times_ms"]
+    traced = _cold_subprocess("--trace")
+    return {**traced, "times_ms": times}
+
+# ================== RELATÓRIO ==================
+def percentile(values: list[float], q: float) -> float:
+    s = sorted(values)
+    if not s:
+        return 0.0
+    k = (len(s) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+def summarize(raw: dict) -> dict:
+    t = raw["times_ms"]
+    return {
+        "runs": len(t),
+        "p50_ms": round(percentile(t, 0.50), 2),
+        "p90_ms": round(percentile(t, 0.90), 2),
+        "p95_ms": round(percentile(t, 0.95), 2),
+        "max_ms": round(max(t), 2),
+        "mean_ms": round(statistics.fmean(t), 2),
+        "peak_kib": round(raw["peak_bytes"] / 1024, 1),
+        "payload_bytes": raw["payload_bytes"],
+        "markdown_bytes": raw["markdown_bytes"],
+        "iframe_bytes": raw["iframe_bytes"],
+    }
+
+def run_suite(scenarios: list[str], runs: int, cold_runs: int) -> dict:
+    results = {}
+    for name in scenarios:
+        raw = run_cold(cold_runs) if name == "cold" else run_in_process(name, runs)
+        results[name] = summarize(raw)
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressões: métrica acima de baseline * (1 + threshold)."""
+    out = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in GATED_METRICS:
+            b, c = base.get(metric), cur.get(metric)
+            if b and c is not None and c > b * (1 + threshold):
+                out.append(f"{name}.{metric}: {c} > {b} (+{(c / b - 1) * 100:.0f}%)")
+    return out
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark headless do app.py (AppTest)")
+    ap.add_argument("--scenario", action="append", choices=SCENARIOS, help="repetível; padrão: todos")
+    ap.add_argument("--runs", type=int, default=15, help="reruns medidos por cenário (padrão: 15)")
+    ap.add_argument("--cold-runs", type=int, default=3, help="processos novos no cenário cold (padrão: 3)")
+    ap.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    ap.add_argument("--save", action="store_true", help="grava os resultados como novo baseline")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="tolerância (padrão: 0.20)")
+    ap.add_argument("--json", type=Path, help="grava os resultados também neste arquivo")
+    ap.add_argument("--cold-sample", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.cold_sample:
+        print(json.dumps(cold_sample(args.trace)))
+        return 0
+
+    os.chdir(APP_PATH.parent)
+    results = run_suite(args.scenario or list(SCENARIOS), args.runs, args.cold_runs)
+    header = f"{'cenário':10} {'runs':>4} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'pico KiB':>9} {'payload':>9} {'markdown':>9}"
+    print(header)
+    for name, r in results.items():
+        print(f"{name:10} {r['runs']:>4} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['max_ms']:>8} "
+              f"{r['peak_kib']:>9} {r['payload_bytes']:>9} {r['markdown_bytes']:>9}")
+
+    record = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0], "results": results}
+    if args.json:
+        write_json(args.json, record)
+    if args.save:
+        write_json(args.baseline, record)
+        print(f"baseline gravado em {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"sem baseline em {args.baseline} (use --save)")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")).get("results", {})
+    regressions = compare(results, baseline, args.threshold)
+    for r in regressions:
+        print(f"  REGRESSÃO {r}")
+    print(f"{len(regressions)} regressão(ões) acima de {args.threshold:.0%} vs {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
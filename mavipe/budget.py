@@ -0,0 +1,381 @@
+# mavipe/budget.py — peso da página renderizada por rota, com orçamento (gate de regressão)
+#
+# Roda o app.py headless (AppTest, como o mavipe/bench.py) na landing, em cada ?news=<slug> e em
+# cada ?zoom=<imagem> e atribui os bytes que o navegador baixa (no zoom, só a carga inicial: os
+# tiles pedidos pelo visualizador conforme o zoom não entram):
+#   - por seção (profiler): HTML de st.markdown/st.iframe + assets referenciados nela;
+#   - por asset (arquivo de origem): cópia estática, variante do srcset escolhida para o viewport,
+#     data URI embutido (inclusive LQIP) ou st.image; URLs repetidas na rota contam uma vez;
+#   - por bloco <style> (já incluído no HTML da seção onde aparece).
+# Lista também as imagens dos diretórios de assets que nenhuma rota referencia.
+# Sai com 1 se alguma rota ou asset passar do orçamento (ROUTE_BUDGETS/ASSET_BUDGETS, ou --config).
+# Uso: python -m mavipe.budget [--viewport 1440] [--dpr 1] [--config budget.json] [--json out.json]
+import argparse
+import base64
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+
+from mavipe.bench import APP_PATH, new_app, write_json
+
+KIB = 1024
+# bytes transferidos por rota ("article"/"zoom" valem para todo ?news=/?zoom= sem entrada própria)
+ROUTE_BUDGETS = {"landing": 256 * KIB, "article": 160 * KIB, "zoom": 96 * KIB}
+# bytes transferidos por asset numa rota; a 1ª glob que casar com o arquivo de origem vale
+ASSET_BUDGETS = {"icons/*": 16 * KIB, "*": 128 * KIB}
+STYLE_BUDGET = 8 * KIB  # por bloco <style> inline
+DEFAULT_VIEWPORT = 1440
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".svg", ".webp", ".gif", ".avif", ".mp4", ".webm")
+
+URL_RE = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""")
+MEDIA_RE = re.compile(r"\((max|min)-width:\s*(\d+)px\)")
+LENGTH_RE = re.compile(r"([\d.]+)(px|vw)$")
+FETCH_RELS = ("stylesheet", "preload", "icon")
+
+# ================== HTML -> REFERÊNCIAS ==================
+class RefParser(HTMLParser):
+    """URLs que o navegador busca (img/srcset, <picture>, CSS, url() em style) e blocos <style>."""
+
+    def __init__(self, viewport: int, dpr: float):
+        super().__init__(convert_charrefs=True)
+        self.viewport = viewport
+        self.dpr = dpr
+        self.urls: list[tuple[str, str]] = []  # (tipo da referência, url)
+        self.styles: list[str] = []
+        self.frames: list[str] = []  # srcdoc de iframes (documentos aninhados)
+        self._style: list[str] | None = None
+        self._picture = False
+        self._picked = False
+
+    def _css_urls(self, css: str) -> None:
+        for url in URL_RE.findall(css):
+            self.urls.append(("css", url.strip()))
+
+    def handle_starttag(self, tag, attrs):
+        a = {k: v or "" for k, v in attrs}
+        if a.get("style"):
+            self._css_urls(a["style"])
+        if tag == "picture":
+            self._picture, self._picked = True, False
+        elif tag == "source" and self._picture:
+            if a.get("srcset") and not self._picked:  # o navegador fica com o 1º <source> suportado
+                self.urls.append(("srcset", pick_srcset(a["srcset"], a.get("sizes"), self.viewport, self.dpr)))
+                self._picked = True
+        elif tag == "img":
+            if self._picture and self._picked:
+                return
+            if a.get("srcset"):
+                self.urls.append(("srcset", pick_srcset(a["srcset"], a.get("sizes"), self.viewport, self.dpr)))
+            elif a.get("src"):
+                self.urls.append(("img", a["src"]))
+        elif tag == "link" and any(r in a.get("rel", "").split() for r in FETCH_RELS) and a.get("href"):
+            self.urls.append(("link", a["href"]))
+        elif tag in ("video", "audio", "iframe", "script", "embed"):
+            if tag == "iframe" and a.get("srcdoc"):
+                self.frames.append(a["srcdoc"])
+            for attr in ("src", "poster"):
+                if a.get(attr):
+                    self.urls.append((tag, a[attr]))
+        elif tag == "style":
+            self._style = []
+
+    def handle_endtag(self, tag):
+        if tag == "picture":
+            self._picture = False
+        elif tag == "style" and self._style is not None:
+            css = "".join(self._style)
+            self.styles.append(css)
+            self._css_urls(css)
+            self._style = None
+
+    def handle_data(self, data):
+        if self._style is not None:
+            self._style.append(data)
+
+def slot_width(sizes: str | None, viewport: int) -> float:
+    """Largura (px CSS) do `sizes` no viewport; só entende (max|min)-width e px/vw."""
+    for entry in (sizes or "100vw").split(","):
+        entry = entry.strip()
+        cond = MEDIA_RE.search(entry)
+        length = entry[cond.end():].strip() if cond else entry
+        if cond:
+            bound = int(cond.group(2))
+            if (cond.group(1) == "max" and viewport > bound) or (cond.group(1) == "min" and viewport < bound):
+                continue
+        m = LENGTH_RE.match(length)
+        if m:
+            value = float(m.group(1))
+            return value if m.group(2) == "px" else viewport * value / 100
+    return float(viewport)
+
+def pick_srcset(srcset: str, sizes: str | None, viewport: int, dpr: float) -> str:
+    """Candidato que o navegador baixaria: o menor com largura >= slot * dpr (ou o maior)."""
+    candidates = []
+    for part in srcset.split(","):
+        bits = part.strip().split()
+        if not bits:
+            continue
+        w = int(bits[1][:-1]) if len(bits) > 1 and bits[1].endswith("w") else 0
+        candidates.append((w, bits[0]))
+    if not candidates:
+        return ""
+    need = slot_width(sizes, viewport) * dpr
+    candidates.sort()
+    return next((url for w, url in candidates if w >= need), candidates[-1][1])
+
+def parse_refs(body: str, viewport: int, dpr: float) -> RefParser:
+    parser = RefParser(viewport, dpr)
+    parser.feed(body)
+    parser.close()
+    for doc in parser.frames:
+        inner = parse_refs(doc, viewport, dpr)
+        parser.urls += inner.urls
+        parser.styles += inner.styles
+    return parser
+
+# ================== URL -> ARQUIVO DE ORIGEM ==================
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def asset_sources() -> list[str]:
+    """Imagens/mídia dos diretórios de assets (chaves relativas, como no ASSET_INDEX)."""
+    from mavipe.assets import ASSET_INDEX
+
+    return [k for k in ASSET_INDEX.glob("*") if Path(k).suffix.lower() in IMAGE_EXTS]
+
+class AssetResolver:
+    """Mapeia URL estática, variante derivada ou data URI de volta ao arquivo de origem."""
+
+    def __init__(self):
+        from mavipe.derivatives import read_index
+        from mavipe.static_assets import STATIC_DIR, STATIC_URL_PREFIX, read_manifest
+        from mavipe.tiles import read_index as read_tiles_index
+
+        self.static_dir = STATIC_DIR
+        self.prefixes = (STATIC_URL_PREFIX, "/" + STATIC_URL_PREFIX.lstrip("/"))
+        self.by_name: dict[str, str] = {}
+        self.by_sha: dict[str, str] = {}
+        self.lqip: dict[str, str] = {}
+        for key, entry in read_manifest()["files"].items():
+            self.by_name[entry["name"]] = key
+        for key, entry in read_index()["entries"].items():
+            source = key.split("|", 1)[0]
+            for v in entry.get("variants", []):
+                for ext in ("webp", "avif"):
+                    if ext in v:
+                        self.by_name[v[ext]] = source
+            if entry.get("lqip"):
+                self.lqip[entry["lqip"]] = source
+        for key, entry in read_tiles_index()["entries"].items():
+            self.by_name[entry["preview"]] = key
+        for key in asset_sources():
+            try:
+                self.by_sha[_sha(Path(key).read_bytes())] = key
+            except OSError:
+                continue
+
+    def resolve(self, url: str) -> tuple[str, str, int] | None:
+        """(asset, tipo, bytes transferidos) ou None para âncoras/links que não são buscados."""
+        if url.startswith("data:"):
+            if url in self.lqip:
+                return self.lqip[url], "lqip", len(url)
+            head, _, data = url.partition(",")
+            try:
+                raw = base64.b64decode(data) if head.endswith(";base64") else data.encode("utf-8")
+            except ValueError:
+                raw = b""
+            mime = head[5:].split(";")[0] or "?"
+            return self.by_sha.get(_sha(raw), f"inline:{mime}"), "inline", len(url)
+        if url.startswith(("http://", "https://", "//")):
+            return url.split("?")[0], "external", 0
+        for prefix in self.prefixes:
+            if url.startswith(prefix):
+                name = url[len(prefix):].split("?")[0]
+                path = self.static_dir / name
+                size = path.stat().st_size if path.exists() else 0
+                return self.by_name.get(name, f"static/{name}"), "static", size
+        path = Path(url.split("?")[0].removeprefix("./"))
+        if path.suffix.lower() in IMAGE_EXTS and path.is_file():
+            return path.as_posix(), "file", path.stat().st_size
+        return None
+
+# ================== RENDER + ATRIBUIÇÃO ==================
+def routes() -> list[tuple[str, dict]]:
+    from mavipe.newsroom import NEWSROOM
+    from mavipe.sections import zoom_images
+
+    return (
+        [("landing", {})]
+        + [(f"news={it['slug']}", {"news": it["slug"]}) for it in NEWSROOM.listing()]
+        + [(f"zoom={name}", {"zoom": name}) for name in zoom_images()]
+    )
+
+def render_route(query: dict) -> list[dict]:
+    """Registros do profiler (com o conteúdo por seção) do 1º run da rota."""
+    from mavipe.profiler import capture_payloads
+
+    with capture_payloads() as records:
+        at = new_app(query)
+        at.run()
+    if at.exception:
+        raise RuntimeError(f"exceção no app: {[e.value for e in at.exception]}")
+    return records
+
+def _image_ref(body, resolver: AssetResolver) -> tuple[str, str, int] | None:
+    if isinstance(body, (bytes, bytearray)):
+        found = resolver.by_sha.get(_sha(bytes(body)), "st.image:bytes")
+        return found, "st.image", len(body)
+    if isinstance(body, (str, Path)):
+        ref = resolver.resolve(str(body))
+        return (ref[0], "st.image", ref[2]) if ref else None
+    return None
+
+def analyze(records: list[dict], resolver: AssetResolver, viewport: int, dpr: float) -> dict:
+    sections: dict[str, dict] = defaultdict(lambda: {"html_bytes": 0, "asset_bytes": 0})
+    assets: dict[str, dict] = {}
+    styles = []
+    seen_urls: set[str] = set()
+    for rec in records:
+        for section, counter, body in rec["payloads"]:
+            sec = sections[section]
+            if counter == "image_bytes":
+                refs = [_image_ref(body, resolver)]
+            elif isinstance(body, str):
+                sec["html_bytes"] += len(body.encode("utf-8"))
+                parsed = parse_refs(body, viewport, dpr)
+                for css in parsed.styles:
+                    styles.append({"section": section, "bytes": len(css.encode("utf-8")), "head": css.strip()[:60]})
+                refs = []
+                for _, url in parsed.urls:
+                    if not url:
+                        continue
+                    ref = resolver.resolve(url)
+                    if ref is None:
+                        continue
+                    if ref[1] in ("static", "file", "external"):  # mesma URL na rota: uma busca
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                    refs.append(ref)
+            else:
+                refs = []
+            for ref in refs:
+                if ref is None:
+                    continue
+                asset, kind, size = ref
+                a = assets.setdefault(asset, {"bytes": 0, "refs": 0, "kinds": set(), "sections": set()})
+                a["bytes"] += size
+                a["refs"] += 1
+                a["kinds"].add(kind)
+                a["sections"].add(section)
+                if kind not in ("inline", "lqip"):  # data URIs já estão no HTML da seção
+                    sec["asset_bytes"] += size
+    total_html = sum(s["html_bytes"] for s in sections.values())
+    total_assets = sum(s["asset_bytes"] for s in sections.values())
+    return {
+        "total_bytes": total_html + total_assets,
+        "html_bytes": total_html,
+        "asset_bytes": total_assets,
+        "sections": dict(sections),
+        "assets": {k: {**v, "kinds": sorted(v["kinds"]), "sections": sorted(v["sections"])} for k, v in assets.items()},
+        "styles": styles,
+    }
+
+# ================== ORÇAMENTO ==================
+def load_config(path: Path | None) -> dict:
+    config = {"routes": dict(ROUTE_BUDGETS), "assets": dict(ASSET_BUDGETS), "style": STYLE_BUDGET}
+    if path:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        config["routes"].update(data.get("routes", {}))
+        # globs do arquivo vêm antes dos padrões (a 1ª que casar vale)
+        config["assets"] = {**data.get("assets", {}), **{k: v for k, v in config["assets"].items() if k not in data.get("assets", {})}}
+        config["style"] = data.get("style", config["style"])
+    return config
+
+def route_budget(route: str, config: dict) -> int | None:
+    routes = config["routes"]
+    kind = route.split("=", 1)[0]
+    return routes.get(route, routes.get({"news": "article"}.get(kind, kind)) if "=" in route else None)
+
+def asset_budget(asset: str, config: dict) -> int | None:
+    for pattern, limit in config["assets"].items():
+        if fnmatch.fnmatch(asset, pattern):
+            return limit
+    return None
+
+def check(report: dict, config: dict) -> list[str]:
+    out = []
+    for route, r in report["routes"].items():
+        limit = route_budget(route, config)
+        if limit and r["total_bytes"] > limit:
+            out.append(f"{route}: {r['total_bytes'] / KIB:.0f} KiB > {limit / KIB:.0f} KiB")
+        for asset, a in r["assets"].items():
+            limit = asset_budget(asset, config)
+            if limit and a["bytes"] > limit:
+                out.append(f"{route} · {asset}: {a['bytes'] / KIB:.0f} KiB > {limit / KIB:.0f} KiB")
+        for s in r["styles"]:
+            if config["style"] and s["bytes"] > config["style"]:
+                out.append(f"{route} · <style> em {s['section']}: {s['bytes'] / KIB:.1f} KiB > {config['style'] / KIB:.0f} KiB")
+    return out
+
+def unreferenced(report: dict) -> list[tuple[str, int]]:
+    used = {asset for r in report["routes"].values() for asset in r["assets"]}
+    return [(k, Path(k).stat().st_size) for k in asset_sources() if k not in used]
+
+# ================== CLI ==================
+def _kib(n: int) -> str:
+    return f"{n / KIB:.1f}"
+
+def print_route(route: str, r: dict, budget: int | None) -> None:
+    limit = f" / {budget / KIB:.0f} KiB" if budget else ""
+    print(f"{route}: {_kib(r['total_bytes'])} KiB{limit} (HTML {_kib(r['html_bytes'])}, assets {_kib(r['asset_bytes'])})")
+    print(f"  {'seção':16} {'HTML KiB':>9} {'assets KiB':>11}")
+    for name, s in r["sections"].items():
+        print(f"  {name:16} {_kib(s['html_bytes']):>9} {_kib(s['asset_bytes']):>11}")
+    print(f"  {'asset':40} {'KiB':>8} {'refs':>5}  tipo / seções")
+    for asset, a in sorted(r["assets"].items(), key=lambda kv: -kv[1]["bytes"]):
+        print(f"  {asset[:40]:40} {_kib(a['bytes']):>8} {a['refs']:>5}  {','.join(a['kinds'])} / {', '.join(a['sections'])}")
+    for s in r["styles"]:
+        print(f"  <style> {_kib(s['bytes']):>6} KiB em {s['section']}: {s['head']}")
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Peso da página por rota, seção, asset e <style> (AppTest)")
+    ap.add_argument("--viewport", type=int, default=DEFAULT_VIEWPORT, help="largura em px CSS (padrão: 1440)")
+    ap.add_argument("--dpr", type=float, default=1.0, help="device pixel ratio (padrão: 1)")
+    ap.add_argument("--config", type=Path, help="JSON com routes/assets/style em bytes (sobrepõe os padrões)")
+    ap.add_argument("--route", action="append", help="repetível: landing ou news=<slug>; padrão: todas")
+    ap.add_argument("--json", type=Path, help="grava o relatório também neste arquivo")
+    args = ap.parse_args(argv)
+
+    os.chdir(APP_PATH.parent)
+    config = load_config(args.config)
+    todo = [(name, q) for name, q in routes() if not args.route or name in args.route]
+    report = {"viewport": args.viewport, "dpr": args.dpr, "routes": {}}
+    resolver = None
+    for name, query in todo:
+        records = render_route(query)
+        resolver = resolver or AssetResolver()  # depois do 1º render: manifesto e derivados em dia
+        report["routes"][name] = analyze(records, resolver, args.viewport, args.dpr)
+        print_route(name, report["routes"][name], route_budget(name, config))
+    report["unreferenced"] = [{"asset": k, "bytes": n} for k, n in unreferenced(report)]
+    if report["unreferenced"]:
+        print("sem referência em nenhuma rota:")
+        for u in report["unreferenced"]:
+            print(f"  {u['asset']:40} {_kib(u['bytes']):>8} KiB")
+    violations = check(report, config)
+    report["violations"] = violations
+    if args.json:
+        write_json(args.json, report)
+    for v in violations:
+        print(f"  ESTOURO {v}")
+    print(f"{len(violations)} estouro(s) de orçamento")
+    return 1 if violations else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,95 @@
+# mavipe/carousel.py — carrossel da seção EMPRESA que avança no navegador
+#
+# Todos os quadros (por URL) vão uma única vez dentro de um st.iframe; a troca de quadro,
+# os botões ◀/▶ e os dots rodam em JS, então o carrossel ocioso não gera nenhum rerun no servidor.
+import html
+import json
+
+CAROUSEL_DOC_CSS = """
+html, body{margin:0; padding:0; background:transparent; font-family:"Source Sans Pro", sans-serif;}
+"""
+
+CAROUSEL_CSS = """
+.frame{display:none}
+.frame.active{display:block}
+.carousel-main{width:100%; height:400px; object-fit:cover; border-radius:12px; box-shadow:0 8px 28px rgba(0,0,0,.35); display:block}
+picture{display:block}
+.carousel-caption{text-align:center; color:#b9c6e6; font-size:0.95rem; margin-top:8px; min-height:1.3em}
+.carousel-controls{display:flex; align-items:center; justify-content:space-between; margin-top:10px}
+.carousel-controls button.nav{background:transparent; color:#e6eefc; border:1px solid rgba(255,255,255,.2);
+  border-radius:8px; padding:6px 14px; font-size:1rem; cursor:pointer}
+.carousel-controls button.nav:hover{border-color:#34d399; color:#34d399}
+.carousel-dots{display:flex; gap:8px; justify-content:center}
+.carousel-dots button{width:8px; height:8px; padding:0; border:0; border-radius:50%; background:#5d6a8b; opacity:.6; cursor:pointer}
+.carousel-dots button.active{background:#e6eefc; opacity:1}
+"""
+
+CAROUSEL_JS = """
+(function(){
+  const cfg = JSON.parse(document.getElementById("carousel-cfg").textContent);
+  const frames = Array.from(document.querySelectorAll(".frame"));
+  const dots = Array.from(document.querySelectorAll(".carousel-dots button"));
+  const caption = document.querySelector(".carousel-caption");
+  const n = frames.length;
+  let idx = 0, timer = null;
+
+  function preload(i){
+    const img = frames[i].querySelector("img");
+    if (img && img.loading === "lazy") img.loading = "eager";
+  }
+  function show(i){
+    idx = ((i % n) + n) % n;
+    frames.forEach((f, j) => f.classList.toggle("active", j === idx));
+    dots.forEach((d, j) => d.classList.toggle("active", j === idx));
+    caption.textContent = cfg.captions[idx];
+    if (n > 1) preload((idx + 1) % n);
+  }
+  function stop(){ if (timer) { clearInterval(timer); timer = null; } }
+  function start(){
+    stop();
+    if (n > 1 && !document.hidden) timer = setInterval(() => show(idx + 1), cfg.interval);
+  }
+  function go(i){ show(i); start(); }
+
+  document.getElementById("emp_prev").addEventListener("click", () => go(idx - 1));
+  document.getElementById("emp_next").addEventListener("click", () => go(idx + 1));
+  dots.forEach((d, j) => d.addEventListener("click", () => go(j)));
+  document.addEventListener("visibilitychange", () => document.hidden ? stop() : start());
+
+  show(cfg.start);
+  start();
+})();
+"""
+
+def carousel_markup(frames: list[str], captions: list[str], start: int = 0, interval_sec: float = 3) -> str:
+    """Marcação + script do carrossel; `frames` são as <img class="carousel-main"> já prontas."""
+    n = len(frames)
+    start = start % n if n else 0
+    frame_divs = "".join(
+        f'<div class="frame{" active" if i == start else ""}">{f}</div>' for i, f in enumerate(frames)
+    )
+    dots = "".join(
+        f'<button type="button" aria-label="Imagem {i+1}"{" class=active" if i == start else ""}></button>'
+        for i in range(n)
+    )
+    cfg = json.dumps({"start": start, "interval": int(interval_sec * 1000), "captions": captions})
+    cfg = cfg.replace("</", "<\\/")
+    return f"""<div class="carousel">
+  {frame_divs}
+  <div class="carousel-caption">{html.escape(captions[start]) if n else ""}</div>
+  <div class="carousel-controls">
+    <button type="button" class="nav" id="emp_prev" aria-label="Anterior">◀</button>
+    <div class="carousel-dots">{dots}</div>
+    <button type="button" class="nav" id="emp_next" aria-label="Próxima">▶</button>
+  </div>
+</div>
+<script type="application/json" id="carousel-cfg">{cfg}</script>
+<script>{CAROUSEL_JS}</script>"""
+
+def carousel_html(frames: list[str], captions: list[str], start: int = 0, interval_sec: float = 3) -> str:
+    """Documento completo para o st.iframe do Streamlit (HTML inline, não URL)."""
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><style>{CAROUSEL_DOC_CSS}{CAROUSEL_CSS}</style></head>
+<body>
+{carousel_markup(frames, captions, start, interval_sec)}
+</body></html>"""
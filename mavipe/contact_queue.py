@@ -0,0 +1,331 @@
+# mavipe/contact_queue.py — fila persistente do formulário de contato + envio SMTP em segundo plano
+#
+# O app só grava o lead em SQLite (.cache/contact_queue.sqlite3) e volta; uma thread por processo
+# reserva lotes pendentes (lease, seguro com várias réplicas), envia numa única conexão SMTP e
+# reagenda falhas com backoff exponencial. Sem MAVIPE_SMTP_HOST os leads só ficam na fila (aviso
+# no log uma vez por processo, e o formulário aponta o e-mail de contato em vez de prometer resposta).
+# Uso: python -m mavipe.contact_queue status | drain | stand-in [--port 1025]
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import smtplib
+import socketserver
+import sqlite3
+import sys
+import threading
+import time
+from email.message import EmailMessage
+from pathlib import Path
+
+from mavipe.content import MAVIPE_EMAIL
+
+log = logging.getLogger(__name__)
+
+QUEUE_PATH = Path(os.environ.get("MAVIPE_CONTACT_QUEUE", ".cache/contact_queue.sqlite3"))
+SMTP_HOST = os.environ.get("MAVIPE_SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("MAVIPE_SMTP_PORT", "25"))
+SMTP_USER = os.environ.get("MAVIPE_SMTP_USER", "")
+SMTP_PASSWORD = os.environ.get("MAVIPE_SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.environ.get("MAVIPE_SMTP_STARTTLS", "0") == "1"
+SMTP_TIMEOUT_SEC = 20
+MAIL_FROM = os.environ.get("MAVIPE_SMTP_FROM", MAVIPE_EMAIL)
+MAIL_TO = os.environ.get("MAVIPE_CONTACT_TO", MAVIPE_EMAIL)
+
+BATCH_SIZE = int(os.environ.get("MAVIPE_SMTP_BATCH", "20"))
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_SEC = 30
+BACKOFF_MAX_SEC = 6 * 3600
+LEASE_SEC = 120
+POLL_SEC = 15
+
+FIELDS = ("nome", "email", "org", "phone", "msg")
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending | sent | failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS leads_due ON leads(status, next_attempt);
+"""
+
+def validate(lead: dict) -> list[str]:
+    """Mensagens de erro para o formulário (lista vazia = ok)."""
+    errors = []
+    if not lead.get("nome", "").strip():
+        errors.append("Informe seu nome.")
+    if not EMAIL_RE.match(lead.get("email", "").strip()):
+        errors.append("Informe um e-mail válido.")
+    if not lead.get("msg", "").strip():
+        errors.append("Conte qual desafio você quer resolver.")
+    return errors
+
+def backoff(attempts: int) -> float:
+    delay = min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * 2 ** max(0, attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+def build_message(lead: dict, mail_from: str = MAIL_FROM, mail_to: str = MAIL_TO) -> EmailMessage:
+    m = EmailMessage()
+    m["Subject"] = f"MAVIPE — Contato: {lead.get('nome', '').strip()} ({lead.get('org', '').strip() or 'sem organização'})"
+    m["From"] = mail_from
+    m["To"] = mail_to
+    if EMAIL_RE.match(lead.get("email", "").strip()):
+        m["Reply-To"] = lead["email"].strip()
+    m.set_content(
+        f"Nome: {lead.get('nome', '')}\nEmail: {lead.get('email', '')}\nOrg: {lead.get('org', '')}\n"
+        f"Telefone: {lead.get('phone', '')}\nMensagem:\n{lead.get('msg', '')}\n"
+    )
+    return m
+
+class ContactQueue:
+    def __init__(self, path: Path = QUEUE_PATH):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self.wake = threading.Event()
+
+    def conn(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                self._conn = conn
+            return self._conn
+
+    def enqueue(self, lead: dict) -> int:
+        payload = json.dumps({k: str(lead.get(k, "")) for k in FIELDS}, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            cur = self.conn().execute(
+                "INSERT INTO leads(created, payload, next_attempt) VALUES (?, ?, ?)", (now, payload, now)
+            )
+        self.wake.set()
+        return cur.lastrowid
+
+    def claim(self, limit: int = BATCH_SIZE) -> list[tuple[int, int, dict]]:
+        """Reserva até `limit` leads vencidos (lease) numa transação exclusiva entre processos."""
+        conn = self.conn()
+        now = time.time()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT id, attempts, payload FROM leads WHERE status='pending' AND next_attempt <= ? "
+                    "AND lease_until <= ? ORDER BY id LIMIT ?", (now, now, limit),
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE leads SET lease_until=? WHERE id=?", [(now + LEASE_SEC, r[0]) for r in rows]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return [(r[0], r[1], json.loads(r[2])) for r in rows]
+
+    def mark_sent(self, lead_id: int) -> None:
+        with self._lock:
+            self.conn().execute(
+                "UPDATE leads SET status='sent', sent_at=?, lease_until=0, last_error=NULL WHERE id=?",
+                (time.time(), lead_id),
+            )
+
+    def release(self, lead_ids: list[int]) -> None:
+        """Devolve leads reservados à fila sem contar tentativa."""
+        with self._lock:
+            self.conn().executemany("UPDATE leads SET lease_until=0 WHERE id=?", [(i,) for i in lead_ids])
+
+    def mark_failed(self, lead_id: int, attempts: int, error: str) -> None:
+        attempts += 1
+        status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+        with self._lock:
+            self.conn().execute(
+                "UPDATE leads SET status=?, attempts=?, next_attempt=?, lease_until=0, last_error=? WHERE id=?",
+                (status, attempts, time.time() + backoff(attempts), error[:500], lead_id),
+            )
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self.conn().execute("SELECT status, COUNT(*) FROM leads GROUP BY status").fetchall()
+        return {status: n for status, n in rows}
+
+CONTACT_QUEUE = ContactQueue()
+
+# ================== ENVIO ==================
+def smtp_configured() -> bool:
+    return bool(SMTP_HOST)
+
+def open_smtp(host: str = SMTP_HOST, port: int = SMTP_PORT) -> smtplib.SMTP:
+    smtp = smtplib.SMTP(host, port, timeout=SMTP_TIMEOUT_SEC)
+    if SMTP_STARTTLS:
+        smtp.starttls()
+    if SMTP_USER:
+        smtp.login(SMTP_USER, SMTP_PASSWORD)
+    return smtp
+
+def deliver_batch(queue: ContactQueue = CONTACT_QUEUE, host: str = SMTP_HOST, port: int = SMTP_PORT) -> tuple[int, int]:
+    """Envia um lote numa única conexão; devolve (enviados, falhas)."""
+    batch = queue.claim()
+    if not batch:
+        return 0, 0
+    sent = failed = 0
+    try:
+        smtp = open_smtp(host, port)
+    except (OSError, smtplib.SMTPException) as e:
+        for lead_id, attempts, _ in batch:
+            queue.mark_failed(lead_id, attempts, f"conexão: {e}")
+        return 0, len(batch)
+    try:
+        for i, (lead_id, attempts, lead) in enumerate(batch):
+            try:
+                smtp.send_message(build_message(lead))
+            except OSError as e:  # inclui smtplib.SMTPException
+                queue.mark_failed(lead_id, attempts, str(e))
+                failed += 1
+                if isinstance(e, smtplib.SMTPServerDisconnected) or not isinstance(e, smtplib.SMTPException):
+                    # conexão caiu: o resto do lote volta para a fila sem contar tentativa
+                    queue.release([b[0] for b in batch[i + 1:]])
+                    break
+            else:
+                queue.mark_sent(lead_id)
+                sent += 1
+    finally:
+        try:
+            smtp.quit()
+        except (OSError, smtplib.SMTPException):
+            pass
+    return sent, failed
+
+def drain(queue: ContactQueue = CONTACT_QUEUE, host: str = SMTP_HOST, port: int = SMTP_PORT) -> tuple[int, int]:
+    total_sent = total_failed = 0
+    while True:
+        sent, failed = deliver_batch(queue, host, port)
+        total_sent += sent
+        total_failed += failed
+        if sent == 0:  # fila vazia ou lote inteiro falhou: espera o backoff
+            return total_sent, total_failed
+
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+_warned_no_smtp = False
+
+def _worker_loop(queue: ContactQueue) -> None:
+    while True:
+        queue.wake.clear()
+        try:
+            drain(queue)
+        except Exception:
+            pass
+        queue.wake.wait(POLL_SEC)
+
+def ensure_worker(queue: ContactQueue = CONTACT_QUEUE) -> bool:
+    """Sobe (uma vez por processo) a thread de envio; False se o SMTP não está configurado."""
+    global _worker, _warned_no_smtp
+    if not smtp_configured():
+        if not _warned_no_smtp:
+            _warned_no_smtp = True
+            log.warning("MAVIPE_SMTP_HOST vazio: leads do formulário ficam só na fila %s, sem envio", queue.path)
+        return False
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, args=(queue,), name="mavipe-contact-smtp", daemon=True)
+            _worker.start()
+    return True
+
+# ================== STAND-IN SMTP (testes locais) ==================
+class _StandInHandler(socketserver.StreamRequestHandler):
+    """SMTP mínimo: aceita tudo e grava cada mensagem em <dir>/<n>.eml."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write((line + "\r\n").encode("ascii"))
+
+    def handle(self) -> None:
+        server = self.server
+        self.reply("220 mavipe-stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode("utf-8", "replace").strip().upper()
+            if cmd.startswith(("EHLO", "HELO")):
+                self.reply("250 mavipe-stand-in")
+            elif cmd.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                if server.fail_every and cmd.startswith("MAIL"):
+                    server.seen += 1
+                    if server.seen % server.fail_every == 0:
+                        self.reply("451 falha simulada")
+                        continue
+                self.reply("250 OK")
+            elif cmd == "DATA":
+                self.reply("354 fim com <CRLF>.<CRLF>")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if not chunk or chunk in (b".\r\n", b".\n"):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                with server.lock:
+                    server.received += 1
+                    n = server.received
+                server.out_dir.mkdir(parents=True, exist_ok=True)
+                (server.out_dir / f"{n:05d}.eml").write_bytes(b"".join(data))
+                self.reply("250 OK")
+            elif cmd == "QUIT":
+                self.reply("221 tchau")
+                return
+            else:
+                self.reply("502 não implementado")
+
+class StandInSMTP(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, port: int, out_dir: Path, fail_every: int = 0):
+        super().__init__(("127.0.0.1", port), _StandInHandler)
+        self.out_dir = Path(out_dir)
+        self.fail_every = fail_every
+        self.seen = 0
+        self.received = 0
+        self.lock = threading.Lock()
+
+# ================== CLI ==================
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Fila do formulário de contato")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("status", help="contagem por status")
+    d = sub.add_parser("drain", help="envia agora tudo o que estiver vencido")
+    d.add_argument("--host", default=SMTP_HOST or "127.0.0.1")
+    d.add_argument("--port", type=int, default=SMTP_PORT)
+    s = sub.add_parser("stand-in", help="servidor SMTP local que grava as mensagens em arquivos .eml")
+    s.add_argument("--port", type=int, default=1025)
+    s.add_argument("--out", type=Path, default=Path(".cache/smtp-stand-in"))
+    s.add_argument("--fail-every", type=int, default=0, help="responde 451 a cada N mensagens (testa retry)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "status":
+        print(json.dumps(CONTACT_QUEUE.counts(), indent=2))
+    elif args.cmd == "drain":
+        sent, failed = drain(CONTACT_QUEUE, args.host, args.port)
+        print(f"{sent} enviado(s), {failed} falha(s); fila: {CONTACT_QUEUE.counts()}")
+    else:
+        with StandInSMTP(args.port, args.out, args.fail_every) as server:
+            print(f"SMTP stand-in em 127.0.0.1:{args.port} -> {args.out}/")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
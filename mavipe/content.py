@@ -0,0 +1,242 @@
+# mavipe/content.py — conteúdo da landing (textos, setores, soluções, newsroom) e seus assets
+#
+# Compartilhado pelo app.py (Streamlit) e pelo export estático (mavipe/export.py).
+import re
+import unicodedata
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX
+from mavipe.static_assets import asset_url
+
+# ================== CONFIG GERAL ==================
+YOUTUBE_ID = "Ulrl6TFaWtA"
+
+LOGO_CANDIDATES = [
+    "logo-mavipe@2x.png", "logo-mavipe.png",
+    "logo-mavipe@2x.jpg", "logo-mavipe.jpg",
+    "logo-mavipe.jpeg", "logo-mavipe@2x.jpeg",
+]
+
+LINKEDIN_CANDIDATES = [
+    "linkedin@2x.svg","linkedin.svg",
+    "linkedin@2x.png","linkedin.png",
+    "linkedin@2x.jpg","linkedin.jpg",
+    "linkedin_mono.svg","linkedin_mono_green.svg",
+]
+
+CAROUSEL_INTERVAL_SEC = 3
+
+EMPRESA_CAPTIONS = [
+    "Empresa Certificada do Ministério da Defesa",
+    "Plataforma Geoespacial DAP ATLAS — Multipropósito, Proprietária e Certificada como Produto Estratégico de Defesa",
+    "Setor de Defesa — Inteligência, Vigilância e Reconhecimento",
+]
+
+MAVIPE_EMAIL = "contato@dapsat.com"
+MAVIPE_ADDRESS = "Av. Cassiano Ricardo, 601 / Sala 123, São José dos Campos, SP 12246-870 - Brasil"
+
+# ================== ASSETS ==================
+# Descoberta de assets: uma varredura por diretório (ASSET_INDEX), invalidada pelo mtime do
+# diretório; os resultados lógicos ficam memoizados até o próximo rescan.
+def find_first(candidates) -> str | None:
+    return ASSET_INDEX.find_first(candidates)
+
+def gather_empresa_images(max_n: int = 2) -> list[str]:
+    return ASSET_INDEX.resolve(("empresa", max_n), lambda: _gather_empresa_images(max_n))
+
+def _gather_empresa_images(max_n: int) -> list[str]:
+    base = [
+        "empresa1.jpg", "empresa1.jpeg", "empresa1.png",
+        "empresa2.jpg", "empresa2.jpeg", "empresa2.png",
+    ]
+    found = [p for p in base if ASSET_INDEX.has(p)]
+    extras = []
+    for pat in ("empresa*.jpg", "empresa*.jpeg", "empresa*.png"):
+        extras.extend(ASSET_INDEX.glob(pat))
+    seen, ordered = set(), []
+    for p in found + extras:
+        if p not in seen:
+            ordered.append(p); seen.add(p)
+        if len(ordered) >= max_n:
+            break
+    return ordered
+
+def gather_partner_images(max_n: int = 24) -> list[str]:
+    return ASSET_INDEX.resolve(("partners", max_n), lambda: _gather_partner_images(max_n))
+
+def _gather_partner_images(max_n: int) -> list[str]:
+    patterns = [
+        "parceiro*.png", "parceiro*.jpg", "parceiro*.jpeg",
+        "certificacao*.png", "certificacao*.jpg", "certificacao*.jpeg",
+        "logo*.png", "logo*.jpg", "logo*.jpeg",
+    ]
+    results = []
+    for pat in patterns:
+        for s in ASSET_INDEX.glob(pat):
+            if s not in results:
+                results.append(s)
+    return results[:max_n]
+
+def pick_logo_path() -> str | None:
+    return ASSET_INDEX.resolve("logo", lambda: find_first(["logo-mavipe@2x.png", "logo-mavipe.png", *LOGO_CANDIDATES]))
+
+def caption_from_path(path_str: str) -> str:
+    name = Path(path_str).stem
+    name = re.sub(r"[_\-]+", " ", name).strip()
+    return " ".join(w.capitalize() for w in name.split()) or "Imagem"
+
+def empresa_caption(idx: int, path_str: str) -> str:
+    if 0 <= idx < len(EMPRESA_CAPTIONS) and (EMPRESA_CAPTIONS[idx] or "").strip():
+        return EMPRESA_CAPTIONS[idx].strip()
+    return caption_from_path(path_str)
+
+def news_thumbnail_src(path_str: str | None) -> str | None:
+    if not path_str:
+        return None
+    return asset_url(path_str) if ASSET_INDEX.has(path_str) else None
+
+# cria ícone padrão de óleo&gás (caso não exista)
+def ensure_default_icons() -> None:
+    icons_dir = Path("icons")
+    oleogas_path = icons_dir / "oleogas.svg"
+    if ASSET_INDEX.stat(oleogas_path) is not None:
+        return
+    icons_dir.mkdir(exist_ok=True)
+    oleogas_path.write_text("""
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64" fill="none">
+  <rect width="64" height="64" rx="12" fill="#0b1221"/>
+  <path d="M14 48h36v2H14v-2Zm12-14h4v14h-4V34Zm18 0h4v14h-4V34ZM20 22h24l-2 12H22l-2-12Zm3 0 2 10h14l2-10H23Zm6-8h6v6h-6v-6Zm-2 6h10v2h-10v-2Z" fill="#4EA8DE"/>
+</svg>
+""".strip(), encoding="utf-8")
+
+def sector_icon_path(slug: str) -> str | None:
+    return ASSET_INDEX.resolve(("sector_icon", slug), lambda: _sector_icon_path(slug))
+
+def sector_icon_data_uri(slug: str) -> str | None:
+    icon = sector_icon_path(slug)
+    return asset_url(icon) if icon else None
+
+def _sector_icon_path(slug: str) -> str | None:
+    candidates=[]
+    for ext in ("svg","png","jpg","jpeg","webp"):
+        candidates += [
+            f"icons/{slug}.{ext}", f"icons/{slug}_icon.{ext}", f"icons/icon-{slug}.{ext}",
+            f"{slug}.{ext}", f"{slug}_icon.{ext}", f"icon-{slug}.{ext}",
+        ]
+    return find_first(candidates)
+
+# ================== SETORES & SOLUÇÕES ==================
+SECTORS = [
+    {"slug":"oleogas","title":"Óleo & Gás",
+     "desc":"Monitoramento de Emissão de Metano e Monitoramento de Ativos Críticos.",
+     "bullets":[
+        "Monitoramento de Emissão de Metano — OGMP 2.0 Nível 5.",
+        "Supervisão contínua de dutos e instalações estratégicas com IA e análise temporal.",
+        "Detecção de Derramamento de Óleo e suporte à resposta ambiental."
+     ]},
+    {"slug":"defesa","title":"Defesa & Segurança",
+     "desc":"Maritime & Ground Domain Awareness com alertas e análise assistida por IA.",
+     "bullets":[
+        "Monitoramento de embarcações não-colaborativas (dark ships).",
+        "Monitoramento de fronteiras terrestres e marítimas.",
+        "Acompanhamento de instalações civis e militares críticas."
+     ]},
+    {"slug":"ambiental","title":"Ambiental",
+     "desc":"Monitoramento de emissões e riscos ambientais.",
+     "bullets":[
+        "Detecção de metano em aterros sanitários e áreas de resíduos.",
+        "Acompanhamento de desmatamento e mudanças no uso do solo.",
+        "Monitoramento de desastres ambientais como enchentes e derramamentos."
+     ]},
+]
+
+SOLUTIONS = [
+    {
+        "title": "Monitoramento de Metano — OGMP 2.0 (Nível 5)",
+        "desc": (
+            "<ul style='margin:.4rem 0 0 1.1rem'>"
+            "<li>Parceria com a empresa canadense GHGSat, líder mundial em satélites SWIR.</li>"
+            "<li>Detecção e medição de plumas de metano em ambientes onshore e offshore.</li>"
+            "<li>Dashboards, APIs e relatórios compatíveis com OGMP 2.0 (ONU).</li>"
+            "<li>Permite o reporte em nível L5 (site level).</li>"
+            "<li>Apoia empresas na conquista do Selo Gold Standard em gestão de metano.</li>"
+            "</ul>"
+        ),
+        "img": "solucao1.png",
+        "caption": "DAP ATLAS - Módulo Monitoramento de Metano",
+        "reverse": False,
+    },
+    {
+        "title": "Derramamento de Óleo no Mar",
+        "desc": (
+            "<ul style='margin:.4rem 0 0 1.1rem'>"
+            "<li>Emprego de imagens de satélites do tipo radar (SAR), combinadas à IA.</li>"
+            "<li>Detecção de derramamentos de óleo no mar, dia e noite (24/7).</li>"
+            "<li>Inclusão de metadados, nível de confiança e recomendações operacionais.</li>"
+            "<li>Exibição da imagem da Área de Interesse (AOI) com características detectadas e sobrepostas.</li>"
+            "<li>Dados apresentados em tabela e resumo conciso para apoiar a resposta ambiental e identificar a fonte causadora.</li>"
+            "</ul>"
+        ),
+        "img": "solucao2.png",
+        "caption": "DAP ATLAS - Módulo Monitoramento Derramamento de Óleo",
+        "reverse": True,
+    },
+    {
+        "title": "Detecção de Mudanças",
+        "desc": (
+            "<ul style='margin:.4rem 0 0 1.1rem'>"
+            "<li>Monitoramento sistemático de ativos e detecção de mudanças físicas</li>"
+            "<li>Alertas configuráveis e relatórios com imagens “antes/depois”.</li>"
+            "<li>Alta taxa de revisita obtida pela configuração orbital otimizada da constelação BlackSky, permitindo múltiplas coletas diárias sobre o território brasileiro.</li>"
+            "<li>Exibição da imagem da Área de Interesse (AOI) com características detectadas e sobrepostas.</li>"
+            "<li>Dados apresentados em tabela e resumo conciso para apoiar a resposta dos tomadores de decisão.</li>"
+            "<li>Possibilidade de entrega das imagens em até 3 horas após a passagem do satélite da constelação BlackSky.</li>"
+            "</ul>"
+        ),
+        "img": "solucao3.png",
+        "caption": "DAP ATLAS - Módulo de Detecção de Mudanças e de Alvos",
+        "reverse": False,
+    },
+    {
+        "title": "Inteligência, Vigilância e Reconhecimento (ISR)",
+        "desc": (
+            "<ul style='margin:.4rem 0 0 1.1rem'>"
+            "<li>Inteligência para Comando e Controle (C2).</li>"
+            "<li>Monitoramento remoto por satélite em ambientes terrestres e marítimos.</li>"
+            "<li>Fusão de imagens ópticas e SAR com dados AIS, RF e meteoceanográficos.</li>"
+            "<li>Detecção de navios não colaborativos (dark ships), fronteiras e instalações sensíveis.</li>"
+            "<li>Operação contínua dia e noite, 24/7.</li>"
+            "<li>Relatório Situacional (SITREP) com alvos e eventos sobrepostos.</li>"
+            "<li>Suporte imediato à decisão e acionamento de vetores de defesa e segurança.</li>"
+            "</ul>"
+            "<div style='margin-top:12px; background:rgba(11,18,33,0.85); border:1px solid rgba(255,255,255,0.08); "
+            "border-radius:10px; padding:12px 16px; color:#e6eefc; font-size:0.9rem; line-height:1.5;'>"
+            "<b>Exemplo Operacional — SITREP:</b><br>"
+            "Uma ameaça potencial (<i>dark ship</i>) foi identificada a aproximadamente 55 minutos da fronteira. "
+            "Informações detalhadas, geradas pelo sistema de fusão de dados da plataforma, são exibidas abaixo do ícone da ameaça, "
+            "com um resumo conciso no canto inferior direito. O processo fornece às autoridades base técnica para decisões rápidas "
+            "e acionamento coordenado de vetores de defesa e segurança para mitigar ou neutralizar a ameaça."
+            "</div>"
+        ),
+        "img": "solucao4.png",
+        "caption": "DAP ATLAS - Módulo Detecção de dark ships e análise tática situacional",
+        "reverse": True,
+    }
+]
+
+SECTOR_FALLBACK_ICONS = {"oleogas":"🛢️","defesa":"🛡️","ambiental":"🌎"}
+
+# ================== NEWSROOM ==================
+def fold_accents(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+
+def slugify(s: str) -> str:
+    s = fold_accents(s).lower()
+    s = re.sub(r"[^a-z0-9]+", "-", s)
+    return s.strip("-")
+
+# slug antigo (acentos viravam "-"): mantido só para não quebrar links já compartilhados
+def legacy_slugify(s: str) -> str:
+    s = s.lower()
+    s = re.sub(r"[^a-z0-9]+", "-", s)
+    return s.strip("-")
@@ -0,0 +1,265 @@
+# mavipe/derivatives.py — derivados responsivos (WebP/AVIF por largura) para cada slot de imagem
+#
+# Cada slot tem um tamanho de exibição fixo no CSS; geramos variantes só até o que o slot
+# precisa (1x/2x), nunca ampliando a fonte. Os arquivos vão para static/derived/ com o hash da
+# fonte no nome, então só são regerados quando a fonte muda. O índice guarda também tamanho
+# intrínseco, cor dominante e um placeholder borrado (LQIP) para as imagens abaixo da dobra.
+# Uso: python -m mavipe.derivatives
+import base64
+import html
+import io
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX
+from mavipe.static_assets import STATIC_DIR, STATIC_ASSETS_ENABLED, HASH_LEN
+from mavipe.static_assets import asset_url, file_sha256, source_key, url_for
+
+try:
+    from PIL import Image, ImageFilter, features
+except ImportError:  # Pillow ausente: cai no <img> simples
+    Image = None
+    ImageFilter = None
+    features = None
+
+DERIVED_SUBDIR = "derived"
+DERIVED_INDEX_PATH = STATIC_DIR / DERIVED_SUBDIR / "index.json"
+# AVIF é opcional (encode bem mais lento); ligue com MAVIPE_DERIVATIVES_AVIF=1
+AVIF_ENABLED = os.environ.get("MAVIPE_DERIVATIVES_AVIF", "0") == "1"
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+LQIP_WIDTH = 24
+LQIP_QUALITY = 40
+
+# widths: larguras-alvo em px; heights: alturas-alvo (convertidas em largura pelo aspect ratio)
+# letterbox: a <img> usa object-fit:contain numa caixa fixa (o placeholder não leva a cor de fundo)
+SLOTS = {
+    "carousel": {"widths": (480, 720, 960, 1440), "sizes": "(max-width: 768px) 100vw, 50vw"},
+    "news-thumb": {"widths": (320, 480, 720), "sizes": "(max-width: 768px) 100vw, 33vw", "letterbox": True},
+    "sol-img": {"widths": (360, 520, 780, 1040), "sizes": "(max-width: 768px) 100vw, 520px"},
+    "partners": {"widths": (260, 520, 1040), "sizes": "(max-width: 768px) 50vw, 520px"},
+    "nav-logo": {"heights": (140, 280), "sizes": None},
+    "hero": {"widths": (640, 1280, 1920), "sizes": "100vw"},
+}
+
+# fontes padrão por slot para o pré-processamento via CLI
+SLOT_SOURCES = {
+    "carousel": ("empresa*.png", "empresa*.jpg", "empresa*.jpeg"),
+    "news-thumb": ("news*.png", "news*.jpg", "news*.jpeg"),
+    "sol-img": ("solucao*.png", "solucao*.jpg", "solucao*.jpeg", "dap_atlas*.png"),
+    "partners": ("partners*.png", "partners*.jpg", "partners*.jpeg"),
+    "nav-logo": ("logo-mavipe*.png", "logo-mavipe*.jpg", "logo-mavipe*.jpeg"),
+    "hero": ("hero_poster*.png", "hero_poster*.jpg", "hero_poster*.jpeg", "hero_poster*.webp"),
+}
+
+RASTER_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+
+# _lock só protege o índice em memória/disco; o encode (lento no AVIF) roda fora dele, serializado
+# por fonte+slot, para uma geração não travar as consultas das outras sessões
+_lock = threading.Lock()
+_index: dict | None = None
+_verified: set[str] = set()  # entradas cujas variantes já foram confirmadas em disco
+_key_locks: dict[str, threading.Lock] = {}
+
+def avif_available() -> bool:
+    return AVIF_ENABLED and features is not None and bool(features.check("avif"))
+
+def read_index() -> dict:
+    try:
+        data = json.loads(DERIVED_INDEX_PATH.read_text(encoding="utf-8"))
+        if data.get("version") == 1:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": 1, "entries": {}}
+
+def write_index(index: dict) -> None:
+    DERIVED_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = DERIVED_INDEX_PATH.with_suffix(f".json.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, DERIVED_INDEX_PATH)
+
+def target_widths(slot: str, src_w: int, src_h: int) -> list[int]:
+    spec = SLOTS[slot]
+    if "heights" in spec:
+        wanted = [round(h * src_w / src_h) for h in spec["heights"]]
+    else:
+        wanted = list(spec["widths"])
+    widths = sorted({min(w, src_w) for w in wanted})
+    return widths or [src_w]
+
+def _save_atomic(img, target: Path, fmt: str, **params) -> None:
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    img.save(tmp, fmt, **params)
+    os.replace(tmp, target)
+
+def dominant_color(im) -> str:
+    """Cor mais frequente numa paleta de 5 cores da miniatura (#rrggbb)."""
+    small = im.convert("RGB")
+    small.thumbnail((64, 64))
+    q = small.quantize(colors=5)
+    count, idx = max(q.getcolors())
+    r, g, b = q.getpalette()[idx * 3: idx * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def is_opaque(im) -> bool:
+    if im.mode != "RGBA":
+        return True
+    return im.getchannel("A").getextrema()[0] == 255
+
+def lqip_data_uri(im) -> str:
+    """WebP minúsculo e borrado em data URI (algumas centenas de bytes) para o fundo da <img>."""
+    w = min(LQIP_WIDTH, im.width)
+    h = max(1, round(im.height * w / im.width))
+    tiny = im.convert("RGB").resize((w, h), Image.BOX).filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    tiny.save(buf, "WEBP", quality=LQIP_QUALITY, method=6)
+    return "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+def generate(p: Path, slot: str, digest: str) -> dict:
+    out_dir = STATIC_DIR / DERIVED_SUBDIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with Image.open(p) as im:
+        im.load()
+        src_w, src_h = im.size
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "transparency" in im.info or im.mode in ("LA", "PA") else "RGB")
+        variants = []
+        for w in target_widths(slot, src_w, src_h):
+            h = max(1, round(src_h * w / src_w))
+            resized = None
+            variant = {"w": w, "h": h}
+            stem = f"{digest[:HASH_LEN]}-{slot}-{w}"
+            formats = [("webp", "WEBP", {"quality": WEBP_QUALITY, "method": 4})]
+            if avif_available():
+                formats.append(("avif", "AVIF", {"quality": AVIF_QUALITY}))
+            for ext, fmt, params in formats:
+                name = f"{DERIVED_SUBDIR}/{stem}.{ext}"
+                target = STATIC_DIR / name
+                if not target.exists():
+                    if resized is None:
+                        resized = im if w == src_w else im.resize((w, h), Image.LANCZOS)
+                    _save_atomic(resized, target, fmt, **params)
+                variant[ext] = name
+            variants.append(variant)
+        meta = {"color": dominant_color(im), "lqip": lqip_data_uri(im), "opaque": is_opaque(im)}
+    return {"width": src_w, "height": src_h, "variants": variants, **meta}
+
+def _current(entry: dict | None, stat) -> bool:
+    return (
+        entry is not None
+        and entry.get("size") == stat.size
+        and entry.get("mtime_ns") == stat.mtime_ns
+        and entry.get("avif") == avif_available()
+        and "lqip" in entry
+    )
+
+def _indexed(key: str) -> dict | None:
+    global _index
+    with _lock:
+        if _index is None:
+            _index = read_index()
+        return _index["entries"].get(key)
+
+def derivatives_for(path_str: str | Path, slot: str) -> dict | None:
+    """Metadados + variantes do slot para a fonte; gera o que faltar (incremental por hash)."""
+    if Image is None or not STATIC_ASSETS_ENABLED:
+        return None
+    p = Path(path_str)
+    if p.suffix.lower() not in RASTER_EXTS:
+        return None
+    stat = ASSET_INDEX.stat(p)
+    if stat is None:
+        return None
+    key = f"{source_key(p)}|{slot}"
+    entry = _indexed(key)
+    if _current(entry, stat) and key in _verified:
+        return entry
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        entry = _indexed(key)  # outra sessão pode ter gerado enquanto esperávamos
+        if _current(entry, stat) and (
+            key in _verified or all((STATIC_DIR / v["webp"]).exists() for v in entry["variants"])
+        ):
+            with _lock:
+                _verified.add(key)
+            return entry
+        try:
+            digest = file_sha256(p)
+            if (
+                entry is None or entry.get("sha256") != digest or entry.get("avif") != avif_available()
+                or "lqip" not in entry
+            ):
+                entry = generate(p, slot, digest)
+            entry = {**entry, "sha256": digest, "size": stat.size, "mtime_ns": stat.mtime_ns, "avif": avif_available()}
+        except (OSError, ValueError, SyntaxError):
+            # arquivo inválido (ex.: icons/oelo.png de 1 byte) ou sem permissão de escrita
+            return None
+        with _lock:
+            _index["entries"][key] = entry
+            _verified.add(key)
+            write_index(_index)
+        return entry
+
+def _srcset(variants: list[dict], ext: str) -> str:
+    return ", ".join(f"{url_for(v[ext])} {v['w']}w" for v in variants if ext in v)
+
+def placeholder_style(d: dict, slot: str) -> str:
+    """Fundo com o LQIP (e a cor dominante) até a imagem real pintar por cima; só p/ imagens opacas."""
+    if not d.get("opaque") or "lqip" not in d:
+        return ""
+    if SLOTS[slot].get("letterbox"):
+        return f"background:url({d['lqip']}) center/contain no-repeat"
+    return f"background:{d['color']} url({d['lqip']}) center/100% 100% no-repeat"
+
+def responsive_img(path_str: str | Path, slot: str, cls: str, alt: str, attrs: str = "",
+                   placeholder: bool = False) -> str:
+    """<img> com srcset/sizes e width/height intrínsecos para o slot; <img> simples como fallback.
+
+    placeholder=True: loading="lazy" + LQIP borrado como fundo (imagens abaixo da dobra).
+    """
+    alt_attr = html.escape(alt, quote=True)
+    src = asset_url(path_str)
+    if placeholder:
+        attrs = f'loading="lazy" decoding="async" {attrs}'.strip()
+    extra = f" {attrs}" if attrs else ""
+    d = derivatives_for(path_str, slot)
+    if not d:
+        return f'<img class="{cls}" src="{src}" alt="{alt_attr}"{extra}/>'
+    style = placeholder_style(d, slot) if placeholder else ""
+    if style:
+        extra += f' style="{style}"'
+    variants = d["variants"]
+    largest = variants[-1]
+    sizes = SLOTS[slot]["sizes"] or f"{variants[0]['w']}px"
+    img = (
+        f'<img class="{cls}" src="{src}" srcset="{_srcset(variants, "webp")}" sizes="{sizes}" '
+        f'width="{largest["w"]}" height="{largest["h"]}" alt="{alt_attr}"{extra}/>'
+    )
+    if any("avif" in v for v in variants):
+        return f'<picture><source type="image/avif" srcset="{_srcset(variants, "avif")}" sizes="{sizes}"/>{img}</picture>'
+    return img
+
+def main(argv: list[str]) -> int:
+    slots = argv or list(SLOT_SOURCES)
+    for slot in slots:
+        seen = set()
+        for pat in SLOT_SOURCES[slot]:
+            for p in sorted(Path(".").glob(pat)):
+                if p in seen or not p.is_file() or p.stat().st_size == 0:
+                    continue
+                seen.add(p)
+                d = derivatives_for(p, slot)
+                if d is None:
+                    print(f"  {slot:10} {p}: ignorado")
+                    continue
+                sizes = ", ".join(str(v["w"]) for v in d["variants"])
+                print(f"  {slot:10} {p} ({d['width']}x{d['height']}, {d['color']}, LQIP {len(d['lqip'])} B) -> {sizes}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
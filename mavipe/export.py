@@ -0,0 +1,300 @@
+# mavipe/export.py — export estático da landing e de cada artigo da newsroom
+#
+# Gera dist/index.html, dist/news/<slug>.html e dist/zoom/<imagem>.html (visualizador deep zoom
+# com a pirâmide de tiles copiada) com as mesmas seções do app.py, CSS único com hash
+# (dist/static/site.<hash>.css) e as imagens com hash de mavipe/static_assets.py. O formulário
+# de contato vira um <form action="mailto:...">. Só reescreve páginas cujas entradas mudaram.
+# Uso: python -m mavipe.export [--out dist] [--force]
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX
+from mavipe.carousel import CAROUSEL_CSS, carousel_markup
+from mavipe.content import (
+    CAROUSEL_INTERVAL_SEC, MAVIPE_EMAIL, SECTORS, SOLUTIONS, EMPRESA_CAPTIONS,
+    ensure_default_icons, gather_empresa_images,
+)
+from mavipe.newsroom import NEWSROOM
+from mavipe.sections import (
+    CRITICAL_CSS,
+    navbar_html, hero_html, empresa_frames,
+    EMPRESA_TITLE_HTML, EMPRESA_TEXT_HTML, LINKEDIN_LINK_HTML,
+    SOLUCAO_HEADER_HTML, DAP_ATLAS_TEXT_HTML, dap_atlas_html,
+    SETORES_OPEN_HTML, SETORES_TITLE_HTML, SETORES_SUBTITLE_HTML, APLICACOES_HEADER_HTML,
+    sector_grid_html, solution_image_html, solution_text_html,
+    PARTNERS_HEADER_HTML, partners_html,
+    news_grid_html, article_html, backlink_html, contact_card_html, FOOTER_TEXT,
+    zoom_images, zoom_header_html, zoom_fallback_html,
+)
+from mavipe.static_assets import STATIC_DIR, IMAGE_EXTS, url_prefix
+from mavipe.stylesheet import BUNDLE_PARTS, minify_css
+from mavipe.tiles import tiles_for
+from mavipe.zoom import ZOOM_CSS, zoom_viewer_markup
+
+PAGE_TITLE = "MAVIPE Space Systems — DAP ATLAS"
+STATE_FILE = ".export-state.json"
+TEMPLATE_SOURCES = (
+    "content.py", "sections.py", "carousel.py", "derivatives.py", "stylesheet.py", "hero.py", "zoom.py", "export.py",
+)
+
+# O Streamlit fornece tema, fonte e colunas; no export isso vem daqui
+EXPORT_CSS = """
+body{margin:0; font-family:"Source Sans Pro", system-ui, sans-serif; color:#e6eefc; background:#0b1221;}
+.cols{display:flex; gap:2rem; align-items:flex-start}
+.cols > .col{flex:1 1 0; min-width:0}
+.cols > .col-wide{flex:1.4 1 0; min-width:0}
+.cols-white{background:#ffffff; color:#0b1221; padding:0 8vw 24px}
+.st-caption{color:#9fb0d4; font-size:.85rem; text-align:center; padding:18px 0 28px}
+.contact-form{display:grid; grid-template-columns:1fr 1fr; gap:12px 24px}
+.contact-form label{display:flex; flex-direction:column; gap:4px; color:#cbd6f2; font-size:.9rem}
+.contact-form .full{grid-column:1 / -1}
+.contact-form input, .contact-form textarea{background:rgba(255,255,255,.06); color:#e6eefc;
+  border:1px solid rgba(255,255,255,.18); border-radius:8px; padding:8px 10px; font:inherit}
+.contact-form button{justify-self:start; background:#34d399; color:#05131a; font-weight:700;
+  border:0; border-radius:10px; padding:10px 14px; cursor:pointer}
+@media (max-width:768px){ .cols{flex-direction:column} .contact-form{grid-template-columns:1fr} }
+"""
+
+def site_css() -> str:
+    return minify_css("\n".join([CRITICAL_CSS, *BUNDLE_PARTS, CAROUSEL_CSS, ZOOM_CSS, EXPORT_CSS]))
+
+def short_hash(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def page(title: str, css_href: str, body: str) -> str:
+    return f"""<!doctype html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="stylesheet" href="{css_href}">
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# ================== PÁGINAS ==================
+def contact_form_html() -> str:
+    return f"""
+<form class="contact-form" action="mailto:{MAVIPE_EMAIL}?subject=MAVIPE%20%E2%80%94%20Contato" method="post" enctype="text/plain">
+  <label>Seu nome<input name="Nome" type="text"></label>
+  <label>Organização<input name="Org" type="text"></label>
+  <label>E-mail corporativo<input name="Email" type="email"></label>
+  <label>WhatsApp/Telefone (opcional)<input name="Telefone" type="tel"></label>
+  <label class="full">Qual desafio você quer resolver?<textarea name="Mensagem" rows="5"></textarea></label>
+  <button type="submit">Enviar e-mail</button>
+</form>
+"""
+
+def landing_body() -> str:
+    parts = [navbar_html(), hero_html()]
+
+    empresa = ""
+    if gather_empresa_images(max_n=2):
+        frames, captions = empresa_frames(0)
+        empresa = carousel_markup(frames, captions, 0, CAROUSEL_INTERVAL_SEC)
+    parts.append(
+        '<div id="empresa"></div><div class="section"><div class="cols">'
+        f'<div class="col">{EMPRESA_TITLE_HTML}{EMPRESA_TEXT_HTML}{LINKEDIN_LINK_HTML}</div>'
+        f'<div class="col">{empresa}</div></div></div>'
+    )
+
+    dap_img = dap_atlas_html(zoom_page) or ""
+    parts.append(
+        f'<div id="solucao"></div>{SOLUCAO_HEADER_HTML}<div class="cols cols-white">'
+        f'<div class="col-wide">{DAP_ATLAS_TEXT_HTML}</div><div class="col">{dap_img}</div></div>'
+    )
+
+    solutions = []
+    for s in SOLUTIONS:
+        img = f'<div class="col">{solution_image_html(s, zoom_page) or ""}</div>'
+        text = f'<div class="col-wide">{solution_text_html(s)}</div>'
+        solutions.append(f'<div class="sol-box cols">{text + img if s["reverse"] else img + text}</div>')
+    parts.append(
+        SETORES_OPEN_HTML + SETORES_TITLE_HTML + SETORES_SUBTITLE_HTML + sector_grid_html()
+        + APLICACOES_HEADER_HTML + "".join(solutions) + "</div>"
+    )
+
+    parts.append(f'<div id="parceiros"></div>{PARTNERS_HEADER_HTML}<div class="cols-white">{partners_html() or ""}</div>')
+
+    news_href = lambda slug: f"news/{slug}.html"
+    parts.append(
+        '<div id="newsroom"></div><div class="section"><h2>Newsroom</h2>'
+        f'{news_grid_html(NEWSROOM.listing(), news_href, eager=0)}</div>'
+    )
+    parts.append(
+        '<div id="contato"></div><div class="section"><h2>Contato</h2>'
+        f'{contact_form_html()}{contact_card_html()}</div>'
+    )
+    parts.append(f'<div class="st-caption">{FOOTER_TEXT}</div>')
+    return "\n".join(parts)
+
+def article_body_html(item: dict, body: str | None) -> str:
+    back = "../index.html#newsroom"
+    return "\n".join([
+        navbar_html("../index.html"),
+        '<div id="newsroom"></div><div class="section"><h2>Newsroom</h2>',
+        backlink_html(back),
+        article_html(item, body, back),
+        "</div>",
+        f'<div class="st-caption">{FOOTER_TEXT}</div>',
+    ])
+
+def zoom_page(name: str) -> str:
+    return f"zoom/{Path(name).stem}.html"
+
+def zoom_body_html(name: str, meta: dict, tiles: dict | None) -> str:
+    viewer = zoom_viewer_markup(tiles, meta["title"]) if tiles else zoom_fallback_html(name, meta["title"])
+    return "\n".join([
+        navbar_html("../index.html"),
+        '<div class="section">',
+        zoom_header_html(meta["title"], f"../index.html#{meta['anchor']}"),
+        viewer,
+        "</div>",
+        f'<div class="st-caption">{FOOTER_TEXT}</div>',
+    ])
+
+def copy_tiles(tiles: dict, out: Path) -> int:
+    """A pirâmide inteira (o visualizador pede os tiles por URL montada no JS)."""
+    src = STATIC_DIR / tiles["dir"]
+    copied = 0
+    for p in src.rglob(f"*.{tiles['format']}"):
+        target = out / "static" / tiles["dir"] / p.relative_to(src)
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(p, target)
+        copied += 1
+    return copied
+
+# ================== INCREMENTAL ==================
+def template_version() -> str:
+    base = Path(__file__).parent
+    return short_hash(b"".join((base / name).read_bytes() for name in TEMPLATE_SOURCES))
+
+def image_stats() -> list:
+    ASSET_INDEX.refresh(force=True)
+    return [
+        [name, st.size, st.mtime_ns] for name, st in sorted(ASSET_INDEX.snapshot().items())
+        if Path(name).suffix.lower() in IMAGE_EXTS
+    ]
+
+def landing_fingerprint(css_hash: str, version: str) -> str:
+    data = {
+        "css": css_hash, "template": version, "images": image_stats(),
+        "sectors": SECTORS, "solutions": SOLUTIONS, "news": NEWSROOM.listing(), "captions": EMPRESA_CAPTIONS,
+    }
+    return short_hash(json.dumps(data, sort_keys=True, ensure_ascii=False))
+
+def article_fingerprint(item: dict, body: str | None, css_hash: str, version: str) -> str:
+    st = ASSET_INDEX.stat(item["image"]) if item["image"] else None
+    data = {"css": css_hash, "template": version, "item": item, "body": body, "image": st and list(st)}
+    return short_hash(json.dumps(data, sort_keys=True, ensure_ascii=False))
+
+def zoom_fingerprint(name: str, tiles: dict | None, css_hash: str, version: str) -> str:
+    st = ASSET_INDEX.stat(name)
+    data = {"css": css_hash, "template": version, "image": st and list(st), "tiles": tiles and tiles.get("sha256")}
+    return short_hash(json.dumps(data, sort_keys=True))
+
+STATIC_REF = re.compile(r"""(?:\.\./)?static/((?:assets|derived)/[^"'\s,]+)""")
+
+def copy_static_refs(html: str, out: Path) -> int:
+    copied = 0
+    for name in set(STATIC_REF.findall(html)):
+        target = out / "static" / name
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(STATIC_DIR / name, target)
+        copied += 1
+    return copied
+
+def write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+# ================== MAIN ==================
+def export(out: Path, force: bool = False) -> dict:
+    ensure_default_icons()
+    state_path = out / STATE_FILE
+    try:
+        state = {} if force else json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    pages = {}
+
+    css = site_css()
+    css_hash = short_hash(css)
+    css_name = f"static/site.{css_hash}.css"
+    if not (out / css_name).exists():
+        write_atomic(out / css_name, css)
+    version = template_version()
+
+    report = {"written": [], "skipped": [], "assets_copied": 0}
+
+    def build(page_path: str, fingerprint: str, render) -> None:
+        pages[page_path] = fingerprint
+        target = out / page_path
+        if state.get("pages", {}).get(page_path) == fingerprint and target.exists():
+            report["skipped"].append(page_path)
+            return
+        html = render()
+        report["assets_copied"] += copy_static_refs(html, out)
+        write_atomic(target, html)
+        report["written"].append(page_path)
+
+    with url_prefix("static/"):
+        build(
+            "index.html", landing_fingerprint(css_hash, version),
+            lambda: page(PAGE_TITLE, css_name, landing_body()),
+        )
+
+    with url_prefix("../static/"):
+        for item in NEWSROOM.listing():
+            body = NEWSROOM.body(item["slug"])
+            build(
+                f"news/{item['slug']}.html", article_fingerprint(item, body, css_hash, version),
+                lambda item=item, body=body: page(f"{item['title']} — MAVIPE", f"../{css_name}", article_body_html(item, body)),
+            )
+        for name, meta in zoom_images().items():
+            tiles = tiles_for(name)
+            build(
+                zoom_page(name), zoom_fingerprint(name, tiles, css_hash, version),
+                lambda name=name, meta=meta, tiles=tiles: page(f"{meta['title']} — MAVIPE", f"../{css_name}", zoom_body_html(name, meta, tiles)),
+            )
+            if tiles:
+                report["assets_copied"] += copy_tiles(tiles, out)
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps({"pages": pages, "css": css_name}, indent=2), encoding="utf-8")
+    return report
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Export estático da landing MAVIPE")
+    ap.add_argument("--out", default="dist", help="diretório de saída (padrão: dist)")
+    ap.add_argument("--force", action="store_true", help="ignora o estado e regera todas as páginas")
+    args = ap.parse_args(argv)
+    report = export(Path(args.out), force=args.force)
+    for p in report["written"]:
+        print(f"  escrito   {p}")
+    for p in report["skipped"]:
+        print(f"  inalterado {p}")
+    print(f"{len(report['written'])} página(s) escrita(s), {report['assets_copied']} asset(s) copiado(s) para {args.out}/")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
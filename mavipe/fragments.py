@@ -0,0 +1,61 @@
+# mavipe/fragments.py — cache de fragmentos HTML chaveado pelo hash das entradas de cada seção
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.environ.get("MAVIPE_FRAGMENT_CACHE_ENTRIES", "256"))
+
+def inputs_hash(inputs) -> str:
+    data = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+class FragmentCache:
+    """LRU de HTML pronto por (fragmento, hash das entradas), com hits/misses por fragmento."""
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: dict[str, list[int]] = {}
+
+    def get(self, name: str, inputs, render: Callable[[], str]) -> str:
+        key = (name, inputs_hash(inputs))
+        with self._lock:
+            counters = self._counters.setdefault(name, [0, 0])
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                counters[0] += 1
+                return html
+            counters[1] += 1
+        html = render()
+        with self._lock:
+            self._entries[key] = html
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = {}
+            for name, (hits, misses) in sorted(self._counters.items()):
+                lookups = hits + misses
+                out[name] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": (hits / lookups) if lookups else 0.0,
+                    "entries": sum(1 for n, _ in self._entries if n == name),
+                }
+            return out
+
+FRAGMENT_CACHE = FragmentCache()
+
+def cached_fragment(name: str, inputs, render: Callable[[], str]) -> str:
+    return FRAGMENT_CACHE.get(name, inputs, render)
@@ -0,0 +1,138 @@
+# mavipe/hero.py — vídeo do HERO com fachada (pôster local; o iframe do YouTube entra depois)
+#
+# Modos (MAVIPE_HERO_VIDEO, ou ?hero=<modo> para comparar):
+#   facade  — pôster local num iframe srcdoc; troca para o embed do YouTube na primeira interação
+#             (ponteiro, tecla, scroll, toque) ou quando o navegador fica ocioso após o load.
+#             Sem hero_poster.* cai no modo iframe (a fachada seria uma caixa vazia até a troca)
+#   poster  — só o pôster, o vídeo nunca carrega
+#   iframe  — comportamento antigo: embed com autoplay já no primeiro paint
+# O srcdoc herda a origem da página, então o script da fachada escuta os eventos da janela pai.
+# O hero_poster.jpg versionado é um recorte da cena de satélite de geoportal1.png (derive_poster);
+# o quadro do próprio vídeo, quando o YouTube está acessível, substitui com --refresh.
+# Uso: python -m mavipe.hero [--refresh | --local] (pôster em hero_poster.jpg + derivados)
+import html
+import json
+import os
+import sys
+import urllib.request
+
+from mavipe.assets import ASSET_INDEX
+from mavipe.content import YOUTUBE_ID
+from mavipe.derivatives import derivatives_for, responsive_img
+
+HERO_MODES = ("facade", "poster", "iframe")
+HERO_VIDEO_MODE = os.environ.get("MAVIPE_HERO_VIDEO", "facade")
+# espera mínima após o load antes de trocar no ocioso; 0 = só na interação
+HERO_IDLE_MS = int(os.environ.get("MAVIPE_HERO_IDLE_MS", "2500"))
+HERO_POSTER_CANDIDATES = ["hero_poster.webp", "hero_poster.jpg", "hero_poster.jpeg", "hero_poster.png"]
+# fallback local: a área do mapa de satélite, sem a interface em volta (frações de largura/altura)
+HERO_POSTER_SOURCE = "geoportal1.png"
+HERO_POSTER_BOX = (0.35, 0.17, 0.87, 0.82)
+POSTER_URLS = (
+    f"https://i.ytimg.com/vi/{YOUTUBE_ID}/maxresdefault.jpg",
+    f"https://i.ytimg.com/vi/{YOUTUBE_ID}/hqdefault.jpg",
+)
+
+EMBED_URL = (
+    f"https://www.youtube.com/embed/{YOUTUBE_ID}?autoplay=1&mute=1&loop=1&controls=0&modestbranding=1"
+    f"&playsinline=1&rel=0&showinfo=0&playlist={YOUTUBE_ID}"
+)
+IFRAME_ATTRS = 'title="MAVIPE hero" frameborder="0" allow="autoplay; fullscreen; picture-in-picture"'
+
+FACADE_CSS = """html,body{margin:0;height:100%;overflow:hidden;background:#0b1221}
+picture,img{display:block;width:100%;height:100%;object-fit:cover}"""
+
+FACADE_JS = """(function(){
+  var cfg = JSON.parse(document.getElementById("hero-cfg").textContent), done = false;
+  var events = ["pointerdown", "keydown", "scroll", "touchstart", "wheel"], host = window;
+  try { host = window.parent || window; host.document; } catch (e) { host = window; }
+  function go(){
+    if (done) return; done = true;
+    events.forEach(function(e){ host.removeEventListener(e, go, true); });
+    location.replace(cfg.embed);
+  }
+  events.forEach(function(e){ host.addEventListener(e, go, {capture: true, passive: true}); });
+  if (cfg.idle > 0) {
+    var idle = host.requestIdleCallback || function(fn){ return setTimeout(fn, 200); };
+    var arm = function(){ setTimeout(function(){ idle(go, {timeout: 4000}); }, cfg.idle); };
+    if (host.document.readyState === "complete") arm(); else host.addEventListener("load", arm);
+  }
+})();"""
+
+def pick_poster_path() -> str | None:
+    return ASSET_INDEX.resolve("hero_poster", lambda: ASSET_INDEX.find_first(HERO_POSTER_CANDIDATES))
+
+def hero_mode(override: str | None = None) -> str:
+    mode = override if override in HERO_MODES else HERO_VIDEO_MODE
+    return mode if mode in HERO_MODES else "facade"
+
+def poster_img() -> str:
+    poster = pick_poster_path()
+    return responsive_img(poster, "hero", "hero-poster", "", 'fetchpriority="high"') if poster else ""
+
+def hero_media_html(mode: str) -> str:
+    """O iframe do fundo do HERO conforme o modo (fachada/pôster em srcdoc ou o embed direto)."""
+    if mode == "facade" and pick_poster_path() is None:
+        mode = "iframe"
+    if mode == "iframe":
+        return f'<iframe src="{EMBED_URL}" {IFRAME_ATTRS}></iframe>'
+    script = ""
+    if mode == "facade":
+        cfg = json.dumps({"embed": EMBED_URL, "idle": HERO_IDLE_MS}).replace("</", "<\\/")
+        script = f'<script type="application/json" id="hero-cfg">{cfg}</script><script>{FACADE_JS}</script>'
+    doc = f"<!doctype html><html><head><meta charset='utf-8'><style>{FACADE_CSS}</style></head><body>{poster_img()}{script}</body></html>"
+    return f'<iframe srcdoc="{html.escape(doc, quote=True)}" {IFRAME_ATTRS}></iframe>'
+
+# ================== CLI ==================
+def fetch_poster(target: str = "hero_poster.jpg") -> str | None:
+    for url in POSTER_URLS:
+        try:
+            with urllib.request.urlopen(url, timeout=20) as r:
+                data = r.read()
+        except OSError:
+            continue
+        if len(data) > 2048:  # o YouTube devolve um placeholder minúsculo quando não há maxres
+            tmp = f".{target}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+            return url
+    return None
+
+def derive_poster(source: str = HERO_POSTER_SOURCE, box: tuple = HERO_POSTER_BOX,
+                  target: str = "hero_poster.jpg") -> bool:
+    """Recorta `box` de uma imagem do repositório num JPEG progressivo leve (os WebP por largura
+    saem depois no slot hero)."""
+    from PIL import Image
+
+    try:
+        with Image.open(source) as im:
+            w, h = im.size
+            crop = im.convert("RGB").crop(tuple(round(f * s) for f, s in zip(box, (w, h, w, h))))
+    except OSError:
+        return False
+    tmp = f".{target}.{os.getpid()}.tmp"
+    crop.save(tmp, "JPEG", quality=72, optimize=True, progressive=True)
+    os.replace(tmp, target)
+    return True
+
+def main(argv: list[str]) -> int:
+    poster = pick_poster_path()
+    if poster is None or "--refresh" in argv or "--local" in argv:
+        url = None if "--local" in argv else fetch_poster()
+        if url is not None:
+            print(f"pôster baixado de {url}")
+        elif derive_poster():
+            print(f"pôster recortado de {HERO_POSTER_SOURCE}")
+        else:
+            print("não foi possível baixar nem recortar o pôster")
+            return 1
+        ASSET_INDEX.refresh(force=True)
+        poster = pick_poster_path()
+    d = derivatives_for(poster, "hero")
+    sizes = ", ".join(str(v["w"]) for v in d["variants"]) if d else "-"
+    print(f"{poster}: derivados {sizes}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,265 @@
+# mavipe/loadtest.py — teste de carga local com N visitantes simulados no websocket do Streamlit
+#
+# Sobe `streamlit run app.py` (ou usa --url de um servidor já rodando) e abre sessões que falam o
+# protocolo do navegador (BackMsg/ForwardMsg em /_stcore/stream). Cada visita sorteia um perfil:
+#   landing  — abre a landing e fica ociosa (o carrossel roda no navegador)
+#   article  — deep link ?news=<slug>
+#   form     — abre a landing e preenche o contato (um rerun por campo fora de st.form) e envia
+#              (widget dentro de st.fragment: o rerun leva o fragment_id, como no navegador)
+# Para cada N de --sessions mede vazão, latência p50/p99 de rerun, CPU e RSS do servidor.
+# Uso: python -m mavipe.loadtest [--sessions 1,4,16] [--duration 20] [--think 2]
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from websockets.asyncio.client import connect
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetStates
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+DEFAULT_PORT = 8599
+PROFILE_WEIGHTS = {"landing": 0.6, "article": 0.25, "form": 0.15}
+FORM_VALUES = {
+    "Seu nome": "Visitante de Teste",
+    "E-mail corporativo": "teste@example.com",
+    "Organização": "Empresa X",
+    "Qual desafio você quer resolver?": "Monitoramento de metano em instalações offshore.",
+}
+SUBMIT_LABELS = ("Enviar",)
+INPUT_TYPES = ("text_input", "text_area")
+
+# ================== SERVIDOR ==================
+def start_server(port: int) -> subprocess.Popen:
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+        "--server.headless", "true", "--server.port", str(port),
+        "--browser.gatherUsageStats", "false",
+    ]
+    # os envios do perfil "form" vão para uma fila descartável e nunca para o SMTP real
+    env = {**os.environ, "MAVIPE_CONTACT_QUEUE": ".cache/loadtest/contact_queue.sqlite3", "MAVIPE_SMTP_HOST": ""}
+    return subprocess.Popen(cmd, cwd=APP_PATH.parent, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_healthy(base: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base}/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f"servidor não respondeu em {base}")
+
+def proc_stats(pid: int) -> tuple[float, int] | None:
+    """(segundos de CPU user+sys, RSS em bytes) via /proc; None fora do Linux."""
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return cpu, int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+# ================== SESSÃO ==================
+class Session:
+    """Uma aba do navegador: mantém os widgets vistos e mede cada rerun até o script_finished."""
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.ws = None
+        self.widgets: dict[str, tuple[str, str, str, str]] = {}  # label -> (tipo, id, form_id, fragment_id)
+        self.values: dict[str, tuple[str, object]] = {}     # id -> (campo do WidgetState, valor)
+        self.query = ""
+
+    async def __aenter__(self):
+        self.ws = await connect(self.ws_url, max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def rerun(self, query: str | None = None, trigger: str | None = None, fragment_id: str = "") -> float:
+        if query is not None:
+            self.query = query
+        states = WidgetStates()
+        for wid, (field, value) in self.values.items():
+            w = states.widgets.add()
+            w.id = wid
+            setattr(w, field, value)
+        if trigger:
+            w = states.widgets.add()
+            w.id = trigger
+            w.trigger_value = True
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.CopyFrom(states)
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                el = fwd.delta.new_element
+                et = el.WhichOneof("type")
+                if et in (*INPUT_TYPES, "button"):
+                    w = getattr(el, et)
+                    self.widgets[w.label] = (et, w.id, getattr(w, "form_id", ""), fwd.delta.fragment_id)
+            elif kind == "script_finished":
+                return time.perf_counter() - t0
+
+    async def type_field(self, label: str, value: str) -> float | None:
+        """Preenche um campo; devolve a latência do rerun (None se o campo está num st.form)."""
+        _, wid, form_id, fragment_id = self.widgets[label]
+        self.values[wid] = ("string_value", value)
+        return None if form_id else await self.rerun(fragment_id=fragment_id)
+
+    async def click(self, label: str) -> float:
+        _, wid, _, fragment_id = self.widgets[label]
+        return await self.rerun(trigger=wid, fragment_id=fragment_id)
+
+# ================== VISITAS ==================
+async def visit(ws_url: str, profile: str, slug: str, think: float, rng: random.Random, latencies: list[float]) -> None:
+    async def pause():
+        await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+
+    async with Session(ws_url) as s:
+        if profile == "article":
+            latencies.append(await s.rerun(f"news={slug}"))
+            await pause()
+            return
+        latencies.append(await s.rerun(""))
+        if profile == "landing":
+            await pause()
+            return
+        for label, value in FORM_VALUES.items():
+            if label not in s.widgets:
+                continue
+            await asyncio.sleep(think * rng.uniform(0.1, 0.3))
+            lat = await s.type_field(label, value)
+            if lat is not None:
+                latencies.append(lat)
+        submit = next((l for l in SUBMIT_LABELS if l in s.widgets), None)
+        if submit:
+            latencies.append(await s.click(submit))
+        await pause()
+
+async def warm_up(ws_url: str, slug: str) -> None:
+    """Uma visita de cada perfil antes de medir: o custo frio do 1º visitante não entra na conta."""
+    rng = random.Random(0)
+    for profile in PROFILE_WEIGHTS:
+        await visit(ws_url, profile, slug, 0, rng, [])
+
+async def run_level(ws_url: str, n: int, duration: float, think: float, slug: str, pid: int | None, seed: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    rss_peak = 0
+    profiles, weights = zip(*PROFILE_WEIGHTS.items())
+
+    async def worker(i: int):
+        nonlocal errors
+        rng = random.Random(seed * 1000 + i)
+        while time.monotonic() < deadline:
+            try:
+                await visit(ws_url, rng.choices(profiles, weights)[0], slug, think, rng, latencies)
+            except Exception:
+                errors += 1
+                await asyncio.sleep(0.5)
+
+    async def sampler():
+        nonlocal rss_peak
+        while time.monotonic() < deadline:
+            st = proc_stats(pid) if pid else None
+            if st:
+                rss_peak = max(rss_peak, st[1])
+            await asyncio.sleep(0.5)
+
+    before = proc_stats(pid) if pid else None
+    t0 = time.monotonic()
+    await asyncio.gather(sampler(), *(worker(i) for i in range(n)))
+    elapsed = time.monotonic() - t0
+    after = proc_stats(pid) if pid else None
+
+    lat_ms = sorted(x * 1000 for x in latencies)
+    pick = lambda q: round(lat_ms[min(len(lat_ms) - 1, int(q * len(lat_ms)))], 1) if lat_ms else None
+    cpu = round((after[0] - before[0]) / elapsed * 100, 1) if before and after else None
+    return {
+        "sessions": n,
+        "reruns": len(lat_ms),
+        "errors": errors,
+        "reruns_per_s": round(len(lat_ms) / elapsed, 2),
+        "p50_ms": pick(0.50),
+        "p99_ms": pick(0.99),
+        "cpu_pct": cpu,
+        "rss_mib": round(rss_peak / 2**20, 1) if rss_peak else None,
+    }
+
+def first_slug() -> str:
+    from mavipe.newsroom import NEWSROOM
+
+    items = NEWSROOM.listing()
+    return items[0]["slug"] if items else ""
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Teste de carga local do app.py via websocket")
+    ap.add_argument("--sessions", default="1,4,16", help="níveis de concorrência (padrão: 1,4,16)")
+    ap.add_argument("--duration", type=float, default=20, help="segundos por nível (padrão: 20)")
+    ap.add_argument("--think", type=float, default=2, help="tempo médio de leitura entre ações (s)")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--url", help="servidor já rodando (ex.: http://127.0.0.1:8501); sem CPU/RSS")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", type=Path, help="grava os resultados neste arquivo")
+    args = ap.parse_args(argv)
+
+    os.chdir(APP_PATH.parent)
+    levels = [int(x) for x in args.sessions.split(",") if x.strip()]
+    server = None
+    base = args.url.rstrip("/") if args.url else f"http://127.0.0.1:{args.port}"
+    if not args.url:
+        server = start_server(args.port)
+    try:
+        wait_healthy(base)
+        ws_url = base.replace("http", "ws", 1) + "/_stcore/stream"
+        pid = server.pid if server else None
+        slug = first_slug()
+        asyncio.run(warm_up(ws_url, slug))
+        idle = proc_stats(pid) if pid else None
+        results = []
+        print(f"{'sessões':>7} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'CPU %':>6} {'RSS MiB':>8} {'MiB/sessão':>10} {'erros':>5}")
+        for n in levels:
+            r = asyncio.run(run_level(ws_url, n, args.duration, args.think, slug, pid, args.seed))
+            r["rss_per_session_mib"] = (
+                round((r["rss_mib"] - idle[1] / 2**20) / n, 2) if r["rss_mib"] and idle else None
+            )
+            results.append(r)
+            fmt = lambda v: "-" if v is None else v
+            print(f"{n:>7} {r['reruns']:>7} {r['reruns_per_s']:>8} {fmt(r['p50_ms']):>8} {fmt(r['p99_ms']):>8} "
+                  f"{fmt(r['cpu_pct']):>6} {fmt(r['rss_mib']):>8} {fmt(r['rss_per_session_mib']):>10} {r['errors']:>5}")
+        if args.json:
+            args.json.parent.mkdir(parents=True, exist_ok=True)
+            args.json.write_text(json.dumps({"levels": results, "profiles": PROFILE_WEIGHTS}, indent=2), encoding="utf-8")
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
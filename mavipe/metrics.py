@@ -0,0 +1,362 @@
+# mavipe/metrics.py — métricas do processo no formato texto do Prometheus
+#
+# Contadores e histogramas em memória (por processo), alimentados pelo fim de cada rerun
+# (mavipe/profiler.py: rota, gatilho, tempo e bytes por seção, chamadas de as_data_uri()) e lidos
+# dos caches no momento da coleta (data URIs, cache compartilhado, fragmentos, sessões ativas).
+# O caminho recomendado é MAVIPE_METRICS_PORT: um exportador local (127.0.0.1), fora da porta do
+# app, em qualquer modo. O /metrics na porta pública do `streamlit run serve.py` só responde com
+# MAVIPE_METRICS_TOKEN (Authorization: Bearer) ou MAVIPE_METRICS_ALLOW (IPs/redes dos coletores);
+# sem nenhum dos dois devolve 404. MAVIPE_METRICS=0 desliga a coleta. Como as métricas são por
+# processo, cada worker da máquina sobe o seu exportador na primeira porta livre entre
+# MAVIPE_METRICS_PORT e MAVIPE_METRICS_PORT + MAVIPE_METRICS_PORT_SPAN - 1 (o coletor raspa a faixa).
+# Uso avulso (imprime as métricas do processo atual): python -m mavipe.metrics
+import hmac
+import ipaddress
+import logging
+import os
+import sys
+import threading
+
+METRICS_ENABLED = os.environ.get("MAVIPE_METRICS", "1") != "0"
+METRICS_PORT = int(os.environ.get("MAVIPE_METRICS_PORT", "0") or 0)
+METRICS_HOST = os.environ.get("MAVIPE_METRICS_HOST", "127.0.0.1")
+METRICS_PORT_SPAN = max(1, int(os.environ.get("MAVIPE_METRICS_PORT_SPAN", "16") or 1))
+METRICS_TOKEN = os.environ.get("MAVIPE_METRICS_TOKEN", "")
+METRICS_ALLOW = tuple(n.strip() for n in os.environ.get("MAVIPE_METRICS_ALLOW", "").split(",") if n.strip())
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+log = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _num(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_num(v)}" for k, v in items]
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = SECONDS_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple, list] = {}  # labels -> [contagem por bucket..., soma, total]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                s = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    s[i] += 1
+            s[-2] += value
+            s[-1] += 1
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(s)) for k, s in self._series.items())
+        out = []
+        for key, s in items:
+            for bound, n in zip(self.buckets + (float("inf"),), s[:len(self.buckets)] + [s[-1]]):
+                le = 'le="' + _num(bound) + '"'
+                out.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {n}")
+            out.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(round(s[-2], 6))}")
+            out.append(f"{self.name}_count{_labels(self.labelnames, key)} {s[-1]}")
+        return out
+
+class Registry:
+    """Métricas registradas + coletores chamados a cada leitura (valores que já vivem nos caches)."""
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn):
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        lines = []
+        for m in self._metrics:
+            lines += m.header() + m.samples()
+        for fn in self._collectors:
+            try:
+                metrics = fn()
+            except Exception:  # um coletor quebrado não derruba a página de métricas
+                continue
+            for m in metrics:
+                lines += m.header() + m.samples()
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+RERUNS = REGISTRY.register(Counter(
+    "mavipe_reruns_total", "Reruns do script por rota e gatilho (load, query_param, widget:<key>, rerun).",
+    ("route", "trigger")))
+RERUN_SECONDS = REGISTRY.register(Histogram(
+    "mavipe_rerun_seconds", "Tempo total do rerun.", ("route",)))
+RERUN_BYTES = REGISTRY.register(Histogram(
+    "mavipe_rerun_payload_bytes", "Bytes enviados ao navegador por rerun (markdown + imagens + HTML).",
+    ("route",), BYTES_BUCKETS))
+SECTION_SECONDS = REGISTRY.register(Histogram(
+    "mavipe_section_render_seconds", "Tempo de render por seção do app.py.", ("section",)))
+PAYLOAD_BYTES = REGISTRY.register(Counter(
+    "mavipe_payload_bytes_total", "Bytes enviados ao navegador por seção e tipo (markdown, image, html).",
+    ("section", "kind")))
+DATA_URI_CALLS = REGISTRY.register(Counter(
+    "mavipe_data_uri_calls_total", "Chamadas de as_data_uri() por seção.", ("section",)))
+DATA_URI_BYTES = REGISTRY.register(Counter(
+    "mavipe_data_uri_bytes_total", "Bytes de data URI devolvidos por as_data_uri() por seção.", ("section",)))
+FS_PROBES = REGISTRY.register(Counter(
+    "mavipe_fs_probes_total", "Sondagens de disco (stat/scandir/leitura) por seção.", ("section",)))
+ARTICLE_VIEWS = REGISTRY.register(Counter(
+    "mavipe_article_views_total", "Aberturas de artigo (?news=<slug>) por slug.", ("slug",)))
+
+def observe_render(rec: dict) -> None:
+    """Fim de um rerun medido (registro do profiler) -> contadores e histogramas."""
+    if not METRICS_ENABLED:
+        return
+    route, sections = rec["route"], rec["sections"]
+    RERUNS.inc(route=route, trigger=rec["trigger"])
+    RERUN_SECONDS.observe(rec["total_ms"] / 1000, route=route)
+    RERUN_BYTES.observe(sum(s["markdown_bytes"] + s["image_bytes"] + s["html_bytes"] for s in sections), route=route)
+    for s in sections:
+        name = s["name"]
+        SECTION_SECONDS.observe(s["ms"] / 1000, section=name)
+        for kind in ("markdown", "image", "html"):
+            if s[f"{kind}_bytes"]:
+                PAYLOAD_BYTES.inc(s[f"{kind}_bytes"], section=name, kind=kind)
+        if s["data_uri_calls"]:
+            DATA_URI_CALLS.inc(s["data_uri_calls"], section=name)
+            DATA_URI_BYTES.inc(s["data_uri_bytes"], section=name)
+        if s["fs_probes"]:
+            FS_PROBES.inc(s["fs_probes"], section=name)
+
+def record_article_view(slug: str) -> None:
+    if METRICS_ENABLED:
+        ARTICLE_VIEWS.inc(slug=slug)
+
+# ================== COLETORES (lidos a cada coleta) ==================
+def _cache_metrics(prefix: str, help: str, stats: dict) -> list[Metric]:
+    hits = Counter(f"{prefix}_hits_total", f"Acertos do {help}.")
+    misses = Counter(f"{prefix}_misses_total", f"Faltas do {help}.")
+    ratio = Gauge(f"{prefix}_hit_ratio", f"Acertos / consultas do {help}.")
+    hits.inc(stats["hits"])
+    misses.inc(stats["misses"])
+    ratio.set(round(stats["hit_ratio"], 6))
+    return [hits, misses, ratio]
+
+@REGISTRY.collector
+def _asset_caches() -> list[Metric]:
+    from mavipe.assets import DATA_URI_CACHE
+    from mavipe.shared_cache import SHARED_CACHE
+
+    uri = DATA_URI_CACHE.stats()
+    out = _cache_metrics("mavipe_data_uri_cache", "cache de data URIs em memória", uri)
+    size = Gauge("mavipe_data_uri_cache_bytes", "Bytes das strings no cache de data URIs.")
+    size.set(uri["bytes"])
+    reads = Counter("mavipe_data_uri_blob_reads_total", "Blobs do cache em disco lidos por este processo.")
+    reads.inc(uri["blob_reads"])
+    encoded = Counter("mavipe_data_uri_encoded_bytes_total", "Bytes codificados em base64 por este processo.")
+    encoded.inc(uri["encoded_bytes"])
+    evictions = Counter("mavipe_data_uri_cache_evictions_total", "Remoções do cache de data URIs (LRU).")
+    evictions.inc(uri["evictions"])
+    out += [size, reads, encoded, evictions]
+    if SHARED_CACHE.enabled:
+        out += _cache_metrics("mavipe_shared_cache", "cache de assets codificados em disco", SHARED_CACHE.stats())
+    return out
+
+@REGISTRY.collector
+def _fragment_cache() -> list[Metric]:
+    from mavipe.fragments import FRAGMENT_CACHE
+
+    stats = FRAGMENT_CACHE.stats()
+    hits = Counter("mavipe_fragment_cache_hits_total", "Acertos do cache de fragmentos HTML.", ("fragment",))
+    misses = Counter("mavipe_fragment_cache_misses_total", "Faltas do cache de fragmentos HTML.", ("fragment",))
+    for name, s in stats.items():
+        hits.inc(s["hits"], fragment=name)
+        misses.inc(s["misses"], fragment=name)
+    return [hits, misses]
+
+@REGISTRY.collector
+def _sessions() -> list[Metric]:
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return []
+    # sem API pública para a contagem de sessões: se o atributo privado sumir numa versão nova
+    # do Streamlit, o gauge só deixa de aparecer
+    mgr = getattr(Runtime.instance(), "_session_mgr", None)
+    count = getattr(mgr, "num_active_sessions", None)
+    if not callable(count):
+        return []
+    try:
+        n = int(count())
+    except Exception:
+        return []
+    active = Gauge("mavipe_active_sessions", "Sessões Streamlit com websocket conectado.")
+    active.set(n)
+    return [active]
+
+@REGISTRY.collector
+def _warmup() -> list[Metric]:
+    from mavipe.warmup import WARMUP
+
+    report = WARMUP.report()
+    ready = Gauge("mavipe_warmup_ready", "1 depois do aquecimento do processo (mesmo degradado).")
+    ready.set(1 if report["ready"] else 0)
+    failed = Gauge("mavipe_warmup_failed_stages", "Etapas do aquecimento com erro, refeitas em segundo plano.")
+    failed.set(len(report["failed_stages"]))
+    stages = Gauge("mavipe_warmup_stage_seconds", "Duração de cada etapa do aquecimento.", ("stage",))
+    for s in report["stages"]:
+        stages.set(s["ms"] / 1000, stage=s["name"])
+    return [ready, failed, stages]
+
+def render() -> str:
+    return REGISTRY.render()
+
+# ================== SERVIDOR ==================
+def token_ok(authorization: str | None) -> bool:
+    return bool(METRICS_TOKEN) and hmac.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}")
+
+def client_allowed(host: str | None) -> bool:
+    try:
+        ip = ipaddress.ip_address(host or "")
+    except ValueError:
+        return False
+    for net in METRICS_ALLOW:
+        try:
+            if ip in ipaddress.ip_network(net, strict=False):
+                return True
+        except ValueError:
+            continue
+    return False
+
+def routes() -> list:
+    """/metrics para o st.App (serve.py), só com token ou allow-list configurados."""
+    from starlette.responses import PlainTextResponse, Response
+    from starlette.routing import Route
+
+    async def metrics(request):
+        if not (METRICS_TOKEN or METRICS_ALLOW):
+            return PlainTextResponse("use MAVIPE_METRICS_PORT\n", status_code=404)
+        if METRICS_TOKEN:
+            ok = token_ok(request.headers.get("authorization"))
+        else:
+            ok = client_allowed(request.client.host if request.client else None)
+        if not ok:
+            return PlainTextResponse("forbidden\n", status_code=403)
+        return Response(render(), media_type=CONTENT_TYPE)
+
+    return [Route("/metrics", metrics)]
+
+_exporter_lock = threading.Lock()
+_exporter = None
+
+def start_exporter(port: int = METRICS_PORT, host: str = METRICS_HOST, span: int = METRICS_PORT_SPAN):
+    """Exportador HTTP numa porta própria (uma vez por processo); port 0 não sobe nada.
+
+    Usa a primeira porta livre em [port, port + span): cada worker da máquina exporta as suas
+    métricas. Com MAVIPE_METRICS_TOKEN também exige o token.
+    """
+    global _exporter
+    if not (port and METRICS_ENABLED):
+        return None
+    with _exporter_lock:
+        if _exporter is not None:
+            return _exporter
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                if METRICS_TOKEN and not token_ok(self.headers.get("Authorization")):
+                    self.send_error(403)
+                    return
+                body = render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = None
+        for candidate in range(port, port + span):
+            try:
+                server = ThreadingHTTPServer((host, candidate), Handler)
+                break
+            except OSError:  # porta ocupada (outro worker na mesma máquina): tenta a próxima
+                continue
+        if server is None:
+            log.warning("métricas deste processo (pid %d) não exportadas: portas %d-%d ocupadas em %s",
+                        os.getpid(), port, port + span - 1, host)
+            return None
+        log.info("métricas do pid %d em http://%s:%d/metrics", os.getpid(), host, server.server_address[1])
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="mavipe-metrics", daemon=True).start()
+        _exporter = server
+        return server
+
+def main(argv: list[str]) -> int:
+    sys.stdout.write(render())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,159 @@
+# mavipe/newsroom.py — newsroom indexada em SQLite (listagem por data, índice de slugs, corpo sob demanda)
+#
+# O banco é montado a partir do manifesto da ingestão (mavipe/articles.py) e só é refeito quando
+# alguma fonte em articles/ muda; a listagem não carrega os corpos, que vêm do artefato por slug
+# (.cache/articles/<slug>.json) só quando o artigo abre.
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from mavipe.articles import ingest, read_artifact, sources_signature
+from mavipe.content import legacy_slugify
+
+NEWSROOM_DB_PATH = Path(os.environ.get("MAVIPE_NEWSROOM_DB", ".cache/newsroom.sqlite3"))
+NEWS_PAGE_SIZE = int(os.environ.get("MAVIPE_NEWS_PAGE_SIZE", "6"))
+LISTING_FIELDS = ("slug", "title", "date", "summary", "link", "image", "reading_min")
+
+SCHEMA = """
+CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE articles(
+    slug TEXT PRIMARY KEY,
+    legacy_slug TEXT,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    link TEXT NOT NULL DEFAULT '',
+    image TEXT,
+    reading_min INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX articles_by_date ON articles(date DESC, slug);
+CREATE INDEX articles_by_legacy_slug ON articles(legacy_slug);
+"""
+
+class NewsroomStore:
+    def __init__(self, db_path: Path = NEWSROOM_DB_PATH):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._signature: str | None = None
+        self._pages: dict[tuple[int, int | None], list[dict]] = {}
+        self._count: int | None = None
+        self.builds = 0
+
+    # ---------- construção ----------
+    def source_signature(self) -> str:
+        return sources_signature()
+
+    def _build(self, signature: str) -> None:
+        manifest, _ = ingest()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.db_path.with_name(f".{self.db_path.name}.{os.getpid()}.tmp")
+        tmp.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.executescript(SCHEMA)
+            rows = []
+            for slug, e in manifest["entries"].items():
+                legacy = legacy_slugify(e["title"])
+                rows.append((
+                    slug, legacy if legacy != slug else None, e["title"], e["date"], e["summary"],
+                    e.get("link", ""), e.get("image"), e["reading_min"],
+                ))
+            conn.executemany("INSERT OR REPLACE INTO articles VALUES (?,?,?,?,?,?,?,?)", rows)
+            conn.execute("INSERT INTO meta VALUES ('signature', ?)", (signature,))
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp, self.db_path)
+        self.builds += 1
+
+    def _db_signature(self, conn: sqlite3.Connection) -> str | None:
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key='signature'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    def ensure_fresh(self) -> sqlite3.Connection:
+        signature = self.source_signature()
+        with self._lock:
+            if self._conn is not None and self._signature == signature:
+                return self._conn
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            conn = sqlite3.connect(self.db_path, check_same_thread=False) if self.db_path.exists() else None
+            if conn is None or self._db_signature(conn) != signature:
+                # outro processo pode já ter refeito o banco; senão, refaz aqui
+                if conn is not None:
+                    conn.close()
+                self._build(signature)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._conn = conn
+            self._signature = signature
+            self._pages = {}
+            self._count = None
+            return conn
+
+    # ---------- consultas ----------
+    def count(self) -> int:
+        with self._lock:
+            conn = self.ensure_fresh()
+            if self._count is None:
+                self._count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            return self._count
+
+    def page(self, page: int = 0, per_page: int | None = None) -> list[dict]:
+        """Itens da listagem (sem corpo), do mais recente para o mais antigo."""
+        with self._lock:
+            conn = self.ensure_fresh()
+            key = (page, per_page)
+            if key not in self._pages:
+                sql = f"SELECT {', '.join(LISTING_FIELDS)} FROM articles ORDER BY date DESC, slug"
+                params: tuple = ()
+                if per_page is not None:
+                    sql += " LIMIT ? OFFSET ?"
+                    params = (per_page, page * per_page)
+                self._pages[key] = [dict(r) for r in conn.execute(sql, params)]
+            return self._pages[key]
+
+    def listing(self) -> list[dict]:
+        return self.page(0, None)
+
+    def last_page(self, per_page: int = NEWS_PAGE_SIZE) -> int:
+        return max(0, (self.count() - 1) // per_page)
+
+    def pages_upto(self, last: int, per_page: int = NEWS_PAGE_SIZE) -> list[dict]:
+        """Páginas 0..last concatenadas (o "carregar mais" da grade)."""
+        last = min(max(0, last), self.last_page(per_page))
+        return [it for p in range(last + 1) for it in self.page(p, per_page)]
+
+    def get(self, slug: str | None) -> dict | None:
+        """Item da listagem pelo slug (aceita também o slug antigo, sem dobra de acentos)."""
+        if not slug:
+            return None
+        with self._lock:
+            conn = self.ensure_fresh()
+            row = conn.execute(
+                f"SELECT {', '.join(LISTING_FIELDS)} FROM articles WHERE slug = ? OR legacy_slug = ? "
+                "ORDER BY slug = ? DESC LIMIT 1",
+                (slug, slug, slug),
+            ).fetchone()
+            return dict(row) if row else None
+
+    def documents(self) -> list[dict]:
+        """Todos os artigos com corpo (para indexação; não usar na renderização)."""
+        return [{**it, "body": self.body(it["slug"])} for it in self.listing()]
+
+    def body(self, slug: str) -> str | None:
+        """HTML sanitizado do artigo: uma leitura do artefato compacto do slug."""
+        self.ensure_fresh()
+        art = read_artifact(slug)
+        if art is None:  # .cache/articles apagado com o banco ainda válido: recompila o que faltar
+            ingest()
+            art = read_artifact(slug)
+        return art["html"] if art else None
+
+NEWSROOM = NewsroomStore()
@@ -0,0 +1,260 @@
+# mavipe/profiler.py — tempo e bytes por seção do app.py (overlay em ?debug=perf + log JSONL)
+#
+# Overlay só com ?debug=perf na URL; log só com ele ou MAVIPE_PERF=1. Com as métricas ligadas
+# (mavipe/metrics.py, padrão) todo rerun é medido e só alimenta os contadores, sem log.
+# Bytes de markdown/imagem/iframe vêm das mensagens que a própria sessão envia: durante um rerun
+# medido o perfil intercepta o enqueue do ScriptRunContext dessa sessão (nenhuma função do st é
+# trocada no processo); chamadas de as_data_uri() e sondagens de disco vêm dos contadores por
+# thread de mavipe/assets.py. O estado para detectar o gatilho fica num mapa por sessão aqui, não
+# no session_state. Rerun só de um fragmento
+# (st.fragment) vira um registro próprio com route "<rota>#<seção>". Dentro de capture_payloads()
+# cada registro leva também o conteúdo enviado por seção (usado por mavipe/budget.py).
+import html
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+from mavipe.assets import IO_COUNTERS
+from mavipe.metrics import METRICS_ENABLED, observe_render
+
+PERF_LOG_PATH = Path(os.environ.get("MAVIPE_PERF_LOG", ".cache/perf.jsonl"))
+PERF_ALWAYS = os.environ.get("MAVIPE_PERF", "0") == "1"
+
+COUNTERS = ("markdown_bytes", "image_bytes", "html_bytes")
+# tipo do elemento no ForwardMsg -> contador (widgets, títulos etc. não entram)
+ELEMENT_COUNTERS = {"markdown": "markdown_bytes", "imgs": "image_bytes", "iframe": "html_bytes", "html": "html_bytes"}
+MAX_TRACKED_SESSIONS = 1024
+
+_log_lock = threading.Lock()
+_capture: list | None = None  # ativo em capture_payloads(): recebe registro + conteúdo de cada rerun
+_prev_lock = threading.Lock()
+_prev: OrderedDict[str, tuple[dict, dict]] = OrderedDict()  # sessão -> (query params, widgets) do run anterior
+
+def _io() -> tuple[int, int, int]:
+    return IO_COUNTERS.data_uri_calls, IO_COUNTERS.data_uri_bytes, IO_COUNTERS.fs_probes
+
+class RenderProfile:
+    """Perfil de um rerun; `mark(nome)` fecha a seção atual e abre a próxima."""
+
+    def __init__(self, enabled: bool, route: str = "", trigger: str = "", overlay: bool = False,
+                 session: str = "", state=None, query_params: dict | None = None, log: bool = True,
+                 sink: list | None = None, ctx=None):
+        self.enabled = enabled
+        self.log = log
+        self._sink = sink
+        self.payloads: list[tuple[str, str, object]] = []  # (seção, contador, conteúdo) com sink
+        self._state = state
+        self._query_params = query_params
+        self.route = route
+        self.trigger = trigger
+        self.overlay = overlay
+        self.session = session
+        self.sections: list[dict] = []
+        self._open: dict | None = None
+        self._started = time.perf_counter()
+        self._ctx = ctx
+        if enabled and ctx is not None:
+            attach(ctx, self)
+
+    def mark(self, name: str) -> None:
+        if not self.enabled:
+            return
+        self._close()
+        calls, uri_bytes, probes = _io()
+        self._open = {
+            "name": name, "t0": time.perf_counter(), "calls0": calls, "uri0": uri_bytes, "probes0": probes,
+            **{c: 0 for c in COUNTERS},
+        }
+
+    def add_bytes(self, counter: str, n: int) -> None:
+        if self._open is not None:
+            self._open[counter] += n
+
+    def add_payload(self, counter: str, body) -> None:
+        if self._sink is not None:
+            self.payloads.append((self._open["name"] if self._open else "", counter, body))
+
+    def _close(self) -> None:
+        s = self._open
+        if s is None:
+            return
+        calls, uri_bytes, probes = _io()
+        self.sections.append({
+            "name": s["name"],
+            "ms": round((time.perf_counter() - s["t0"]) * 1000, 3),
+            **{c: s[c] for c in COUNTERS},
+            "data_uri_calls": calls - s["calls0"],
+            "data_uri_bytes": uri_bytes - s["uri0"],
+            "fs_probes": probes - s["probes0"],
+        })
+        self._open = None
+
+    def record(self) -> dict:
+        return {
+            "ts": round(time.time(), 3),
+            "session": self.session,
+            "route": self.route,
+            "trigger": self.trigger,
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "sections": self.sections,
+        }
+
+    def finish(self) -> str:
+        """Fecha o rerun, alimenta as métricas, grava a linha no log e devolve o HTML do overlay
+        ("" se desligado)."""
+        if not self.enabled:
+            return ""
+        self._close()
+        if self._ctx is not None:
+            detach(self._ctx, self)
+        if self._state is not None:
+            remember_state(self.session, self._state, self._query_params or {})
+        rec = self.record()
+        if self._sink is not None:
+            self._sink.append({**rec, "payloads": self.payloads})
+        observe_render(rec)
+        if self.log:
+            try:
+                append_log(rec)
+            except OSError:
+                pass
+        return overlay_html(rec) if self.overlay else ""
+
+def append_log(rec: dict, path: Path = PERF_LOG_PATH) -> None:
+    line = json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+    with _log_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+# ================== GATILHO DO RERUN ==================
+def _widget_values(session_state) -> dict:
+    return {k: v for k, v in session_state.items() if not str(k).startswith("_")}
+
+def remember_state(session: str, session_state, query_params: dict) -> None:
+    """Guarda query params e widgets no fim do run (os widgets já existem) para o próximo comparar."""
+    snapshot = (query_params, _widget_values(session_state))
+    with _prev_lock:
+        _prev[session] = snapshot
+        _prev.move_to_end(session)
+        while len(_prev) > MAX_TRACKED_SESSIONS:
+            _prev.popitem(last=False)
+
+def detect_trigger(session: str, session_state, query_params: dict) -> str:
+    """"load" (1º run da sessão), "query_param", "widget:<key>" ou "rerun" (sem mudança visível)."""
+    widgets = _widget_values(session_state)
+    with _prev_lock:
+        prev = _prev.get(session)
+    if prev is None:
+        return "load"
+    prev_qp, prev_widgets = prev
+    if prev_qp != query_params:
+        return "query_param"
+    changed = sorted(str(k) for k, v in widgets.items() if prev_widgets.get(k) != v)
+    return f"widget:{changed[0]}" if changed else "rerun"
+
+# ================== BYTES ENVIADOS ==================
+def _element_payload(element, kind: str):
+    if kind == "imgs":
+        return [img.url for img in element.imgs.imgs]
+    if kind == "iframe":
+        return element.iframe.srcdoc or element.iframe.src
+    return getattr(element, kind).body
+
+def _observe(profile: RenderProfile, msg) -> None:
+    if msg.WhichOneof("type") != "delta" or msg.delta.WhichOneof("type") != "new_element":
+        return
+    element = msg.delta.new_element
+    kind = element.WhichOneof("type")
+    counter = ELEMENT_COUNTERS.get(kind)
+    if counter is None:
+        return
+    profile.add_bytes(counter, msg.ByteSize())
+    if profile._sink is not None:
+        profile.add_payload(counter, _element_payload(element, kind))
+
+def attach(ctx, profile: RenderProfile) -> None:
+    """Mede as mensagens que esta sessão envia até detach(); só o ScriptRunContext dela muda."""
+    send = type(ctx).enqueue.__get__(ctx)  # o método original, mesmo se um run abortado deixou o gancho
+
+    def enqueue(msg):
+        try:
+            _observe(profile, msg)
+        except Exception:  # medição nunca derruba o rerun
+            pass
+        send(msg)
+
+    enqueue._mavipe_profile = profile
+    ctx.enqueue = enqueue
+
+def detach(ctx, profile: RenderProfile) -> None:
+    if getattr(ctx.__dict__.get("enqueue"), "_mavipe_profile", None) is profile:
+        del ctx.enqueue
+
+def in_fragment_rerun() -> bool:
+    """True num rerun só de st.fragment (o corpo do app.py não roda, só a seção)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return bool(ctx and ctx.fragment_ids_this_run)
+    except Exception:
+        return False
+
+@contextmanager
+def capture_payloads():
+    """Mede todo rerun do processo e junta os registros com o conteúdo enviado por seção."""
+    global _capture
+    sink: list[dict] = []
+    _capture = sink
+    try:
+        yield sink
+    finally:
+        _capture = None
+
+def start_profile(st, route: str, overlay: bool = False) -> RenderProfile:
+    if not (overlay or PERF_ALWAYS or METRICS_ENABLED or _capture is not None):
+        return RenderProfile(False)
+    try:
+        query_params = st.query_params.to_dict()
+    except Exception:
+        query_params = {}
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+    session = ctx.session_id[:8] if ctx else ""
+    trigger = detect_trigger(session, st.session_state, query_params)
+    return RenderProfile(True, route, trigger, overlay, session, st.session_state, query_params,
+                         log=overlay or PERF_ALWAYS, sink=_capture, ctx=ctx)
+
+# ================== OVERLAY ==================
+def _kb(n: int) -> str:
+    return f"{n / 1024:.1f}"
+
+def overlay_html(rec: dict) -> str:
+    rows = []
+    for s in rec["sections"]:
+        rows.append(
+            f"<tr><td>{html.escape(s['name'])}</td><td>{s['ms']:.1f}</td><td>{_kb(s['markdown_bytes'])}</td>"
+            f"<td>{_kb(s['image_bytes'] + s['html_bytes'])}</td><td>{s['data_uri_calls']}</td><td>{s['fs_probes']}</td></tr>"
+        )
+    total = {k: sum(s[k] for s in rec["sections"]) for k in ("markdown_bytes", "image_bytes", "html_bytes", "data_uri_calls", "fs_probes")}
+    return f"""
+<div class="perf-overlay" style="position:fixed; right:12px; bottom:12px; z-index:2000; max-width:92vw;
+  background:rgba(5,10,22,.92); color:#e6eefc; border:1px solid rgba(52,211,153,.5); border-radius:10px;
+  padding:10px 12px; font:12px/1.4 ui-monospace, monospace; box-shadow:0 8px 24px rgba(0,0,0,.45)">
+  <div style="margin-bottom:6px"><b>perf</b> · {html.escape(rec['route'])} · {html.escape(rec['trigger'])} ·
+    {rec['total_ms']:.1f} ms · sessão {html.escape(rec['session'])}</div>
+  <table style="border-collapse:collapse; color:inherit">
+    <tr style="color:#9fb0d4"><th align="left">seção</th><th>ms</th><th>md KB</th><th>img KB</th><th>data URI</th><th>fs</th></tr>
+    {"".join(rows)}
+    <tr style="border-top:1px solid rgba(255,255,255,.2)"><td>total</td><td>{rec['total_ms']:.1f}</td>
+      <td>{_kb(total['markdown_bytes'])}</td><td>{_kb(total['image_bytes'] + total['html_bytes'])}</td>
+      <td>{total['data_uri_calls']}</td><td>{total['fs_probes']}</td></tr>
+  </table>
+</div>"""
@@ -0,0 +1,182 @@
+# mavipe/search.py — busca da newsroom (?q=) sobre índice invertido pré-calculado
+#
+# Título, resumo e corpo (HTML sem tags) viram termos minúsculos e sem acento. O índice é montado
+# quando a newsroom carrega e, quando ela muda, só os artigos cujo conteúdo mudou são reindexados.
+import hashlib
+import html
+import math
+import re
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+from mavipe.content import fold_accents
+
+FIELD_WEIGHTS = {"title": 3.0, "summary": 2.0, "body": 1.0}
+SNIPPET_CHARS = 220
+MIN_PREFIX_LEN = 3
+
+STOPWORDS = frozenset("""
+a ao aos as com como da das de do dos e em na nas no nos o os ou para pela pelas pelo pelos
+por que se sem sua suas seu seus um uma umas uns
+""".split())
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TAG_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]+>", re.I | re.S)
+SPACE_RE = re.compile(r"\s+")
+
+def strip_html(s: str) -> str:
+    return SPACE_RE.sub(" ", html.unescape(TAG_RE.sub(" ", s or ""))).strip()
+
+def fold_char(c: str) -> str:
+    f = fold_accents(c)
+    return (f[:1] or c).lower()
+
+def fold(s: str) -> str:
+    """Minúsculas sem acento, caractere a caractere (mesmo comprimento do original)."""
+    return "".join(fold_char(c) for c in s)
+
+def terms(s: str) -> list[str]:
+    return [t for t in TOKEN_RE.findall(fold(s)) if t not in STOPWORDS]
+
+class Doc(NamedTuple):
+    digest: str
+    text: str                      # resumo + corpo em texto puro (para o trecho)
+    weights: dict[str, float]      # termo -> tf ponderado pelo campo
+    length: float
+
+class SearchHit(NamedTuple):
+    slug: str
+    score: float
+    snippet: str                   # HTML escapado com <mark> nos termos encontrados
+
+class SearchIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: dict[str, Doc] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._vocab: list[str] | None = None
+        self._source: str | None = None
+        self.indexed = 0
+
+    # ---------- construção ----------
+    def _add(self, slug: str, doc: Doc) -> None:
+        self._docs[slug] = doc
+        for term, w in doc.weights.items():
+            self._postings.setdefault(term, {})[slug] = w
+
+    def _remove(self, slug: str) -> None:
+        doc = self._docs.pop(slug, None)
+        if doc is None:
+            return
+        for term in doc.weights:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(slug, None)
+                if not posting:
+                    del self._postings[term]
+
+    def update(self, docs: list[dict]) -> int:
+        """Sincroniza com `docs` (slug/title/summary/body); devolve quantos foram (re)indexados."""
+        changed = 0
+        with self._lock:
+            seen = set()
+            for d in docs:
+                slug = d["slug"]
+                seen.add(slug)
+                fields = {"title": d["title"], "summary": d["summary"], "body": strip_html(d.get("body") or "")}
+                digest = hashlib.sha256("\0".join(fields.values()).encode("utf-8")).hexdigest()
+                old = self._docs.get(slug)
+                if old is not None and old.digest == digest:
+                    continue
+                weights: dict[str, float] = {}
+                for field, text in fields.items():
+                    for t in terms(text):
+                        weights[t] = weights.get(t, 0.0) + FIELD_WEIGHTS[field]
+                self._remove(slug)
+                text = " — ".join(v for v in (fields["summary"], fields["body"]) if v)
+                self._add(slug, Doc(digest, text, weights, sum(weights.values()) or 1.0))
+                changed += 1
+            for slug in [s for s in self._docs if s not in seen]:
+                self._remove(slug)
+                changed += 1
+            if changed:
+                self._vocab = None
+            self.indexed += changed
+        return changed
+
+    def sync(self, store) -> None:
+        """Reindexa a partir da NewsroomStore só quando a assinatura das fontes muda."""
+        signature = store.source_signature()
+        if signature == self._source:
+            return
+        self.update(store.documents())
+        self._source = signature
+
+    # ---------- consulta ----------
+    def _expand(self, term: str) -> list[str]:
+        if term in self._postings or len(term) < MIN_PREFIX_LEN:
+            return [term]
+        if self._vocab is None:
+            self._vocab = sorted(self._postings)
+        i = bisect_left(self._vocab, term)
+        out = []
+        while i < len(self._vocab) and self._vocab[i].startswith(term):
+            out.append(self._vocab[i])
+            i += 1
+        return out
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """Todos os termos precisam casar (sem casamento exato, vale o prefixo); ranking tf-idf."""
+        q = terms(query)
+        if not q:
+            return []
+        with self._lock:
+            n = len(self._docs)
+            scores: dict[str, float] | None = None
+            matched: set[str] = set()
+            for term in dict.fromkeys(q):
+                term_scores: dict[str, float] = {}
+                for t in self._expand(term):
+                    posting = self._postings.get(t, {})
+                    idf = math.log(1 + n / (1 + len(posting))) + 1
+                    for slug, w in posting.items():
+                        s = w * idf / math.sqrt(self._docs[slug].length)
+                        term_scores[slug] = max(term_scores.get(slug, 0.0), s)
+                    if posting:
+                        matched.add(t)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {s: v + term_scores[s] for s, v in scores.items() if s in term_scores}
+                if not scores:
+                    return []
+            ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+            return [SearchHit(slug, score, snippet(self._docs[slug].text, matched)) for slug, score in ranked]
+
+def snippet(text: str, matched: set[str], width: int = SNIPPET_CHARS) -> str:
+    folded = fold(text)
+    spans = [m.span() for m in TOKEN_RE.finditer(folded) if m.group() in matched]
+    start = 0
+    if spans:
+        start = max(0, spans[0][0] - width // 3)
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+    end = min(len(text), start + width)
+    while end < len(text) and not text[end].isspace():
+        end += 1
+    out, pos = [], start
+    for a, b in spans:
+        if a < start or b > end:
+            continue
+        out.append(html.escape(text[pos:a]))
+        out.append(f"<mark>{html.escape(text[a:b])}</mark>")
+        pos = b
+    out.append(html.escape(text[pos:end]))
+    return ("… " if start > 0 else "") + "".join(out) + (" …" if end < len(text) else "")
+
+SEARCH_INDEX = SearchIndex()
+
+def search_news(store, query: str, limit: int = 20) -> list[SearchHit]:
+    SEARCH_INDEX.sync(store)
+    return SEARCH_INDEX.search(query, limit)
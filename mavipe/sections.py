@@ -0,0 +1,523 @@
+# mavipe/sections.py — HTML das seções da landing (compartilhado por app.py e mavipe/export.py)
+#
+# Aqui ficam só as partes que são HTML puro; o layout em colunas/widgets do Streamlit
+# continua no app.py e o export monta o equivalente em CSS (EXPORT_CSS).
+import html
+from urllib.parse import quote
+
+from mavipe.content import (
+    MAVIPE_ADDRESS, MAVIPE_EMAIL, SECTORS, SECTOR_FALLBACK_ICONS, SOLUTIONS,
+    empresa_caption, gather_empresa_images, pick_logo_path, sector_icon_data_uri, sector_icon_path,
+    news_thumbnail_src,
+)
+from mavipe.assets import ASSET_INDEX, asset_key
+from mavipe.derivatives import avif_available, responsive_img
+from mavipe.fragments import cached_fragment
+from mavipe.hero import hero_media_html, hero_mode
+from mavipe.static_assets import asset_url, url_for
+
+# ================== CSS ==================
+# CRITICAL_CSS (navbar + hero) vai inline; o resto entra no bundle de mavipe/stylesheet.py
+CRITICAL_CSS = """html, body, [data-testid="stAppViewContainer"]{background:#0b1221; overflow-x:hidden;}
+#MainMenu, header, footer {visibility:hidden;}
+.block-container{padding:0!important; max-width:100%!important}
+
+/* Navbar */
+.navbar{
+  position:fixed; top:0; left:0; right:0; z-index:1000;
+  display:flex; justify-content:space-between; align-items:center;
+  height:64px; padding:8px 8px !important; overflow:visible;
+  background:rgba(8,16,33,.35); backdrop-filter:saturate(160%) blur(10px);
+  border-bottom:1px solid rgba(255,255,255,.08);
+}
+.nav-left{ position:relative; height:64px; display:flex; align-items:center; gap:12px; }
+.nav-right a{ color:#d6def5; text-decoration:none; margin-left:18px }
+
+/* Logo */
+.nav-logo{
+  position:relative; height:140px; width:auto; display:block;
+  transform:translateY(3px); image-rendering:auto;
+  filter:drop-shadow(0 4px 8px rgba(0,0,0,.45));
+  z-index:2;
+}
+
+/* Hero */
+.hero{position:relative; height:100vh; min-height:640px; width:100vw; left:50%; margin-left:-50vw; overflow:hidden}
+.hero iframe{position:absolute; top:50%; left:50%; width:177.777vw; height:100vh; transform:translate(-50%,-50%); pointer-events:none}
+.hero .overlay{position:absolute; inset:0; background:radial-gradient(85% 60% at 30% 30%, rgba(20,30,55,.0) 0%, rgba(8,16,33,.48) 68%, rgba(8,16,33,.86) 100%); z-index:1}
+.hero .content{position:absolute; z-index:2; inset:0; display:flex; align-items:center; padding:0 8vw; color:#e8eefc}
+.kicker{color:#cfe7ff; font-weight:600; margin-bottom:10px}
+h1.hero-title{font-size:clamp(36px,6vw,64px); line-height:1.05; margin:0 0 12px}
+.highlight{color:#34d399}
+.hero-sub{font-size:clamp(16px,2.2vw,20px); color:#b9c6e6; max-width:70ch; line-height:1.35; text-wrap:balance;}
+
+.cta, .btn{display:inline-block; padding:12px 18px; border-radius:12px; text-decoration:none; font-weight:700; margin-right:10px}
+.cta{background:#34d399; color:#05131a}
+.btn{border:1px solid rgba(255,255,255,.18); color:#e6eefc; background:rgba(255,255,255,.06)}
+.section{padding:72px 8vw; border-top:1px solid rgba(255,255,255,.07)}
+.lead{color:#b9c6e6}
+
+@media (max-width:768px){
+  .navbar, .nav-left{ height:56px; }
+  .nav-logo{ height:110px; transform:translateY(-10px); }
+  .hero iframe{width:177.777vh; height:100vh; max-width:300vw;}
+  .section{padding:56px 5vw;}
+}
+"""
+
+MAIN_CSS = """/* ===== Cards de Setores (com ícone) ===== */
+#setores.section h2{
+  color:#0b1221; font-size:2rem; font-weight:800; text-align:center; margin:0 0 .8rem;
+}
+#setores.section h2::after{
+  content:""; display:block; width:68px; height:3px; background:#4EA8DE; margin:.65rem auto 0; border-radius:3px;
+}
+#setores .subtitle{
+  color:#334155; text-align:center; font-size:1.05rem; margin:0 0 2rem 0; opacity:1;
+}
+.sector-card-grid{ display:grid; grid-template-columns:repeat(auto-fit,minmax(300px,1fr)); gap:24px; margin-top:1rem; }
+.sector-card{
+  background:#f8fafc; border:1px solid rgba(0,0,0,.06); border-radius:16px; padding:20px 22px;
+  box-shadow:0 10px 24px rgba(0,0,0,.08); transition:transform .2s, box-shadow .2s; color:#0b1221;
+}
+.sector-card:hover{ transform:translateY(-4px); box-shadow:0 14px 36px rgba(0,0,0,.12); }
+.sector-head{ display:flex; align-items:center; gap:12px; margin-bottom:8px; }
+.sector-icon{
+  flex:0 0 auto; width:56px; height:56px; border-radius:10px; display:flex; align-items:center; justify-content:center;
+  background:#fff; border:1px solid rgba(0,0,0,.08); overflow:hidden;
+}
+.sector-icon img, .sector-icon svg{ width:100% !important; height:100% !important; object-fit:contain; display:block; }
+.sector-icon span{ font-size:28px; line-height:1; }
+.sector-card h3{ margin:0; font-size:1.3rem; font-weight:800; color:#0b1221; }
+.sector-card p{ color:#334155; margin:.3rem 0 .6rem 0; }
+.sector-card ul{ margin:0; padding-left:1.2rem; list-style:disc; color:#475569; }
+.sector-card li{ margin:.45rem 0; font-size:.97rem; }
+
+/* SOLUÇÃO */
+.dap-img{width:100%; height:auto; display:block}
+.dap-cap{color:#64748b; font-size:.85rem; text-align:center; margin-top:6px}
+
+/* APLICAÇÕES */
+.sol-img{
+  width:100%; max-width:520px; height:auto; border-radius:12px;
+  box-shadow:0 8px 24px rgba(0,0,0,.10); display:block; margin:0 auto;
+  transition: box-shadow 0.45s ease;
+}
+.zoom-link:hover .sol-img{box-shadow:0 18px 44px rgba(0,0,0,.30);}
+.sol-cap{text-align:center;color:#334155;font-size:0.92rem;margin-top:8px;}
+.sol-title{font-weight:800;font-size:1.15rem;color:#0b1221;margin:0 0 6px;}
+.sol-text{font-size:0.98rem;line-height:1.55;color:#334155;margin:6px 0 0;}
+.sol-box{padding:24px 0;border-bottom:1px dashed rgba(0,0,0,.08);}
+
+/* DEEP ZOOM (link da prévia e página ?zoom=) */
+.zoom-link{position:relative; display:block; width:fit-content; max-width:100%; margin:0 auto; cursor:zoom-in; text-decoration:none}
+.zoom-link::after{content:"🔍 Ampliar"; position:absolute; right:12px; bottom:12px; padding:3px 10px; border-radius:8px;
+  background:rgba(8,16,33,.75); color:#e6eefc; font-size:.8rem; opacity:0; transition:opacity .25s ease}
+.zoom-link:hover::after, .zoom-link:focus-visible::after{opacity:1}
+.zoom-more{color:#0f766e; font-weight:600; text-decoration:none}
+.zoom-title{margin:8px 0 12px}
+.zoom-fallback{width:100%; height:auto; border-radius:12px}
+.zoom-note{margin:8px 0 0; font-size:.9rem; opacity:.75}
+
+/* Responsivo */
+@media (max-width:980px){
+  .sector-card-grid{ grid-template-columns:1fr; }
+}
+"""
+
+PARTNERS_CSS = """.parcases-img{
+  width:50%; max-width:520px; height:auto; border-radius:12px;
+  box-shadow:0 8px 24px rgba(0,0,0,.12); display:block; margin:0 auto;
+}
+.parcapes-caption{ text-align:center; color:#0b1221; font-size:0.95rem; margin-top:10px; line-height:1.4; }
+"""
+
+NEWSROOM_CSS = """.news-grid { display:grid; grid-template-columns:repeat(auto-fit, minmax(360px,1fr)); gap:20px; margin-top:18px; }
+.news-card { background:rgba(255,255,255,.02); border:1px solid rgba(255,255,255,.08);
+  border-radius:14px; overflow:hidden; display:flex; flex-direction:column;
+  box-shadow:0 6px 18px rgba(0,0,0,.25); transition:transform .2s ease; }
+.news-card:hover { transform:translateY(-3px); }
+.news-thumb { width:100%; height:180px; background:#ffffff; overflow:hidden; }
+.news-thumb img { width:100%; height:100%; object-fit:contain; display:block; }
+.news-body { padding:14px 16px; flex-grow:1; }
+.news-title { color:#e6eefc; font-weight:700; margin:0 0 6px; font-size:1rem; }
+.news-meta { color:#9fb0d4; font-size:.85rem; margin-bottom:8px; }
+.news-summary { color:#cbd6f2; font-size:.94rem; margin-bottom:14px; line-height:1.4; }
+.news-actions { padding:0 16px 14px 16px; display:flex; gap:10px; flex-wrap:wrap; }
+.button-primary { display:inline-block; padding:10px 14px; border-radius:10px;
+  text-decoration:none; background:#34d399; color:#05131a; font-weight:700; }
+.article-wrap { max-width:1000px; margin:8px auto 24px auto; background:rgba(255,255,255,.02);
+  border:1px solid rgba(255,255,255,.08); border-radius:14px; box-shadow:0 6px 18px rgba(0,0,0,.25); }
+.article-hero { width:100%; height:320px; background:#fff; overflow:hidden;
+  border-top-left-radius:14px; border-top-right-radius:14px; }
+.article-hero img { width:100%; height:100%; object-fit:contain; }
+.article-body { padding:22px 26px 26px 26px; }
+.article-title { margin:0; color:#e6eefc; font-size:1.6rem; font-weight:800; }
+.article-meta { color:#9fb0d4; margin:6px 0 16px 0; }
+.article-text { color:#cbd6f2; font-size:1.05rem; line-height:1.6; }
+.backlink { text-decoration:none; color:#9fb0d4; }
+.news-pager { display:flex; align-items:center; justify-content:center; gap:16px; margin:22px 0 6px; }
+.news-count { color:#9fb0d4; font-size:.9rem; }
+.news-search { display:flex; gap:10px; margin-top:8px; max-width:560px; }
+.news-search input { flex:1; background:rgba(255,255,255,.06); color:#e6eefc; border:1px solid rgba(255,255,255,.18);
+  border-radius:10px; padding:9px 12px; font:inherit; }
+.news-search button { background:#34d399; color:#05131a; font-weight:700; border:0; border-radius:10px; padding:9px 14px; cursor:pointer; }
+.news-summary mark { background:rgba(52,211,153,.25); color:#e6eefc; border-radius:3px; padding:0 2px; }
+"""
+
+CONTACT_CSS = """.contact-card{ margin-top:18px; padding:16px 18px; border-radius:12px;
+  background:rgba(255,255,255,.06); border:1px solid rgba(255,255,255,.18);
+  box-shadow:0 8px 24px rgba(0,0,0,.35); color:#e6eefc; }
+.contact-card h4{ margin:0 0 8px 0; font-size:1.05rem; font-weight:800; color:#fff; }
+.contact-item{ margin:.25rem 0; color:#cbd6f2; }
+.contact-item a{ color:#9fd8c8; text-decoration:none; }
+.contact-item a:hover{ text-decoration:underline; }
+"""
+
+def style_tag(css: str) -> str:
+    return f"<style>\n{css}</style>"
+
+# Versão de um asset para as chaves do cache de fragmentos: muda quando o arquivo muda
+def asset_version(path_str: str | None) -> list | None:
+    st = ASSET_INDEX.stat(path_str) if path_str else None
+    return [asset_key(path_str), st.size, st.mtime_ns] if st else None
+
+def url_context() -> list:
+    return [url_for(""), avif_available()]
+
+# ================== NAVBAR / HERO ==================
+NAV_LINKS = [
+    ("empresa", "Empresa"), ("solucao", "Solução"), ("setores", "Setores & Aplicações"),
+    ("parceiros", "Parceiros"), ("newsroom", "Imprensa"),
+]
+
+def logo_tag() -> str:
+    logo_path = pick_logo_path()
+    return (
+        responsive_img(logo_path, "nav-logo", "nav-logo", "MAVIPE logo") if logo_path
+        else '<div class="brand" style="color:#e6eefc; font-weight:700">MAVIPE</div>'
+    )
+
+def navbar_html(home_href: str = "") -> str:
+    """`home_href` prefixa as âncoras (ex.: "./" na rota de artigo, que não tem as seções)."""
+    links = "\n".join(f'    <a href="{home_href}#{anchor}">{label}</a>' for anchor, label in NAV_LINKS)
+    return f'''
+<div class="navbar">
+  <div class="nav-left">{logo_tag()}</div>
+  <div class="nav-right">
+{links}
+    <a class="cta" href="{home_href}#contato" style="background:#34d399; color:#05131a; font-weight:700; padding:10px 14px; border-radius:10px; text-decoration:none">Contato</a>
+  </div>
+</div>
+'''
+
+def hero_html(mode: str | None = None) -> str:
+    """HERO com o vídeo de fundo; `mode` sobrepõe MAVIPE_HERO_VIDEO (facade/poster/iframe)."""
+    return f'''
+<div class="hero">
+  {hero_media_html(hero_mode(mode))}
+  <div class="overlay"></div>
+  <div class="content">
+    <div>
+      <div class="kicker">Monitoramento de Metano • Detecção de Mudanças • Monitoramento Terrestre e Marítimo • Imagens ópticas e SAR de alta resolução</div>
+      <h1 class="hero-title">Transformando dados geoespaciais em <span class="highlight">informações acionáveis</span></h1>
+      <div class="hero-sub">
+        A MAVIPE integra <b>IA</b>, <b>imagens de satélite</b> (ópticas e SAR), <b>dados operacionais de inteligência</b> e <b>dados meteoceanográficos</b> para entregar <b>informações confiáveis</b> de monitoramento por satélite para os setores <b>ambiental</b>, <b>petróleo e gás</b> e <b>defesa e segurança</b>.
+      </div>
+    </div>
+  </div>
+</div>
+'''
+
+# ================== EMPRESA / SOLUÇÃO ==================
+def empresa_frames(start_idx: int = 0) -> tuple[list[str], list[str]]:
+    """Quadros (<img> responsivas) e legendas do carrossel; só o quadro inicial carrega de imediato."""
+    imgs = gather_empresa_images(max_n=2)
+    n = len(imgs)
+    frames = [
+        responsive_img(p, "carousel", "carousel-main", f"Empresa {i+1}/{n}",
+                       "" if i == start_idx % n else 'loading="lazy"')
+        for i, p in enumerate(imgs)
+    ]
+    captions = [empresa_caption(i, p) for i, p in enumerate(imgs)]
+    return frames, captions
+
+EMPRESA_TITLE_HTML = "<h1 style='font-size:2.2rem; font-weight:700; color:#00E3A5; margin-bottom:12px;'>MAVIPE Sistemas Espaciais</h1>"
+
+EMPRESA_TEXT_HTML = """
+<p style="color:#b9c6e6; line-height:1.6; font-size:1rem; text-align:justify;">
+A <b>MAVIPE Sistemas Espaciais</b> é uma empresa de base tecnológica que emprega soluções próprias, no <b>estado-da-arte</b>, baseadas em <b>IA</b>, <b>aprendizado de máquinas</b> e <b>dados operacionais de inteligência</b> para a realização de <b>monitoramentos por satélite</b> em ambientes terrestre e marítimo.
+</p>
+<p style="color:#b9c6e6; line-height:1.6; font-size:1rem; text-align:justify;">
+Seus profissionais possuem anos de experiência em <b>centros de operações espaciais</b>, P&D e gestão de ativos. Expertise em <b>meio ambiente</b>, <b>petróleo & gás</b> e <b>defesa & segurança</b>.
+</p>
+"""
+
+LINKEDIN_LINK_HTML = (
+    '<p style="text-align:center; margin:16px 0;">'
+    '<a href="https://www.linkedin.com/company/mavipe" target="_blank" rel="noopener" '
+    'style="color:#9fc6ff; text-decoration:underline; font-weight:600;">'
+    'LinkedIn da MAVIPE</a></p>'
+)
+
+SOLUCAO_HEADER_HTML = """
+<div class="section" style="background:#ffffff; color:#0b1221; border-top:1px solid rgba(0,0,0,.06); padding:24px 8vw;">
+  <h2 style="margin:0 0 8px;">Solução</h2>
+</div>
+"""
+
+DAP_ATLAS_TEXT_HTML = """
+<div style="padding-right:2vw;">
+  <h2 style="margin:0 0 10px; color:#00E3A5; font-weight:800;">Plataforma Geoespacial DAP ATLAS</h2>
+  <p class="lead" style="margin:0 0 14px;">
+    É o pilar central das aplicações desenvolvidas pela MAVIPE Sistemas Espaciais — uma plataforma geointeligente que transforma imagens de satélite em decisões rápidas, seguras e estratégicas.Originalmente concebida para operações ISR (Intelligence, Surveillance & Reconnaissance) e apoio a centros de comando e controle (C2), a plataforma evoluiu para atender também aos setores de energia, meio ambiente, infraestrutura, logística e petróleo & gás.
+  </p>
+  <ul style="color:#334155; margin:0 0 0 1.1rem; line-height:1.5">
+    <li><b>Tecnologias empregadas:</b> Inteligência Artificial, Aprendizado de Máquina e Métodos Estatísticos Tradicionais.</li>
+    <li><b>Entregáveis:</b> Análises, Dados e Insights Acionáveis para Apoiar Decisões de Gestores e Autoridades.</li>
+  </ul>
+</div>
+"""
+
+DAP_ATLAS_IMG = "dap_atlas_mock.png"
+DAP_ATLAS_CAPTION = "Interface simulada da Plataforma DAP ATLAS"
+
+GEOPORTAL_IMG = "geoportal1.png"
+GEOPORTAL_CAPTION = "Geoportal DAP ATLAS"
+
+def dap_atlas_html(href_for=None) -> str | None:
+    if not ASSET_INDEX.has(DAP_ATLAS_IMG):
+        return None
+    href_for = href_for or zoom_href
+    geoportal = ASSET_INDEX.has(GEOPORTAL_IMG)
+    inputs = {
+        "img": asset_version(DAP_ATLAS_IMG), "urls": url_context(),
+        "hrefs": [href_for(DAP_ATLAS_IMG), href_for(GEOPORTAL_IMG) if geoportal else None],
+    }
+    return cached_fragment("dap_atlas", inputs, lambda: _dap_atlas_html(href_for, geoportal))
+
+def _dap_atlas_html(href_for, geoportal: bool) -> str:
+    img = responsive_img(DAP_ATLAS_IMG, "sol-img", "dap-img", DAP_ATLAS_CAPTION, placeholder=True)
+    more = ""
+    if geoportal:  # captura grande demais para a landing: só pelo visualizador
+        href = html.escape(href_for(GEOPORTAL_IMG), quote=True)
+        more = f"<div class='dap-cap'><a class='zoom-more' href='{href}'>🔍 Explorar o {GEOPORTAL_CAPTION} em alta resolução</a></div>"
+    return zoom_link_html(DAP_ATLAS_IMG, img, href_for) + f"<div class='dap-cap'>{DAP_ATLAS_CAPTION}</div>" + more
+
+# ================== SETORES & APLICAÇÕES ==================
+SETORES_OPEN_HTML = '<div id="setores" class="section" style="background:#ffffff; color:#0b1221; border-top:1px solid rgba(0,0,0,.06); padding:48px 8vw;">'
+SETORES_TITLE_HTML = '<h2>Setores & Aplicações</h2>'
+SETORES_SUBTITLE_HTML = '<p class="subtitle">Óleo &amp; Gás • Defesa &amp; Segurança • Monitoramento Ambiental</p>'
+APLICACOES_HEADER_HTML = (
+    "<hr style='margin:3rem 0; border:0; border-top:1px solid rgba(0,0,0,.08);'/>"
+    "<h3 style='text-align:center; font-weight:700; color:#0b1221;'>Aplicações</h3>"
+)
+
+# ---- Grid dos Setores (sem indentação para não virar code-block) ----
+def sector_grid_html() -> str:
+    inputs = {
+        "sectors": SECTORS,
+        "icons": [asset_version(sector_icon_path(s["slug"])) for s in SECTORS],
+        "urls": url_context(),
+    }
+    return cached_fragment("sector_grid", inputs, _sector_grid_html)
+
+def _sector_grid_html() -> str:
+    cards_html = ['<div class="sector-card-grid">']
+    for s in SECTORS:
+        data_uri = sector_icon_data_uri(s["slug"])
+        icon_html = (
+            f'<div class="sector-icon"><img src="{data_uri}" alt="{s["slug"]}"/></div>'
+            if data_uri else
+            f'<div class="sector-icon"><span>{SECTOR_FALLBACK_ICONS.get(s["slug"], "📡")}</span></div>'
+        )
+        bullets = "".join(f"<li>{b}</li>" for b in s["bullets"])
+        cards_html.append(
+            f'<div id="{s["slug"]}" class="sector-card">'
+            f'<div class="sector-head">{icon_html}<h3>{s["title"]}</h3></div>'
+            f'<p>{s["desc"]}</p>'
+            f'<ul>{bullets}</ul>'
+            f'</div>'
+        )
+    cards_html.append('</div>')
+    return "".join(cards_html)
+
+def solution_image_html(s: dict, href_for=None) -> str | None:
+    if not ASSET_INDEX.has(s["img"]):
+        return None
+    href_for = href_for or zoom_href
+    inputs = {"solution": s, "img": asset_version(s["img"]), "urls": url_context(), "href": href_for(s["img"])}
+    return cached_fragment("solution_image", inputs, lambda: _solution_image_html(s, href_for))
+
+def _solution_image_html(s: dict, href_for) -> str:
+    img_dir_class = "sol-left" if not s["reverse"] else "sol-right"
+    img = responsive_img(s["img"], "sol-img", f"sol-img {img_dir_class}", s["title"], placeholder=True)
+    return zoom_link_html(s["img"], img, href_for) + f"<div class='sol-cap'>{s['caption']}</div>"
+
+def solution_text_html(s: dict) -> str:
+    return cached_fragment("solution_text", s, lambda: _solution_text_html(s))
+
+def _solution_text_html(s: dict) -> str:
+    return f"<div class='sol-title'>{s['title']}</div><div class='sol-text'>{s['desc']}</div>"
+
+# ================== DEEP ZOOM ==================
+def zoom_images() -> dict[str, dict]:
+    """Imagens com visualizador deep zoom (?zoom=<arquivo>) -> título e âncora de volta."""
+    images = {s["img"]: {"title": s["title"], "anchor": "setores"} for s in SOLUTIONS}
+    images[DAP_ATLAS_IMG] = {"title": DAP_ATLAS_CAPTION, "anchor": "solucao"}
+    images[GEOPORTAL_IMG] = {"title": GEOPORTAL_CAPTION, "anchor": "solucao"}
+    return {name: meta for name, meta in images.items() if ASSET_INDEX.has(name)}
+
+def zoom_href(name: str) -> str:
+    return f"?zoom={quote(name)}"
+
+def zoom_link_html(name: str, inner: str, href_for=zoom_href) -> str:
+    href = html.escape(href_for(name), quote=True)
+    return f'<a class="zoom-link" href="{href}" title="Ampliar">{inner}</a>'
+
+def zoom_header_html(title: str, back_href: str) -> str:
+    return (
+        f'<p><a class="backlink" href="{back_href}">← Voltar</a></p>'
+        f'<h2 class="zoom-title">{html.escape(title)}</h2>'
+    )
+
+def zoom_fallback_html(name: str, title: str, pending: bool = False) -> str:
+    """Sem pirâmide (Pillow ausente / static desligado): a imagem inteira, responsiva. Com o corte
+    em andamento (pending), um <img> simples: nada de gerar derivados dentro do rerun."""
+    if not pending:
+        return responsive_img(name, "hero", "zoom-fallback", title)
+    return (
+        f'<img class="zoom-fallback" src="{asset_url(name)}" alt="{html.escape(title, quote=True)}"/>'
+        '<p class="zoom-note">Zoom em preparo: recarregue a página em alguns instantes.</p>'
+    )
+
+# ================== PARCEIROS ==================
+PARTNERS_IMG = "partners.png"
+
+PARTNERS_HEADER_HTML = """
+<div class="section partners-cases-section" style="background:#ffffff; color:#0b1221; border-top:1px solid rgba(0,0,0,.06); padding:16px 8vw;">
+<h2 style="margin-top:0; margin-bottom:8px;">Parceiros</h2>
+</div>
+"""
+
+def partners_html() -> str | None:
+    if not ASSET_INDEX.has(PARTNERS_IMG):
+        return None
+    inputs = {"img": asset_version(PARTNERS_IMG), "urls": url_context()}
+    return cached_fragment("partners", inputs, _partners_html)
+
+def _partners_html() -> str:
+    return (
+        responsive_img(PARTNERS_IMG, "partners", "parcases-img", "Parceiros — BlackSky & GHGSat", placeholder=True)
+        + "<div class='parcapes-caption'>Provedores de Dados Espaciais</div>"
+    )
+
+# ================== NEWSROOM ==================
+def article_href(slug: str) -> str:
+    return f"?news={slug}#newsroom"
+
+NEWS_RESULTS_EAGER = 3
+
+def news_page_href(page: int) -> str:
+    return f"?news_page={page}#newsroom"
+
+def news_card_html(item: dict, href: str, lazy: bool = False) -> str:
+    """Card da grade; metadados vêm como texto puro e são escapados aqui (`summary_html`, se
+    presente, já é HTML seguro: o trecho destacado da busca)."""
+    summary = item.get("summary_html") or html.escape(item["summary"])
+    if item["image"] and ASSET_INDEX.has(item["image"]):
+        img = responsive_img(item["image"], "news-thumb", "news-thumb-img", "thumb", placeholder=lazy)
+        thumb = f"<div class='news-thumb'>{img}</div>"
+    else:
+        thumb = "<div class='news-thumb' style='background:#ffffff'></div>"
+    return f"""
+    <div class="news-card">
+      <a href="{href}" style="text-decoration:none;color:inherit">
+        {thumb}
+        <div class="news-body">
+          <div class="news-title">{html.escape(item['title'])}</div>
+          <div class="news-meta">{html.escape(item['date'])}</div>
+          <div class="news-summary">{summary}</div>
+        </div>
+      </a>
+      <div class="news-actions">
+        <a class="button-primary" href="{href}">Ler mais</a>
+      </div>
+    </div>
+    """.strip()
+
+# Grade principal da Newsroom
+def news_grid_html(items: list[dict], href_for=article_href, eager: int | None = None) -> str:
+    """Grade de cards; a partir do card `eager` as miniaturas usam loading="lazy"."""
+    hrefs = [href_for(item["slug"]) for item in items]
+    eager = len(items) if eager is None else eager
+    inputs = {
+        "items": items,
+        "hrefs": hrefs,
+        "eager": eager,
+        "images": [asset_version(item["image"]) for item in items],
+        "urls": url_context(),
+    }
+    return cached_fragment("news_grid", inputs, lambda: _news_grid_html(items, hrefs, eager))
+
+def _news_grid_html(items: list[dict], hrefs: list[str], eager: int) -> str:
+    cards = ['<div class="news-grid">']
+    cards.extend(news_card_html(item, href, i >= eager) for i, (item, href) in enumerate(zip(items, hrefs)))
+    cards.append("</div>")
+    return "\n".join(cards)
+
+def news_pager_html(shown: int, total: int, more_href: str | None) -> str:
+    more = f'<a class="button-primary" href="{more_href}">Carregar mais</a>' if more_href and shown < total else ""
+    return f'<div class="news-pager"><span class="news-count">Mostrando {shown} de {total}</span>{more}</div>'
+
+def article_html(item: dict, body: str | None, back_href: str = "./#newsroom") -> str:
+    """Página do artigo; `body` é o HTML já sanitizado na ingestão (sem ele, o resumo escapado)."""
+    body = body or f"<p>{html.escape(item['summary'])}</p>"
+    hero_src = news_thumbnail_src(item["image"])
+    hero = f"<div class='article-hero'><img src='{hero_src}' alt='hero'/></div>" if hero_src else ""
+    reading = f" · {item['reading_min']} min de leitura" if item.get("reading_min") else ""
+    return f"""
+    <div class="article-wrap">
+      {hero}
+      <div class="article-body">
+        <h2 class="article-title">{html.escape(item['title'])}</h2>
+        <div class="article-meta">{html.escape(item['date'])}{reading}</div>
+        <div class="article-text">{body}</div>
+        <div class="article-actions">
+          <a class="button-primary" href="{back_href}">Voltar</a>
+        </div>
+      </div>
+    </div>
+    """
+
+def backlink_html(back_href: str = "./#newsroom") -> str:
+    return f'<p><a class="backlink" href="{back_href}">← Voltar para a Newsroom</a></p>'
+
+def news_search_html(query: str = "") -> str:
+    """Formulário GET: o envio navega para ?q=... sem widget (nenhum rerun por digitação)."""
+    value = html.escape(query, quote=True)
+    return (
+        '<form class="news-search" method="get" action="#newsroom">'
+        f'<input type="search" name="q" value="{value}" placeholder="Buscar na newsroom" aria-label="Buscar na newsroom"/>'
+        '<button type="submit">Buscar</button></form>'
+    )
+
+def search_results_html(query: str, hits: list, items_by_slug: dict[str, dict]) -> str:
+    """Cards dos resultados (resumo trocado pelo trecho destacado) ou aviso de nenhum resultado."""
+    q = html.escape(query)
+    if not hits:
+        return f'<p class="news-count">Nenhum resultado para “{q}”.</p>'
+    items = [{**items_by_slug[h.slug], "summary_html": h.snippet} for h in hits if h.slug in items_by_slug]
+    return f'<p class="news-count">{len(items)} resultado(s) para “{q}”</p>' + news_grid_html(items, eager=NEWS_RESULTS_EAGER)
+
+# ================== CONTATO / RODAPÉ ==================
+def contact_card_html() -> str:
+    return f"""
+<div class="contact-card">
+  <h4>Informações de contato</h4>
+  <div class="contact-item"><strong>Endereço:</strong> {MAVIPE_ADDRESS}</div>
+  <div class="contact-item"><strong>E-mail:</strong> <a href="mailto:{MAVIPE_EMAIL}">{MAVIPE_EMAIL}</a></div>
+</div>
+"""
+
+FOOTER_TEXT = "© MAVIPE Space Systems · DAP ATLAS"
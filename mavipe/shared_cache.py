@@ -0,0 +1,255 @@
+# mavipe/shared_cache.py — cache em disco de assets codificados, compartilhado entre processos
+#
+# Várias réplicas do Streamlit na mesma máquina (ou num volume compartilhado) leem os mesmos
+# payloads já codificados (data URIs em base64) em vez de cada uma reler e recodificar a imagem:
+#   keys/<hash da chave>  -> digest do conteúdo   (chave = caminho|tamanho|mtime|formato)
+#   blobs/<digest>        -> payload codificado    (endereçado pelo conteúdo da fonte + formato)
+# O que se economiza é CPU e I/O de codificação, não memória: um data URI vai embutido no HTML
+# que st.markdown manda ao navegador, então cada processo precisa dele como str Python, e o blob
+# é lido (mmap) e copiado para o heap do processo uma vez. Servir direto do arquivo, sem cópia
+# por processo, é o modo padrão de URLs estáticas (mavipe/static_assets.py); este cache só cobre
+# o modo data URI. Como o blob é endereçado pelo conteúdo, a cópia nunca fica velha.
+# Escritas são atômicas (tmp + os.replace), então escritores concorrentes só se sobrescrevem com
+# o mesmo conteúdo. Acima de MAVIPE_SHARED_CACHE_BYTES os blobs menos usados saem (mtime,
+# renovado no máximo a cada TOUCH_INTERVAL_SEC por processo), junto com as chaves que apontavam
+# para eles; o total em disco é recontado a cada SIZE_TTL_SEC, porque outras réplicas também
+# escrevem.
+# Uso: python -m mavipe.shared_cache [--prune] [--clear]
+import hashlib
+import mmap
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: a poda roda sem trava entre processos
+    fcntl = None
+
+SHARED_CACHE_DIR = Path(os.environ.get("MAVIPE_SHARED_CACHE_DIR", ".cache/encoded"))
+# 0 desliga o cache em disco (volta ao LRU só em memória de mavipe/assets.py)
+SHARED_CACHE_MAX_BYTES = int(os.environ.get("MAVIPE_SHARED_CACHE_BYTES", 256 * 1024 * 1024))
+PRUNE_TARGET = 0.9  # a poda libera até 90% do limite, para não podar a cada escrita
+TOUCH_INTERVAL_SEC = 600  # granularidade do LRU: evita um utime por falta em memória
+SIZE_TTL_SEC = 60
+
+def _digest(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+class SharedBlobCache:
+    def __init__(self, root: Path = SHARED_CACHE_DIR, max_bytes: int = SHARED_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_bytes: int | None = None
+        self._approx_at = 0.0
+        self._touched: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.keys_removed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _key_path(self, key: str) -> Path:
+        h = _digest(key)
+        return self.root / "keys" / h[:2] / h
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap | None:
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def lookup(self, key: str) -> str | None:
+        """Digest do blob da chave, ou None (chave desconhecida ou blob podado)."""
+        if not self.enabled:
+            return None
+        try:
+            digest = self._key_path(key).read_text(encoding="ascii").strip()
+            if not digest:
+                raise OSError("chave vazia")
+            self._touch(digest)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return digest
+
+    def _touch(self, digest: str) -> None:
+        """Renova o mtime do blob (LRU entre processos), no máximo uma vez por TOUCH_INTERVAL_SEC
+        neste processo; fora disso a existência do blob só é conferida em read()."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._touched.get(digest)
+            if last is not None and now - last < TOUCH_INTERVAL_SEC:
+                return
+        os.utime(self._blob_path(digest))  # falha se o blob foi podado
+        with self._lock:
+            self._touched[digest] = now
+
+    def read(self, digest: str) -> bytes | None:
+        """Conteúdo do blob, copiado do mapeamento (que é fechado em seguida)."""
+        mapped = self._map(self._blob_path(digest))
+        if mapped is None:
+            return None
+        with mapped:
+            return mapped[:]
+
+    def content_blob(self, content_digest: str, fmt: str) -> str:
+        return _digest(f"{content_digest}|{fmt}")
+
+    def store(self, key: str, content_digest: str, fmt: str, produce) -> str | None:
+        """Associa a chave ao blob (conteúdo, formato) e devolve o digest do blob; só chama
+        `produce()` se o blob não existir (outra réplica pode já ter codificado o mesmo arquivo
+        com outro caminho/mtime)."""
+        if not self.enabled:
+            return None
+        blob_digest = self.content_blob(content_digest, fmt)
+        blob = self._blob_path(blob_digest)
+        try:
+            if not blob.exists():
+                payload = produce()
+                if len(payload) > self.max_bytes:
+                    return None
+                self._write_atomic(blob, payload)
+                with self._lock:
+                    self.stores += 1
+                    if self._approx_bytes is not None:
+                        self._approx_bytes += len(payload)
+            self._write_atomic(self._key_path(key), blob_digest.encode("ascii"))
+        except OSError:  # disco cheio/somente leitura: segue sem o cache
+            return None
+        if self._over_limit():
+            self.prune()
+        return blob_digest
+
+    def _blobs(self) -> list[tuple[float, int, Path]]:
+        out = []
+        for sub in (self.root / "blobs").glob("*/*"):
+            if sub.name.startswith("."):
+                continue
+            try:
+                st = sub.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, sub))
+        return out
+
+    def _over_limit(self) -> bool:
+        with self._lock:
+            stale = self._approx_bytes is None or time.monotonic() - self._approx_at > SIZE_TTL_SEC
+        if stale:  # recontagem fora da trava: outras réplicas também gravam blobs
+            total = sum(size for _, size, _ in self._blobs())
+            with self._lock:
+                self._approx_bytes, self._approx_at = total, time.monotonic()
+        with self._lock:
+            return self._approx_bytes > self.max_bytes
+
+    def _prune_keys(self) -> int:
+        """Remove as chaves cujo blob não existe mais (podado ou apagado)."""
+        removed = 0
+        for path in (self.root / "keys").glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                digest = path.read_text(encoding="ascii").strip()
+                if digest and self._blob_path(digest).exists():
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+    def prune(self, target: int | None = None) -> int:
+        """Remove os blobs menos usados até `target` bytes; devolve quantos saíram."""
+        target = int(self.max_bytes * PRUNE_TARGET) if target is None else target
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".prune.lock", "a+") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return 0  # outra réplica já está podando
+            blobs = sorted(self._blobs())
+            total = sum(size for _, size, _ in blobs)
+            removed = 0
+            for _, size, path in blobs:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self.keys_removed = self._prune_keys()
+        with self._lock:
+            self.evictions += removed
+            self._approx_bytes, self._approx_at = total, time.monotonic()
+            self._touched.clear()
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self._lock:
+            self._approx_bytes, self._approx_at = 0, time.monotonic()
+            self._touched.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "max_bytes": self.max_bytes,
+            }
+
+SHARED_CACHE = SharedBlobCache()
+
+def main(argv: list[str]) -> int:
+    if "--clear" in argv:
+        SHARED_CACHE.clear()
+        print(f"{SHARED_CACHE.root}/ apagado")
+        return 0
+    if "--prune" in argv:
+        blobs = SHARED_CACHE.prune()
+        print(f"{blobs} blob(s) e {SHARED_CACHE.keys_removed} chave(s) órfã(s) removido(s)")
+    blobs = SHARED_CACHE._blobs()
+    keys = sum(1 for _ in (SHARED_CACHE.root / "keys").glob("*/*"))
+    total = sum(size for _, size, _ in blobs)
+    print(f"{SHARED_CACHE.root}/: {len(blobs)} blob(s), {keys} chave(s), "
+          f"{total / 2**20:.1f} de {SHARED_CACHE.max_bytes / 2**20:.0f} MiB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,200 @@
+# mavipe/static_assets.py — manifesto de assets estáticos com nomes por hash de conteúdo
+#
+# Copia as imagens da landing para static/assets/<sha256>.<ext> (servidas pelo Streamlit em
+# app/static/ com server.enableStaticServing) e registra tudo em static/manifest.json.
+# Arquivos idênticos byte a byte viram a mesma URL. O handler estático do Streamlit não manda
+# Cache-Control de longa duração; com `streamlit run serve.py` o middleware daqui marca como
+# immutable tudo que tem hash no nome (assets, CSS, derivados, tiles).
+# Uso: python -m mavipe.static_assets
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX, AssetStat, as_data_uri
+
+STATIC_DIR = Path("static")
+ASSETS_SUBDIR = "assets"
+MANIFEST_PATH = STATIC_DIR / "manifest.json"
+STATIC_URL_PREFIX = os.environ.get("MAVIPE_STATIC_URL_PREFIX", "app/static/")
+# MAVIPE_STATIC_ASSETS=0 volta ao comportamento antigo (tudo inline em base64)
+STATIC_ASSETS_ENABLED = os.environ.get("MAVIPE_STATIC_ASSETS", "1") != "0"
+
+# subpastas de static/ cujos nomes levam o hash do conteúdo (os index.json não levam)
+IMMUTABLE_SUBDIRS = (ASSETS_SUBDIR, "css", "derived", "tiles")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".svg", ".webp")
+SOURCE_DIRS = (".", "icons")
+HASH_LEN = 16
+
+_lock = threading.Lock()
+_manifest: dict | None = None
+_verified: set[str] = set()  # cópias já confirmadas em disco neste processo
+
+def url_for(name: str) -> str:
+    return STATIC_URL_PREFIX + name
+
+@contextmanager
+def url_prefix(prefix: str):
+    """Troca temporariamente o prefixo das URLs (ex.: export estático com caminhos relativos)."""
+    global STATIC_URL_PREFIX
+    previous, STATIC_URL_PREFIX = STATIC_URL_PREFIX, prefix
+    try:
+        yield
+    finally:
+        STATIC_URL_PREFIX = previous
+
+def file_sha256(p: Path) -> str:
+    h = hashlib.sha256()
+    with open(p, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def source_key(path_str: str | Path) -> str:
+    return Path(path_str).as_posix().removeprefix("./")
+
+def discover_sources() -> list[Path]:
+    found = []
+    for d in SOURCE_DIRS:
+        base = Path(d)
+        if not base.is_dir():
+            continue
+        for p in sorted(base.iterdir()):
+            if p.suffix.lower() in IMAGE_EXTS and p.is_file() and p.stat().st_size > 0:
+                found.append(p)
+    return found
+
+def read_manifest() -> dict:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        if data.get("version") == 1:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": 1, "files": {}}
+
+def write_manifest(manifest: dict) -> None:
+    STATIC_DIR.mkdir(exist_ok=True)
+    tmp = MANIFEST_PATH.with_suffix(f".json.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, MANIFEST_PATH)
+
+def _entry_is_fresh(entry: dict | None, stat: AssetStat, check_target: bool = True) -> bool:
+    return (
+        entry is not None
+        and entry.get("size") == stat.size
+        and entry.get("mtime_ns") == stat.mtime_ns
+        and (not check_target or (STATIC_DIR / entry["name"]).exists())
+    )
+
+def publish(p: Path, manifest: dict) -> tuple[dict, bool]:
+    """Garante a cópia com hash de `p` em static/; retorna (entrada, mudou)."""
+    key = source_key(p)
+    st = p.stat()
+    stat = AssetStat(st.st_size, st.st_mtime_ns)
+    entry = manifest["files"].get(key)
+    if _entry_is_fresh(entry, stat):
+        return entry, False
+    digest = file_sha256(p)
+    name = f"{ASSETS_SUBDIR}/{digest[:HASH_LEN]}{p.suffix.lower()}"
+    target = STATIC_DIR / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(p, tmp)
+        os.replace(tmp, target)
+    entry = {"name": name, "sha256": digest, "size": stat.size, "mtime_ns": stat.mtime_ns}
+    manifest["files"][key] = entry
+    return entry, True
+
+def build_manifest(sources: list[Path] | None = None) -> dict:
+    manifest = read_manifest()
+    changed = False
+    for p in sources if sources is not None else discover_sources():
+        _, did_change = publish(p, manifest)
+        changed |= did_change
+    if changed or not MANIFEST_PATH.exists():
+        write_manifest(manifest)
+    return manifest
+
+def static_url(path_str: str | Path) -> str | None:
+    """URL com hash para o asset, publicando-o sob demanda se o manifesto estiver desatualizado."""
+    global _manifest
+    p = Path(path_str)
+    stat = ASSET_INDEX.stat(p)
+    if stat is None:
+        return None
+    key = source_key(p)
+    with _lock:
+        if _manifest is None:
+            _manifest = read_manifest()
+        entry = _manifest["files"].get(key)
+        if not _entry_is_fresh(entry, stat, check_target=entry is not None and entry["name"] not in _verified):
+            try:
+                entry, changed = publish(p, _manifest)
+                if changed:
+                    write_manifest(_manifest)
+            except OSError:
+                return None
+        _verified.add(entry["name"])
+    return url_for(entry["name"])
+
+def asset_url(path_str: str | Path) -> str:
+    """src para <img>: URL estática cacheável; data URI se o static estiver desligado/indisponível."""
+    if STATIC_ASSETS_ENABLED:
+        url = static_url(path_str)
+        if url:
+            return url
+    return as_data_uri(path_str)
+
+# ================== CACHE-CONTROL ==================
+def is_immutable_path(path: str) -> bool:
+    """True para /app/static/<subpasta com hash>/... (qualquer baseUrlPath antes), exceto .json."""
+    _, found, rest = path.partition("/app/static/")
+    return bool(found) and rest.split("/", 1)[0] in IMMUTABLE_SUBDIRS and not rest.endswith(".json")
+
+class ImmutableStaticMiddleware:
+    """Middleware ASGI: Cache-Control immutable nas respostas 200/304 de URLs com hash."""
+
+    def __init__(self, app, cache_control: str = IMMUTABLE_CACHE_CONTROL):
+        self.app = app
+        self.header = (b"cache-control", cache_control.encode("ascii"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not is_immutable_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache(message):
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                headers = [h for h in message.get("headers", []) if h[0].lower() != b"cache-control"]
+                message = {**message, "headers": [*headers, self.header]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache)
+
+def middleware() -> list:
+    """Para o st.App do serve.py."""
+    from starlette.middleware import Middleware
+
+    return [Middleware(ImmutableStaticMiddleware)]
+
+def main(argv: list[str]) -> int:
+    sources = [Path(a) for a in argv] or None
+    manifest = build_manifest(sources)
+    files = manifest["files"]
+    unique = {e["name"] for e in files.values()}
+    total = sum((STATIC_DIR / n).stat().st_size for n in unique)
+    print(f"{len(files)} assets -> {len(unique)} arquivos únicos ({total/1024:.0f} KiB) em {STATIC_DIR}/")
+    for key, e in sorted(files.items()):
+        print(f"  {key:32} {STATIC_URL_PREFIX}{e['name']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,81 @@
+# mavipe/stylesheet.py — CSS da landing num único arquivo minificado com hash de conteúdo
+#
+# Só CRITICAL_CSS (navbar + hero) vai inline; o resto vira static/css/site.<hash>.css, servido
+# pelo static serving e referenciado por um <link> — cada rerun envia ~100 bytes em vez de todo o
+# CSS, e o navegador baixa o arquivo uma única vez (o nome muda quando o conteúdo muda).
+# Uso: python -m mavipe.stylesheet (gera o arquivo antes do deploy)
+import hashlib
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+
+from mavipe.sections import CRITICAL_CSS, MAIN_CSS, PARTNERS_CSS, NEWSROOM_CSS, CONTACT_CSS, style_tag
+from mavipe.static_assets import HASH_LEN, STATIC_ASSETS_ENABLED, STATIC_DIR, url_for
+
+BUNDLE_PARTS = (MAIN_CSS, PARTNERS_CSS, NEWSROOM_CSS, CONTACT_CSS)
+CSS_SUBDIR = "css"
+
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+SPACE_RE = re.compile(r"\s+")
+# espaço antes de ":" é significativo em seletores ("a :hover"), então só é removido depois
+PUNCT_RE = re.compile(r"\s*([{};,>])\s*|:\s+")
+
+_lock = threading.Lock()
+_published: set[str] = set()  # bundles já confirmados em disco neste processo
+
+def minify_css(css: str) -> str:
+    css = SPACE_RE.sub(" ", COMMENT_RE.sub("", css))
+    css = PUNCT_RE.sub(lambda m: m.group(1) or ":", css)
+    return css.replace(";}", "}").strip()
+
+@lru_cache(maxsize=8)
+def bundle_css(parts: tuple[str, ...] = BUNDLE_PARTS) -> str:
+    return minify_css("\n".join(parts))
+
+@lru_cache(maxsize=8)
+def bundle_name(css: str) -> str:
+    return f"{CSS_SUBDIR}/site.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:HASH_LEN]}.css"
+
+def publish_bundle(css: str) -> str:
+    """Grava static/css/site.<hash>.css (escrita atômica) se ainda não existir; devolve o nome."""
+    name = bundle_name(css)
+    target = STATIC_DIR / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(css, encoding="utf-8")
+        os.replace(tmp, target)
+    return name
+
+def stylesheet_url() -> str | None:
+    css = bundle_css()
+    name = bundle_name(css)
+    with _lock:
+        if name not in _published:
+            try:
+                publish_bundle(css)
+            except OSError:
+                return None
+            _published.add(name)
+    return url_for(name)
+
+_CRITICAL_TAG = style_tag(minify_css(CRITICAL_CSS))
+
+def stylesheet_tags() -> str:
+    """<style> crítico inline + <link> para o bundle (ou o bundle inline se o static estiver desligado)."""
+    url = stylesheet_url() if STATIC_ASSETS_ENABLED else None
+    if url:
+        return f'{_CRITICAL_TAG}<link rel="stylesheet" href="{url}">'
+    return _CRITICAL_TAG + style_tag(bundle_css())
+
+def main(argv: list[str]) -> int:
+    css = bundle_css()
+    name = publish_bundle(css)
+    raw = len("\n".join(BUNDLE_PARTS).encode("utf-8"))
+    print(f"{STATIC_DIR / name}: {len(css.encode('utf-8'))} bytes (sem minificar: {raw})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
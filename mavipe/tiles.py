@@ -0,0 +1,200 @@
+# mavipe/tiles.py — pirâmide de tiles (deep zoom) para as capturas em alta resolução
+#
+# Cada fonte vira static/tiles/<hash>-<tile>/<z>/<x>_<y>.webp: o nível mais alto é a resolução
+# original, cada nível abaixo tem metade da largura/altura (arredondada para cima) e o nível 0
+# cabe num único tile (serve de prévia). O visualizador (mavipe/zoom.py) só busca os tiles
+# visíveis no nível do zoom atual. Como em mavipe/derivatives.py, o hash da fonte vai no nome e o
+# índice (static/tiles/index.json) evita regerar enquanto tamanho/mtime não mudarem. A rota
+# ?zoom= pede com wait=False: sem pirâmide pronta (aquecimento ainda não passou), o corte vai
+# para uma thread e a página mostra a imagem inteira até lá.
+# Uso: python -m mavipe.tiles [arquivos...]
+import json
+import math
+import os
+import sys
+import threading
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX
+from mavipe.derivatives import WEBP_QUALITY
+from mavipe.static_assets import STATIC_DIR, STATIC_ASSETS_ENABLED, HASH_LEN, file_sha256, source_key
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow ausente: sem pirâmide, a página de zoom mostra a imagem inteira
+    Image = None
+
+TILES_SUBDIR = "tiles"
+TILES_INDEX_PATH = STATIC_DIR / TILES_SUBDIR / "index.json"
+TILE_SIZE = 256
+TILE_FORMAT = "webp"
+RASTER_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+
+# fontes padrão para o pré-processamento via CLI (e para o aquecimento)
+TILE_SOURCES = ("solucao*.png", "solucao*.jpg", "dap_atlas*.png", "geoportal*.png", "geoportal*.jpg")
+
+# como em mavipe/derivatives.py: _lock só protege o índice; o corte roda fora dele, por fonte
+_lock = threading.Lock()
+_index: dict | None = None
+_verified: set[str] = set()
+_key_locks: dict[str, threading.Lock] = {}
+_pending: set[str] = set()  # fontes com corte agendado em segundo plano
+
+def read_index() -> dict:
+    try:
+        data = json.loads(TILES_INDEX_PATH.read_text(encoding="utf-8"))
+        if data.get("version") == 1:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": 1, "entries": {}}
+
+def write_index(index: dict) -> None:
+    TILES_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = TILES_INDEX_PATH.with_suffix(f".json.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, TILES_INDEX_PATH)
+
+def level_count(width: int, height: int, tile: int = TILE_SIZE) -> int:
+    """Níveis até o nível 0 caber num tile (1 se a fonte já cabe)."""
+    return max(0, math.ceil(math.log2(max(width, height) / tile))) + 1
+
+def level_size(entry: dict, z: int) -> tuple[int, int]:
+    k = 2 ** (entry["levels"] - 1 - z)
+    return math.ceil(entry["width"] / k), math.ceil(entry["height"] / k)
+
+def tile_name(entry: dict, z: int, x: int, y: int) -> str:
+    return f"{entry['dir']}/{z}/{x}_{y}.{entry['format']}"
+
+def _save_atomic(img, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    img.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+    os.replace(tmp, target)
+
+def generate(p: Path, digest: str) -> dict:
+    """Corta todos os níveis (do original para baixo, reduzindo à metade a cada passo)."""
+    name = f"{TILES_SUBDIR}/{digest[:HASH_LEN]}-{TILE_SIZE}"
+    with Image.open(p) as im:
+        im.load()
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "transparency" in im.info or im.mode in ("LA", "PA") else "RGB")
+        width, height = im.size
+        entry = {"dir": name, "width": width, "height": height, "tile": TILE_SIZE, "format": TILE_FORMAT,
+                 "levels": level_count(width, height)}
+        level = im
+        count = total = 0
+        for z in range(entry["levels"] - 1, -1, -1):
+            lw, lh = level.size
+            for ty in range(math.ceil(lh / TILE_SIZE)):
+                for tx in range(math.ceil(lw / TILE_SIZE)):
+                    target = STATIC_DIR / tile_name(entry, z, tx, ty)
+                    if not target.exists():
+                        box = (tx * TILE_SIZE, ty * TILE_SIZE, min(lw, (tx + 1) * TILE_SIZE), min(lh, (ty + 1) * TILE_SIZE))
+                        _save_atomic(level.crop(box), target)
+                    count += 1
+                    total += target.stat().st_size
+            if z:
+                level = level.resize((math.ceil(lw / 2), math.ceil(lh / 2)), Image.LANCZOS)
+    entry.update({"tiles": count, "bytes": total, "preview": tile_name(entry, 0, 0, 0)})
+    return entry
+
+def _current(entry: dict | None, stat) -> bool:
+    return (
+        entry is not None
+        and entry.get("size") == stat.size
+        and entry.get("mtime_ns") == stat.mtime_ns
+        and entry.get("tile") == TILE_SIZE
+    )
+
+def _indexed(key: str) -> dict | None:
+    global _index
+    with _lock:
+        if _index is None:
+            _index = read_index()
+        return _index["entries"].get(key)
+
+def _schedule(p: Path, key: str) -> None:
+    with _lock:
+        if key in _pending:
+            return
+        _pending.add(key)
+
+    def run():
+        try:
+            tiles_for(p)
+        finally:
+            with _lock:
+                _pending.discard(key)
+
+    threading.Thread(target=run, name=f"mavipe-tiles-{p.name}", daemon=True).start()
+
+def tiles_for(path_str: str | Path, wait: bool = True) -> dict | None:
+    """Metadados da pirâmide da fonte; gera o que faltar (incremental por hash).
+
+    wait=False nunca corta na hora: se a pirâmide não está pronta, agenda o corte numa thread e
+    devolve None (quem chama mostra a imagem inteira).
+    """
+    if Image is None or not STATIC_ASSETS_ENABLED:
+        return None
+    p = Path(path_str)
+    if p.suffix.lower() not in RASTER_EXTS:
+        return None
+    stat = ASSET_INDEX.stat(p)
+    if stat is None:
+        return None
+    key = source_key(p)
+    entry = _indexed(key)
+    if _current(entry, stat) and key in _verified:
+        return entry
+    if not wait:
+        if _current(entry, stat) and (STATIC_DIR / entry["preview"]).exists():
+            with _lock:
+                _verified.add(key)
+            return entry
+        _schedule(p, key)
+        return None
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        entry = _indexed(key)  # outra sessão pode ter gerado enquanto esperávamos
+        if _current(entry, stat) and (key in _verified or (STATIC_DIR / entry["preview"]).exists()):
+            with _lock:
+                _verified.add(key)
+            return entry
+        try:
+            digest = file_sha256(p)
+            if entry is None or entry.get("sha256") != digest or entry.get("tile") != TILE_SIZE:
+                entry = generate(p, digest)
+            entry = {**entry, "sha256": digest, "size": stat.size, "mtime_ns": stat.mtime_ns}
+        except (OSError, ValueError, SyntaxError):
+            return None
+        with _lock:
+            _index["entries"][key] = entry
+            _verified.add(key)
+            write_index(_index)
+        return entry
+
+def tiles_pending(path_str: str | Path) -> bool:
+    """True enquanto o corte agendado por tiles_for(..., wait=False) não terminou."""
+    with _lock:
+        return source_key(Path(path_str)) in _pending
+
+def tile_sources() -> list[str]:
+    seen = []
+    for pat in TILE_SOURCES:
+        seen += [name for name in ASSET_INDEX.glob(pat) if name not in seen]
+    return seen
+
+def main(argv: list[str]) -> int:
+    for name in argv or tile_sources():
+        t = tiles_for(name)
+        if t is None:
+            print(f"  {name}: ignorado")
+            continue
+        print(f"  {name} ({t['width']}x{t['height']}): {t['levels']} níveis, {t['tiles']} tiles, "
+              f"{t['bytes'] / 1024:.0f} KiB -> {STATIC_DIR}/{t['dir']}/")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,263 @@
+# mavipe/warmup.py — aquecimento do processo antes do 1º visitante + endpoints de prontidão
+#
+# Etapas (cada uma cronometrada): varredura de assets, ícone padrão, publicação dos estáticos,
+# derivados responsivos, pirâmides de tiles do deep zoom, bundle de CSS, ingestão da newsroom,
+# índice de busca, o HTML de todas as seções (landing e artigos) no cache de fragmentos e a
+# thread de envio do formulário de contato (leads que ficaram na fila do processo anterior).
+#
+# Em produção, `streamlit run serve.py` roda o aquecimento no lifespan do servidor, antes de
+# aceitar conexões, e expõe /api/ready (503 até terminar; JSON com o tempo de cada etapa e as
+# etapas que falharam, refeitas em segundo plano) e /api/health. Com `streamlit run app.py` o
+# app.py dispara o aquecimento em segundo plano no 1º rerun. Uso avulso (aquece o que fica em disco antes do deploy): python -m mavipe.warmup
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from mavipe.assets import ASSET_INDEX
+
+WARMUP_ENABLED = os.environ.get("MAVIPE_WARMUP", "1") != "0"
+# etapas que falharam são refeitas no próximo start_background depois deste intervalo
+WARMUP_RETRY_SEC = float(os.environ.get("MAVIPE_WARMUP_RETRY_SEC", "60"))
+
+class WarmupState:
+    """Status (pending/running/ready/degraded) e tempos por etapa.
+
+    Etapa quebrada não tira o processo do balanceador: o status vira `degraded` (pronto, com a
+    lista das etapas que falharam) e só essas etapas são refeitas, no máximo a cada
+    WARMUP_RETRY_SEC, até passarem.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self.status = "pending"
+        self.stages: list[dict] = []
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.retries = 0
+        self.process_started = time.time()
+
+    @property
+    def ready(self) -> bool:
+        return self.status in ("ready", "degraded")
+
+    def _retry_due(self) -> bool:
+        return self.status == "degraded" and time.time() - (self.finished_at or 0) >= WARMUP_RETRY_SEC
+
+    def _record(self, name: str, ms: float, error: str | None = None, detail=None) -> None:
+        rec = {"name": name, "ms": round(ms, 1), "ok": error is None}
+        if error:
+            rec["error"] = error
+        if detail is not None:
+            rec["detail"] = detail
+        with self._lock:
+            self.stages.append(rec)
+
+    def run(self, stages=None) -> "WarmupState":
+        """Roda as etapas (chamadas concorrentes esperam a primeira terminar); depois de
+        `degraded`, refaz só as que falharam quando o intervalo de retry venceu."""
+        with self._run_lock:
+            if self.status == "ready" or (self.status == "degraded" and not self._retry_due()):
+                return self
+            todo = list(stages or STAGES)
+            with self._lock:
+                if self.status == "degraded":  # segue pronto (degradado) durante o retry
+                    failed_names = {s["name"] for s in self.stages if not s["ok"]}
+                    todo = [st for st in todo if st[0] in failed_names]
+                    self.stages = [s for s in self.stages if s["ok"]]
+                    self.retries += 1
+                else:
+                    self.status = "running"
+                    self.started_at = time.time()
+                    self.stages = []
+            failed = False
+            for name, fn in todo:
+                t0 = time.perf_counter()
+                try:
+                    detail = fn()
+                except Exception as exc:  # uma etapa quebrada não impede o servidor de subir
+                    failed = True
+                    self._record(name, (time.perf_counter() - t0) * 1000, f"{type(exc).__name__}: {exc}")
+                    traceback.print_exc()
+                    continue
+                self._record(name, (time.perf_counter() - t0) * 1000, detail=detail)
+            with self._lock:
+                self.finished_at = time.time()
+                self.status = "degraded" if failed else "ready"
+            return self
+
+    def start_background(self) -> None:
+        """Aquecimento (ou retry das etapas falhas) numa thread; no-op se não há o que fazer."""
+        if not WARMUP_ENABLED or self._run_lock.locked():
+            return
+        if self.status != "pending" and not self._retry_due():
+            return
+        threading.Thread(target=self.run, name="mavipe-warmup", daemon=True).start()
+
+    def report(self) -> dict:
+        with self._lock:
+            total = (self.finished_at - self.started_at) * 1000 if self.finished_at and self.started_at else None
+            return {
+                "status": self.status,
+                "ready": self.status in ("ready", "degraded"),
+                "failed_stages": [s["name"] for s in self.stages if not s["ok"]],
+                "retries": self.retries,
+                "pid": os.getpid(),
+                "uptime_s": round(time.time() - self.process_started, 1),
+                "total_ms": round(total, 1) if total is not None else None,
+                "stages": list(self.stages),
+            }
+
+WARMUP = WarmupState()
+
+# ================== ETAPAS ==================
+def stage_assets():
+    ASSET_INDEX.refresh(force=True)
+    return {"files": len(ASSET_INDEX.snapshot())}
+
+def stage_icons():
+    from mavipe.content import ensure_default_icons
+
+    ensure_default_icons()
+
+def stage_static():
+    from mavipe.static_assets import STATIC_ASSETS_ENABLED, discover_sources, static_url
+
+    if not STATIC_ASSETS_ENABLED:
+        return {"skipped": "MAVIPE_STATIC_ASSETS=0"}
+    sources = discover_sources()
+    return {"published": sum(1 for p in sources if static_url(p))}
+
+def stage_derivatives():
+    from mavipe.derivatives import SLOT_SOURCES, derivatives_for
+
+    n = 0
+    for slot, patterns in SLOT_SOURCES.items():
+        for pat in patterns:
+            for name in ASSET_INDEX.glob(pat):
+                n += derivatives_for(name, slot) is not None
+    return {"entries": n}
+
+def stage_tiles():
+    from mavipe.tiles import tile_sources, tiles_for
+
+    return {"pyramids": sum(tiles_for(name) is not None for name in tile_sources())}
+
+def stage_css():
+    from mavipe.stylesheet import stylesheet_tags
+
+    return {"bytes": len(stylesheet_tags())}
+
+def stage_newsroom():
+    from mavipe.newsroom import NEWSROOM
+
+    NEWSROOM.ensure_fresh()
+    return {"articles": NEWSROOM.count()}
+
+def stage_search():
+    from mavipe.newsroom import NEWSROOM
+    from mavipe.search import SEARCH_INDEX
+
+    SEARCH_INDEX.sync(NEWSROOM)
+
+def stage_fragments():
+    """Mesmo HTML que o app.py monta (landing e cada artigo), já no cache de fragmentos."""
+    from mavipe.content import SOLUTIONS, gather_empresa_images
+    from mavipe.fragments import FRAGMENT_CACHE
+    from mavipe.newsroom import NEWSROOM
+    from mavipe.sections import (
+        article_html, contact_card_html, dap_atlas_html, empresa_frames, hero_html, navbar_html,
+        news_grid_html, news_search_html, partners_html, sector_grid_html, solution_image_html,
+        solution_text_html,
+    )
+
+    navbar_html("")
+    navbar_html("./")
+    hero_html()
+    if gather_empresa_images(max_n=2):
+        empresa_frames(0)
+    dap_atlas_html()
+    sector_grid_html()
+    for s in SOLUTIONS:
+        solution_image_html(s)
+        solution_text_html(s)
+    partners_html()
+    news_search_html()
+    news_grid_html(NEWSROOM.pages_upto(0), eager=0)
+    contact_card_html()
+    for item in NEWSROOM.listing():
+        article_html(item, NEWSROOM.body(item["slug"]))
+    return {"cached": sum(s["entries"] for s in FRAGMENT_CACHE.stats().values())}
+
+def stage_contact():
+    """Sobe a thread de envio já no início: leads pendentes ou em backoff não esperam um novo envio."""
+    from mavipe.contact_queue import CONTACT_QUEUE, ensure_worker
+
+    if not ensure_worker():
+        return {"skipped": "sem MAVIPE_SMTP_HOST"}
+    return {"pending": CONTACT_QUEUE.counts().get("pending", 0)}
+
+STAGES = (
+    ("assets", stage_assets),
+    ("icons", stage_icons),
+    ("static", stage_static),
+    ("derivatives", stage_derivatives),
+    ("tiles", stage_tiles),
+    ("css", stage_css),
+    ("newsroom", stage_newsroom),
+    ("search", stage_search),
+    ("fragments", stage_fragments),
+    ("contact", stage_contact),
+)
+# o CLI só aquece o que fica em disco: o processo sai logo, não há onde rodar a thread de envio
+CLI_STAGES = tuple(s for s in STAGES if s[0] != "contact")
+
+# ================== SERVIDOR (st.App) ==================
+@asynccontextmanager
+async def lifespan(app):
+    """Lifespan do st.App: o servidor só aceita conexões depois do aquecimento."""
+    import asyncio
+
+    if WARMUP_ENABLED:
+        await asyncio.to_thread(WARMUP.run)
+    yield {"warmup": WARMUP.report()}
+
+def routes() -> list:
+    """/api/ready (200 pronto ou degradado, 503 aquecendo) e /api/health (sempre 200).
+
+    A sondagem do balanceador também dispara o retry das etapas que falharam.
+    """
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def ready(request):
+        WARMUP.start_background()
+        report = WARMUP.report()
+        return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+    async def health(request):
+        report = WARMUP.report()
+        return JSONResponse({"status": "ok", "warmup": report["status"], "pid": report["pid"], "uptime_s": report["uptime_s"]})
+
+    return [Route("/api/ready", ready), Route("/api/health", health)]
+
+# ================== CLI ==================
+def main(argv: list[str]) -> int:
+    os.chdir(Path(__file__).resolve().parent.parent)
+    report = WARMUP.run(CLI_STAGES).report()
+    if "--json" in argv:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        for s in report["stages"]:
+            extra = s.get("error") or (json.dumps(s["detail"], ensure_ascii=False) if s.get("detail") else "")
+            print(f"  {s['name']:12} {s['ms']:>8.1f} ms  {'ok ' if s['ok'] else 'ERRO'} {extra}")
+        print(f"{report['status']} em {report['total_ms']:.0f} ms")
+    return 0 if report["status"] == "ready" else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,215 @@
+# mavipe/zoom.py — visualizador deep zoom sobre a pirâmide de tiles de mavipe/tiles.py
+#
+# Abre com o nível 0 (um tile só, esticado) como prévia e busca apenas os tiles visíveis no nível
+# que o zoom atual pede (roda do mouse, pinça, arrastar, duplo clique, +/−). Tiles de outros
+# níveis ficam por baixo até os novos carregarem e saem depois. Como o carrossel, tudo roda no
+# navegador: no app.py vai num st.iframe, no export direto na página.
+import html
+import json
+
+from mavipe.static_assets import url_for
+
+ZOOM_HEIGHT = 640  # altura do st.iframe na rota ?zoom=
+MAX_SCALE = 2  # até 2 px de tela por px da fonte
+
+ZOOM_DOC_CSS = """
+html, body{margin:0; padding:0; height:100%; background:transparent; font-family:"Source Sans Pro", sans-serif;}
+.zoom-viewer{height:100vh}
+"""
+
+ZOOM_CSS = """
+.zoom-viewer{position:relative; overflow:hidden; width:100%; height:78vh; background:#05080f; border-radius:12px;
+  touch-action:none; cursor:grab; user-select:none; outline:none}
+.zoom-viewer.dragging{cursor:grabbing}
+.zoom-viewer img{position:absolute; max-width:none; pointer-events:none; -webkit-user-drag:none}
+.zoom-preview{z-index:0}
+.zoom-controls{position:absolute; right:10px; top:10px; z-index:3; display:flex; flex-direction:column; gap:6px}
+.zoom-controls button{width:34px; height:34px; background:rgba(8,16,33,.75); color:#e6eefc; font-size:1.1rem;
+  border:1px solid rgba(255,255,255,.2); border-radius:8px; cursor:pointer}
+.zoom-controls button:hover{border-color:#34d399; color:#34d399}
+.zoom-hint{position:absolute; left:10px; bottom:8px; z-index:3; color:#9fb0d4; font-size:.8rem;
+  background:rgba(8,16,33,.6); padding:2px 8px; border-radius:6px}
+"""
+
+ZOOM_JS = """
+(function(){
+  const cfg = JSON.parse(document.getElementById("zoom-cfg").textContent);
+  const view = document.getElementById("zoom-view");
+  const preview = view.querySelector(".zoom-preview");
+  const tiles = new Map();  // "z/x_y" -> <img>
+  const dpr = window.devicePixelRatio || 1;
+  let scale = 1, minScale = 1, x = 0, y = 0, vw = 0, vh = 0, frame = 0;
+
+  function levelSize(z){
+    const k = 2 ** (cfg.levels - 1 - z);
+    return [Math.ceil(cfg.width / k), Math.ceil(cfg.height / k), k];
+  }
+  function clamp(){
+    const w = cfg.width * scale, h = cfg.height * scale;
+    x = w <= vw ? (vw - w) / 2 : Math.min(0, Math.max(vw - w, x));
+    y = h <= vh ? (vh - h) / 2 : Math.min(0, Math.max(vh - h, y));
+  }
+  function place(img, left, top, w, h){
+    img.style.left = left + "px"; img.style.top = top + "px";
+    img.style.width = w + "px"; img.style.height = h + "px";
+  }
+  function render(){
+    frame = 0;
+    clamp();
+    place(preview, x, y, cfg.width * scale, cfg.height * scale);
+    // menor nível com ~1 px da fonte por px físico da tela (aceita até 20% abaixo: sem isso,
+    // logo acima de uma potência de 2 o nível escolhido teria quase o dobro da resolução)
+    const wanted = cfg.levels - 1 - Math.floor(Math.log2(1 / (scale * dpr)) + Math.log2(1 / 0.8));
+    const z = Math.max(0, Math.min(cfg.levels - 1, wanted));
+    const [lw, lh, k] = levelSize(z);
+    const step = cfg.tile * k * scale;  // px de tela por tile
+    const x0 = Math.max(0, Math.floor(-x / step)), x1 = Math.min(Math.ceil(lw / cfg.tile), Math.ceil((vw - x) / step));
+    const y0 = Math.max(0, Math.floor(-y / step)), y1 = Math.min(Math.ceil(lh / cfg.tile), Math.ceil((vh - y) / step));
+    const needed = new Set();
+    let pending = 0;
+    for (let ty = y0; ty < y1; ty++) {
+      for (let tx = x0; tx < x1; tx++) {
+        const key = z + "/" + tx + "_" + ty;
+        needed.add(key);
+        let img = tiles.get(key);
+        if (!img) {
+          img = new Image();
+          img.alt = "";
+          img.decoding = "async";
+          img.style.zIndex = 1 + z;
+          img.onload = () => { img.dataset.loaded = "1"; schedule(); };
+          img.src = cfg.base + key + "." + cfg.format;
+          tiles.set(key, img);
+          view.appendChild(img);
+        }
+        if (!img.dataset.loaded) pending++;
+        const tw = Math.min(cfg.tile, lw - tx * cfg.tile), th = Math.min(cfg.tile, lh - ty * cfg.tile);
+        place(img, x + tx * step, y + ty * step, tw * k * scale, th * k * scale);
+      }
+    }
+    // fora da tela sai já; outros níveis ficam de fundo até o nível atual terminar de carregar
+    for (const [key, img] of tiles) {
+      if (needed.has(key)) continue;
+      const [tz, rest] = key.split("/");
+      const [tx, ty] = rest.split("_").map(Number);
+      const tstep = cfg.tile * levelSize(Number(tz))[2] * scale;
+      const left = x + tx * tstep, top = y + ty * tstep;
+      const visible = left < vw && top < vh && left + tstep > 0 && top + tstep > 0;
+      if (Number(tz) === z || pending === 0 || !visible || !img.dataset.loaded) {
+        img.remove();
+        tiles.delete(key);
+        continue;
+      }
+      place(img, left, top, img.naturalWidth * tstep / cfg.tile, img.naturalHeight * tstep / cfg.tile);
+    }
+  }
+  function schedule(){ if (!frame) frame = requestAnimationFrame(render); }
+  function measure(){
+    const r = view.getBoundingClientRect();
+    vw = r.width; vh = r.height;
+    minScale = Math.min(1, vw / cfg.width, vh / cfg.height);
+  }
+  function fit(){ measure(); scale = minScale; x = (vw - cfg.width * scale) / 2; y = (vh - cfg.height * scale) / 2; schedule(); }
+  function zoomAt(px, py, factor){
+    const s = Math.max(minScale, Math.min(cfg.maxScale, scale * factor));
+    x = px - (px - x) * s / scale;
+    y = py - (py - y) * s / scale;
+    scale = s;
+    schedule();
+  }
+  function local(e){ const r = view.getBoundingClientRect(); return [e.clientX - r.left, e.clientY - r.top]; }
+
+  view.addEventListener("wheel", (e) => {
+    e.preventDefault();
+    const [px, py] = local(e);
+    zoomAt(px, py, Math.exp(-e.deltaY * (e.deltaMode ? 0.05 : 0.0015)));
+  }, {passive: false});
+  view.addEventListener("dblclick", (e) => { const [px, py] = local(e); zoomAt(px, py, e.shiftKey ? 0.5 : 2); });
+
+  const pointers = new Map();
+  let pinch = 0;
+  view.addEventListener("pointerdown", (e) => {
+    if (e.target.closest("button")) return;
+    view.setPointerCapture(e.pointerId);
+    pointers.set(e.pointerId, local(e));
+    view.classList.add("dragging");
+  });
+  view.addEventListener("pointermove", (e) => {
+    const prev = pointers.get(e.pointerId);
+    if (!prev) return;
+    const cur = local(e);
+    pointers.set(e.pointerId, cur);
+    if (pointers.size === 1) {
+      x += cur[0] - prev[0]; y += cur[1] - prev[1];
+      schedule();
+    } else if (pointers.size === 2) {
+      const [a, b] = Array.from(pointers.values());
+      const dist = Math.hypot(a[0] - b[0], a[1] - b[1]);
+      if (pinch) zoomAt((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, dist / pinch);
+      pinch = dist;
+    }
+  });
+  const release = (e) => {
+    pointers.delete(e.pointerId);
+    pinch = 0;
+    if (!pointers.size) view.classList.remove("dragging");
+  };
+  view.addEventListener("pointerup", release);
+  view.addEventListener("pointercancel", release);
+
+  view.querySelectorAll("[data-zoom]").forEach((b) => b.addEventListener("click", () => {
+    const act = b.dataset.zoom;
+    if (act === "fit") fit(); else zoomAt(vw / 2, vh / 2, act === "in" ? 2 : 0.5);
+  }));
+  view.addEventListener("keydown", (e) => {
+    const moves = {ArrowLeft: [60, 0], ArrowRight: [-60, 0], ArrowUp: [0, 60], ArrowDown: [0, -60]};
+    if (e.key === "+" || e.key === "=") zoomAt(vw / 2, vh / 2, 1.5);
+    else if (e.key === "-") zoomAt(vw / 2, vh / 2, 1 / 1.5);
+    else if (e.key === "0") fit();
+    else if (moves[e.key]) { x += moves[e.key][0]; y += moves[e.key][1]; schedule(); }
+    else return;
+    e.preventDefault();
+  });
+  new ResizeObserver(() => {
+    const atFit = scale <= minScale;
+    measure();
+    if (atFit) fit(); else { scale = Math.max(scale, minScale); schedule(); }
+  }).observe(view);
+  fit();
+})();
+"""
+
+def zoom_config(entry: dict) -> dict:
+    return {
+        "base": url_for(entry["dir"]) + "/",
+        "width": entry["width"],
+        "height": entry["height"],
+        "tile": entry["tile"],
+        "levels": entry["levels"],
+        "format": entry["format"],
+        "maxScale": MAX_SCALE,
+    }
+
+def zoom_viewer_markup(entry: dict, alt: str) -> str:
+    """Visualizador (prévia + controles) com config em JSON e o JS; CSS em ZOOM_CSS."""
+    cfg = json.dumps(zoom_config(entry)).replace("</", "<\\/")
+    alt_attr = html.escape(alt, quote=True)
+    return f"""<div class="zoom-viewer" id="zoom-view" tabindex="0" role="img" aria-label="{alt_attr}">
+  <img class="zoom-preview" src="{url_for(entry['preview'])}" alt="{alt_attr}"/>
+  <div class="zoom-controls">
+    <button type="button" data-zoom="in" aria-label="Ampliar">+</button>
+    <button type="button" data-zoom="out" aria-label="Reduzir">−</button>
+    <button type="button" data-zoom="fit" aria-label="Ajustar à tela">⤢</button>
+  </div>
+  <div class="zoom-hint">Role, pince ou dê duplo clique para ampliar · arraste para mover</div>
+</div>
+<script type="application/json" id="zoom-cfg">{cfg}</script>
+<script>{ZOOM_JS}</script>"""
+
+def zoom_viewer_html(entry: dict, alt: str) -> str:
+    """Documento completo para o st.iframe do Streamlit (HTML inline, não URL)."""
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><style>{ZOOM_CSS}{ZOOM_DOC_CSS}</style></head>
+<body>
+{zoom_viewer_markup(entry, alt)}
+</body></html>"""
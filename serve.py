@@ -0,0 +1,17 @@
+# serve.py — entrada de produção: `streamlit run serve.py` (ou `uvicorn serve:app`)
+#
+# Mesmo app.py, mas o processo aquece assets, CSS, newsroom e fragmentos antes de aceitar
+# conexões (mavipe/warmup.py), expõe /api/ready e /api/health para o balanceador e /metrics no
+# formato do Prometheus (mavipe/metrics.py; só com token ou allow-list, ou numa porta própria) e
+# serve os estáticos com hash no nome com Cache-Control immutable (mavipe/static_assets.py).
+import streamlit as st
+
+from mavipe.metrics import routes as metrics_routes, start_exporter
+from mavipe.static_assets import middleware as static_middleware
+from mavipe.warmup import lifespan, routes
+
+start_exporter()  # MAVIPE_METRICS_PORT: já no início, antes da 1ª sessão
+app = st.App("app.py", lifespan=lifespan, routes=routes() + metrics_routes(), middleware=static_middleware())
+
+if __name__ == "__main__":
+    app.run()
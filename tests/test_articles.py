@@ -0,0 +1,62 @@
+from mavipe import articles
+from mavipe.assets import AssetIndex
+from mavipe.sections import article_html, news_card_html
+
+SOURCE = """---
+title: <script>alert(1)</script> Lançamento
+date: 2025-08-26 <b>x</b>
+image: news1.png
+---
+**26/08/2025**
+
+O satélite entrou em operação e já envia imagens &lt;img src=x onerror=alert(1)&gt; para a plataforma.
+"""
+
+def ingest_one(tmp_path, monkeypatch, text: str) -> dict:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "articles").mkdir()
+    (tmp_path / "articles" / "lancamento.md").write_text(text, encoding="utf-8")
+    monkeypatch.setattr(articles, "ASSET_INDEX", AssetIndex(dirs=("articles",), ttl=0))
+    _, changed = articles.ingest()
+    assert changed == ["lancamento"]
+    return articles.read_artifact("lancamento")
+
+def test_metadata_is_escaped_in_card_and_article(tmp_path, monkeypatch):
+    art = ingest_one(tmp_path, monkeypatch, SOURCE)
+    # o resumo fica como texto puro (entidades decodificadas); o escape é do template
+    assert "<img src=x onerror=alert(1)>" in art["summary"]
+
+    card = news_card_html(art, "?news=lancamento")
+    page = article_html(art, art["html"])
+    for out in (card, page):
+        assert "<script" not in out
+        assert "<img src=x" not in out
+        assert "<b>x</b>" not in out
+        assert "&lt;script&gt;alert(1)&lt;/script&gt; Lançamento" in out
+    assert "&lt;img src=x onerror=alert(1)&gt;" in card
+    assert "&lt;img src=x onerror=alert(1)&gt;" in page  # corpo sanitizado re-escapa o texto
+
+def test_article_without_body_falls_back_to_escaped_summary(tmp_path, monkeypatch):
+    art = ingest_one(tmp_path, monkeypatch, SOURCE.replace("title:", "summary: <script>x</script>\ntitle:"))
+    page = article_html(art, None)
+    assert "<script" not in page
+    assert "<p>&lt;script&gt;x&lt;/script&gt;</p>" in page
+
+def test_search_snippet_markup_is_kept():
+    item = {"title": "T", "date": "", "summary": "<i>cru</i>", "summary_html": "a <mark>b</mark>", "image": "news1.png"}
+    card = news_card_html(item, "#")
+    assert "a <mark>b</mark>" in card
+    assert "<i>cru</i>" not in card
+
+def test_article_without_cover_image_renders(tmp_path, monkeypatch):
+    from mavipe.export import article_fingerprint
+    from mavipe.sections import news_grid_html
+
+    text = SOURCE.replace("image: news1.png\n", "")
+    art = ingest_one(tmp_path, monkeypatch, text)
+    assert art["image"] is None
+    card = news_card_html(art, "?news=lancamento")
+    assert "news-thumb" in card and "<img" not in card
+    assert "news-grid" in news_grid_html([art])
+    assert "article-hero" not in article_html(art, art["html"])
+    assert article_fingerprint(art, art["html"], "css", "v")
@@ -0,0 +1,113 @@
+import os
+
+from mavipe import assets
+from mavipe.assets import AssetIndex, DataUriCache
+from mavipe.shared_cache import SharedBlobCache
+
+def overwrite_in_place(path, data: bytes) -> None:
+    """Reescreve o arquivo (mesmo inode) sem tocar o mtime do diretório."""
+    parent = path.parent.stat()
+    st = path.stat()
+    with open(path, "r+b") as f:
+        f.write(data)
+        f.truncate()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    os.utime(path.parent, ns=(parent.st_atime_ns, parent.st_mtime_ns))
+
+def test_index_sees_file_overwritten_in_place(tmp_path):
+    img = tmp_path / "logo.png"
+    img.write_bytes(b"old")
+    index = AssetIndex(dirs=(str(tmp_path),), ttl=0)
+    before = index.stat(img)
+    generation = index.generation
+
+    overwrite_in_place(img, b"new bytes")
+    assert os.stat(tmp_path).st_mtime_ns == index._dir_mtimes[str(tmp_path)]
+    after = index.stat(img)
+    assert after == (9, img.stat().st_mtime_ns)
+    assert after != before
+    assert index.generation > generation
+    assert index.scans == 1  # re-stat, sem revarrer o diretório
+
+def test_data_uri_reencoded_after_overwrite_in_place(tmp_path, monkeypatch):
+    img = tmp_path / "logo.png"
+    img.write_bytes(b"old")
+    monkeypatch.setattr(assets, "ASSET_INDEX", AssetIndex(dirs=(str(tmp_path),), ttl=0))
+    for shared in (SharedBlobCache(tmp_path / "cache", max_bytes=0), SharedBlobCache(tmp_path / "cache")):
+        cache = DataUriCache(shared=shared)
+        img.write_bytes(b"old")
+        assert cache.get(img) == assets.data_uri_from_bytes(b"old", "image/png")
+        overwrite_in_place(img, b"new")
+        assert cache.get(img) == assets.data_uri_from_bytes(b"new", "image/png")
+        assert cache.stats()["entries"] == 1
+
+def test_shared_blob_is_read_once_per_process(tmp_path, monkeypatch):
+    img = tmp_path / "logo.png"
+    img.write_bytes(b"png bytes")
+    copy = tmp_path / "copia.png"
+    copy.write_bytes(b"png bytes")
+    monkeypatch.setattr(assets, "ASSET_INDEX", AssetIndex(dirs=(str(tmp_path),), ttl=0))
+    shared = SharedBlobCache(tmp_path / "cache")
+    expected = assets.data_uri_from_bytes(b"png bytes", "image/png")
+
+    first = DataUriCache(shared=shared)  # a réplica que codifica e publica o blob
+    assert first.get(img) == expected
+    assert first.stats()["encoded_bytes"] == len(expected)
+
+    reads = []
+    monkeypatch.setattr(shared, "read", lambda digest, read=shared.read: reads.append(digest) or read(digest))
+    other = DataUriCache(shared=shared)  # outro processo: lê o blob, não recodifica
+    uri = other.get(img)
+    assert uri == expected and len(reads) == 1
+    assert other.stats()["encoded_bytes"] == 0
+    for _ in range(3):
+        assert other.get(img) is uri  # acerto: nenhuma leitura nem cópia
+    assert other.get(copy) is uri  # mesmo conteúdo: mesmo blob, mesma string
+    assert len(reads) == 1
+    assert other.stats()["bytes"] == len(expected)
+
+def test_shared_cache_throttles_touch_and_prunes_orphan_keys(tmp_path, monkeypatch):
+    from mavipe import shared_cache
+
+    cache = SharedBlobCache(tmp_path / "cache", max_bytes=100)
+    digest = cache.store("a|1|1|datauri", "conteudo-a", "datauri", lambda: b"x" * 60)
+    touches = []
+    monkeypatch.setattr(shared_cache.os, "utime", lambda path: touches.append(path))
+    for _ in range(5):
+        assert cache.lookup("a|1|1|datauri") == digest
+    assert len(touches) == 1  # um utime por TOUCH_INTERVAL_SEC, não um por falta em memória
+    monkeypatch.undo()
+
+    # outra réplica grava um blob: sem recontar, esta ainda acharia que está abaixo do limite
+    SharedBlobCache(tmp_path / "cache", max_bytes=100).store("b|1|1|datauri", "conteudo-b", "datauri", lambda: b"y" * 30)
+    monkeypatch.setattr(shared_cache, "SIZE_TTL_SEC", 0)
+    cache.store("c|1|1|datauri", "conteudo-c", "datauri", lambda: b"z" * 20)
+    assert cache.evictions == 1 and cache.keys_removed == 1
+    assert cache.lookup("a|1|1|datauri") is None  # a chave do blob podado também saiu
+    assert len(list((tmp_path / "cache" / "keys").glob("*/*"))) == 2
+
+def test_hashed_static_urls_get_immutable_cache_control():
+    import asyncio
+
+    from mavipe.static_assets import IMMUTABLE_CACHE_CONTROL, ImmutableStaticMiddleware
+
+    async def static_handler(scope, receive, send):
+        status = 404 if "falta" in scope["path"] else 200
+        await send({"type": "http.response.start", "status": status, "headers": [(b"cache-control", b"no-cache")]})
+        await send({"type": "http.response.body", "body": b""})
+
+    def headers_for(path: str) -> dict:
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        app = ImmutableStaticMiddleware(static_handler)
+        asyncio.run(app({"type": "http", "path": path}, None, send))
+        return dict(sent[0]["headers"])
+
+    assert headers_for("/app/static/assets/0123abcd.png")[b"cache-control"] == IMMUTABLE_CACHE_CONTROL.encode()
+    assert headers_for("/mavipe/app/static/tiles/ab-256/3/1_2.webp")[b"cache-control"] == IMMUTABLE_CACHE_CONTROL.encode()
+    assert headers_for("/app/static/tiles/index.json")[b"cache-control"] == b"no-cache"
+    assert headers_for("/app/static/manifest.json")[b"cache-control"] == b"no-cache"
+    assert headers_for("/app/static/assets/falta.png")[b"cache-control"] == b"no-cache"
@@ -0,0 +1,117 @@
+import threading
+from email import message_from_bytes
+
+import pytest
+
+from mavipe import contact_queue
+from mavipe.contact_queue import ContactQueue, StandInSMTP, backoff, deliver_batch, drain
+
+LEAD = {"nome": "Ana", "email": "ana@example.com", "org": "MAVIPE", "phone": "", "msg": "Metano offshore"}
+
+@pytest.fixture
+def smtp(tmp_path):
+    servers = []
+
+    def start(fail_every: int = 0) -> StandInSMTP:
+        server = StandInSMTP(0, tmp_path / "eml", fail_every)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture
+def queue(tmp_path):
+    return ContactQueue(tmp_path / "queue.sqlite3")
+
+def row(queue: ContactQueue, lead_id: int) -> tuple:
+    return queue.conn().execute(
+        "SELECT status, attempts, next_attempt, last_error FROM leads WHERE id=?", (lead_id,)
+    ).fetchone()
+
+def test_enqueue_then_deliver(queue, smtp):
+    server = smtp()
+    ids = [queue.enqueue(LEAD), queue.enqueue({**LEAD, "nome": "Bruno"})]
+    assert queue.counts() == {"pending": 2}
+
+    assert drain(queue, "127.0.0.1", server.server_address[1]) == (2, 0)
+    assert queue.counts() == {"sent": 2}
+    assert [row(queue, i)[0] for i in ids] == ["sent", "sent"]
+    files = sorted(server.out_dir.glob("*.eml"))
+    assert len(files) == 2
+    msg = message_from_bytes(files[0].read_bytes())
+    assert msg["Reply-To"] == "ana@example.com"
+    assert "Metano offshore" in msg.get_payload()
+
+def test_failure_is_rescheduled_with_backoff(queue, smtp, monkeypatch):
+    server = smtp(fail_every=1)  # 451 em todo MAIL FROM
+    monkeypatch.setattr(contact_queue.random, "uniform", lambda a, b: 1.0)
+    lead_id = queue.enqueue(LEAD)
+
+    assert deliver_batch(queue, "127.0.0.1", server.server_address[1]) == (0, 1)
+    status, attempts, next_attempt, error = row(queue, lead_id)
+    assert (status, attempts) == ("pending", 1)
+    assert "451" in error
+    assert next_attempt > contact_queue.time.time() + contact_queue.BACKOFF_BASE_SEC - 5
+    # ainda em backoff: nada a reservar
+    assert queue.claim() == []
+    assert deliver_batch(queue, "127.0.0.1", server.server_address[1]) == (0, 0)
+
+def test_backoff_grows_and_is_capped(monkeypatch):
+    monkeypatch.setattr(contact_queue.random, "uniform", lambda a, b: 1.0)
+    delays = [backoff(n) for n in range(1, 12)]
+    assert delays[:3] == [30, 60, 120]
+    assert max(delays) == contact_queue.BACKOFF_MAX_SEC
+
+def test_dead_letter_after_max_attempts(queue, smtp, monkeypatch):
+    server = smtp(fail_every=1)
+    monkeypatch.setattr(contact_queue, "backoff", lambda attempts: -1)  # vence na hora
+    lead_id = queue.enqueue(LEAD)
+
+    for n in range(1, contact_queue.MAX_ATTEMPTS + 1):
+        assert deliver_batch(queue, "127.0.0.1", server.server_address[1]) == (0, 1)
+        assert row(queue, lead_id)[1] == n
+    assert row(queue, lead_id)[0] == "failed"
+    assert queue.counts() == {"failed": 1}
+    assert deliver_batch(queue, "127.0.0.1", server.server_address[1]) == (0, 0)
+
+def test_unreachable_server_counts_an_attempt(queue, smtp):
+    server = smtp()
+    port = server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    lead_id = queue.enqueue(LEAD)
+
+    assert deliver_batch(queue, "127.0.0.1", port) == (0, 1)
+    status, attempts, _, error = row(queue, lead_id)
+    assert (status, attempts) == ("pending", 1)
+    assert error.startswith("conexão:")
+
+def test_form_keeps_fields_on_error_and_clears_after_enqueue(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from streamlit.testing.v1 import AppTest
+
+    queue = ContactQueue(tmp_path / "form.sqlite3")
+    monkeypatch.setattr(contact_queue, "CONTACT_QUEUE", queue)
+    monkeypatch.setattr(contact_queue, "SMTP_HOST", "")
+    at = AppTest.from_file(str(Path(__file__).parent.parent / "app.py"), default_timeout=120)
+    at.run()
+
+    at.text_input(key="contact_nome").set_value("Ana")
+    at.text_input(key="contact_email").set_value("ana-sem-arroba")
+    at.button(key="contact_send").click().run()
+    assert at.warning and at.text_input(key="contact_nome").value == "Ana"
+    assert queue.counts().get("pending", 0) == 0
+
+    at.text_input(key="contact_email").set_value("ana@example.com")
+    at.text_area(key="contact_msg").set_value("Metano offshore")
+    at.button(key="contact_send").click().run()
+    assert not at.exception
+    assert queue.counts()["pending"] == 1
+    assert at.text_input(key="contact_nome").value == "" and at.text_area(key="contact_msg").value == ""
+    # sem SMTP não promete resposta: aponta o e-mail de contato
+    assert not at.success and contact_queue.MAVIPE_EMAIL in at.info[0].value
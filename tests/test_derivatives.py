@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+from mavipe import derivatives
+from mavipe.assets import AssetIndex
+
+pytestmark = pytest.mark.skipif(derivatives.Image is None, reason="sem Pillow")
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(derivatives, "STATIC_ASSETS_ENABLED", True)
+    monkeypatch.setattr(derivatives, "DERIVED_INDEX_PATH", tmp_path / "derived" / "index.json")
+    monkeypatch.setattr(derivatives, "ASSET_INDEX", AssetIndex(dirs=(str(tmp_path),), ttl=0))
+    monkeypatch.setattr(derivatives, "_index", None)
+    monkeypatch.setattr(derivatives, "_verified", set())
+    monkeypatch.setattr(derivatives, "_key_locks", {})
+    for name in ("lenta.png", "pronta.png", "nova.png"):
+        (tmp_path / name).write_bytes(name.encode())
+    return tmp_path
+
+def test_slow_encode_does_not_block_other_lookups(isolated, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fake_generate(p, slot, digest):
+        calls.append(p.name)
+        if p.name == "lenta.png":
+            started.set()
+            assert release.wait(10)
+        return {"width": 1, "height": 1, "variants": [], "color": "#000", "lqip": "", "opaque": True}
+
+    monkeypatch.setattr(derivatives, "generate", fake_generate)
+    ready = derivatives.derivatives_for(isolated / "pronta.png", "hero")
+    assert ready is not None
+
+    slow = [threading.Thread(target=derivatives.derivatives_for, args=(isolated / "lenta.png", "hero")) for _ in range(2)]
+    for t in slow:
+        t.start()
+    assert started.wait(10)
+
+    others = {}
+    def lookups():
+        others["hit"] = derivatives.derivatives_for(isolated / "pronta.png", "hero")
+        others["miss"] = derivatives.derivatives_for(isolated / "nova.png", "hero")
+    t = threading.Thread(target=lookups)
+    t.start()
+    t.join(5)
+    blocked = t.is_alive()
+    release.set()
+    for th in (t, *slow):
+        th.join(10)
+
+    assert not blocked, "consulta travada pelo encode de outra fonte"
+    assert others["hit"] == ready
+    assert others["miss"] is not None
+    assert calls.count("lenta.png") == 1  # a 2ª sessão esperou a 1ª e reaproveitou o resultado
@@ -0,0 +1,41 @@
+from mavipe import hero
+from mavipe.assets import AssetIndex
+
+def use_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(hero, "ASSET_INDEX", AssetIndex(dirs=(".",), ttl=0))
+
+def test_facade_without_poster_falls_back_to_embed(monkeypatch, tmp_path):
+    use_dir(monkeypatch, tmp_path)
+    out = hero.hero_media_html("facade")
+    assert out == f'<iframe src="{hero.EMBED_URL}" {hero.IFRAME_ATTRS}></iframe>'
+
+def test_facade_with_poster_defers_the_embed(monkeypatch, tmp_path):
+    use_dir(monkeypatch, tmp_path)
+    monkeypatch.setattr(hero, "responsive_img", lambda name, *a, **kw: f"<img src='{name}'/>")
+    (tmp_path / "hero_poster.jpg").write_bytes(b"\xff\xd8 poster")
+    out = hero.hero_media_html("facade")
+    assert out.startswith("<iframe srcdoc=")
+    assert "hero_poster.jpg" in out
+    assert "hero-cfg" in out
+    assert f'src="{hero.EMBED_URL}"' not in out
+
+def test_poster_mode_never_loads_the_embed(monkeypatch, tmp_path):
+    use_dir(monkeypatch, tmp_path)
+    out = hero.hero_media_html("poster")
+    assert "srcdoc" in out
+    assert "hero-cfg" not in out
+
+def test_repo_ships_a_poster_so_facade_is_the_default():
+    assert hero.pick_poster_path() is not None
+    assert hero.hero_media_html(hero.hero_mode()).startswith("<iframe srcdoc=")
+
+def test_derive_poster_crops_the_local_source(monkeypatch, tmp_path):
+    from PIL import Image
+
+    use_dir(monkeypatch, tmp_path)
+    Image.new("RGB", (200, 100), "navy").save(tmp_path / "mapa.png")
+    assert hero.derive_poster("mapa.png", (0.5, 0.0, 1.0, 0.5))
+    with Image.open(tmp_path / "hero_poster.jpg") as im:
+        assert (im.format, im.size) == ("JPEG", (100, 50))
+    assert not hero.derive_poster("nao-existe.png")
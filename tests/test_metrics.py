@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from mavipe import metrics
+
+pytest.importorskip("starlette")
+from starlette.requests import Request  # noqa: E402
+
+def get(monkeypatch, token="", allow=(), headers=None, client="127.0.0.1"):
+    """Chama o handler de /metrics direto (sem servidor) com o IP e os headers dados."""
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", token)
+    monkeypatch.setattr(metrics, "METRICS_ALLOW", tuple(allow))
+    (route,) = metrics.routes()
+    scope = {
+        "type": "http", "method": "GET", "path": "/metrics", "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": (client, 40000),
+    }
+    return asyncio.run(route.endpoint(Request(scope)))
+
+def test_public_metrics_off_without_token_or_allow_list(monkeypatch):
+    assert get(monkeypatch).status_code == 404
+
+def test_public_metrics_require_token(monkeypatch):
+    assert get(monkeypatch, token="s3gredo", allow=("0.0.0.0/0",)).status_code == 403
+    assert get(monkeypatch, token="s3gredo", headers={"Authorization": "Bearer errado"}).status_code == 403
+    r = get(monkeypatch, token="s3gredo", headers={"Authorization": "Bearer s3gredo"})
+    assert r.status_code == 200
+    assert b"mavipe_reruns_total" in r.body
+
+def test_public_metrics_allow_list(monkeypatch):
+    assert get(monkeypatch, allow=("10.0.0.0/8",), client="203.0.113.9").status_code == 403
+    assert get(monkeypatch, allow=("10.0.0.0/8", "inválido"), client="10.1.2.3").status_code == 200
+    assert get(monkeypatch, allow=("::1",), client="::1").status_code == 200
+
+def test_sessions_gauge_absent_when_private_api_changes(monkeypatch):
+    from streamlit.runtime import Runtime
+
+    monkeypatch.setattr(Runtime, "exists", staticmethod(lambda: True))
+    monkeypatch.setattr(Runtime, "instance", staticmethod(lambda: object()))
+    assert metrics._sessions() == []
+    assert "mavipe_active_sessions" not in metrics.render()
+
+def test_exporter_moves_to_next_free_port(monkeypatch, caplog):
+    import socket
+    import urllib.request
+
+    busy = socket.socket()
+    busy.bind(("127.0.0.1", 0))
+    busy.listen()
+    port = busy.getsockname()[1]
+    monkeypatch.setattr(metrics, "_exporter", None)
+    try:
+        assert metrics.start_exporter(port, span=1) is None  # só a porta ocupada: avisa e segue
+        assert "não exportadas" in caplog.text
+        server = metrics.start_exporter(port, span=8)  # outro worker já usa `port`
+    finally:
+        busy.close()
+    try:
+        assert server is not None and server.server_address[1] != port
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as r:
+            assert b"mavipe_reruns_total" in r.read()
+    finally:
+        server.shutdown()
+        server.server_close()
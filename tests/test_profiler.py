@@ -0,0 +1,42 @@
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from mavipe import profiler
+
+class FakeCtx:
+    def __init__(self):
+        self.sent = []
+
+    def enqueue(self, msg):
+        self.sent.append(msg)
+
+def markdown_msg(body: str) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = body
+    return msg
+
+def test_profile_counts_only_its_own_session_and_detaches(monkeypatch):
+    monkeypatch.setattr(profiler, "observe_render", lambda rec: None)
+    ctx, other = FakeCtx(), FakeCtx()
+    perf = profiler.RenderProfile(True, "landing", "load", session="s1", ctx=ctx, log=False)
+    perf.mark("HERO")
+    msg = markdown_msg("<div>hero</div>")
+    ctx.enqueue(msg)
+    other.enqueue(markdown_msg("x" * 500))  # outra sessão: não passa pelo perfil
+    button = ForwardMsg()
+    button.delta.new_element.button.label = "Enviar"
+    ctx.enqueue(button)  # widgets não contam
+    perf.finish()
+
+    assert ctx.sent[0] is msg and len(ctx.sent) == 2  # a mensagem segue intacta
+    (section,) = perf.sections
+    assert section["markdown_bytes"] == msg.ByteSize() and section["html_bytes"] == 0
+    assert "enqueue" not in vars(ctx)  # o gancho sai no fim do rerun
+
+def test_trigger_state_lives_outside_session_state():
+    state = {"contact_nome": ""}
+    assert profiler.detect_trigger("t1", state, {}) == "load"
+    profiler.remember_state("t1", state, {})
+    assert profiler.detect_trigger("t1", state, {}) == "rerun"
+    assert profiler.detect_trigger("t1", {"contact_nome": "Ana"}, {}) == "widget:contact_nome"
+    assert profiler.detect_trigger("t1", state, {"thumb": "1"}) == "query_param"
+    assert list(state) == ["contact_nome"]
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from mavipe import tiles
+from mavipe.assets import AssetIndex
+
+pytestmark = pytest.mark.skipif(tiles.Image is None, reason="sem Pillow")
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiles, "STATIC_ASSETS_ENABLED", True)
+    monkeypatch.setattr(tiles, "STATIC_DIR", tmp_path / "static")
+    monkeypatch.setattr(tiles, "TILES_INDEX_PATH", tmp_path / "static" / "tiles" / "index.json")
+    monkeypatch.setattr(tiles, "ASSET_INDEX", AssetIndex(dirs=(str(tmp_path),), ttl=0))
+    monkeypatch.setattr(tiles, "_index", None)
+    monkeypatch.setattr(tiles, "_verified", set())
+    monkeypatch.setattr(tiles, "_key_locks", {})
+    monkeypatch.setattr(tiles, "_pending", set())
+    (tmp_path / "mapa.png").write_bytes(b"png")
+    return tmp_path
+
+def test_zoom_request_never_cuts_the_pyramid_inline(isolated, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fake_generate(p, digest):
+        calls.append(p.name)
+        started.set()
+        assert release.wait(10)
+        preview = isolated / "static" / "tiles" / "mapa" / "0" / "0_0.webp"
+        preview.parent.mkdir(parents=True, exist_ok=True)
+        preview.write_bytes(b"tile")
+        return {"tile": tiles.TILE_SIZE, "preview": "tiles/mapa/0/0_0.webp"}
+
+    monkeypatch.setattr(tiles, "generate", fake_generate)
+    src = isolated / "mapa.png"
+    assert tiles.tiles_for(src, wait=False) is None  # volta na hora, com o corte numa thread
+    assert started.wait(10) and tiles.tiles_pending(src)
+    assert tiles.tiles_for(src, wait=False) is None
+    release.set()
+    deadline = time.monotonic() + 10
+    while tiles.tiles_pending(src) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert calls == ["mapa.png"]  # um corte só, mesmo com dois pedidos
+    assert tiles.tiles_for(src, wait=False)["preview"] == "tiles/mapa/0/0_0.webp"
@@ -0,0 +1,42 @@
+from mavipe import warmup
+from mavipe.warmup import WarmupState
+
+def test_failed_stage_degrades_then_is_retried(monkeypatch):
+    calls = {"ok": 0, "flaky": 0}
+
+    def ok():
+        calls["ok"] += 1
+
+    def flaky():
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise OSError("disco cheio")
+
+    stages = (("ok", ok), ("flaky", flaky))
+    state = WarmupState()
+    state.run(stages)
+    report = state.report()
+    assert report["status"] == "degraded"
+    assert report["ready"]  # /api/ready responde 200
+    assert report["failed_stages"] == ["flaky"]
+
+    # dentro do intervalo de retry: nada roda
+    monkeypatch.setattr(warmup, "WARMUP_RETRY_SEC", 3600)
+    state.run(stages)
+    assert calls == {"ok": 1, "flaky": 1}
+
+    # intervalo vencido: só a etapa que falhou é refeita
+    monkeypatch.setattr(warmup, "WARMUP_RETRY_SEC", 0)
+    state.run(stages)
+    report = state.report()
+    assert calls == {"ok": 1, "flaky": 2}
+    assert report["status"] == "ready"
+    assert report["failed_stages"] == []
+    assert report["retries"] == 1
+    assert [s["name"] for s in report["stages"]] == ["ok", "flaky"]
+
+def test_pending_and_running_are_not_ready():
+    state = WarmupState()
+    assert not state.report()["ready"]
+    state.status = "running"
+    assert not state.report()["ready"]